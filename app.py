@@ -2,18 +2,46 @@
 
 import streamlit as st 
 from streamlit_option_menu import option_menu
-import pandas as pd
-import numpy as np
-import seaborn as sns 
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px 
-from home import home
-from survey import SurveyMatcher
-from edu import EduMatcher
-from work import JobMatcher
-from board import BoardApp
-from insight import insight
+
+# 페이지 모듈과 그래프 라이브러리는 해당 메뉴를 선택했을 때 처음 불러옵니다.
+# 한 번 불러온 모듈은 sys.modules에 남으므로 이후 재실행에서는 다시 불러오지 않습니다.
+def show_home():
+    from home import home
+    home()
+
+def show_survey():
+    from survey import SurveyMatcher
+    survey=SurveyMatcher()
+    survey.run_survey()
+
+def show_insight():
+    from insight import insight
+    insight()
+
+def show_edu():
+    from edu import EduMatcher
+    edu=EduMatcher()
+    edu.app_interface()
+
+def show_work():
+    from work import JobMatcher
+    work=JobMatcher()
+    work.app_interface()
+
+def show_board():
+    from board import BoardApp
+    board=BoardApp()
+    board.run()
+
+# 메뉴 이름별 페이지 함수
+PAGES = {
+    'Main': show_home,
+    '직업추천': show_survey,
+    '취업시장 동향(Beta)': show_insight,
+    '교육매칭': show_edu,
+    '공고매칭': show_work,
+    '커뮤니티': show_board,
+}
  
 def main():
     '''
@@ -26,11 +54,11 @@ def main():
     - 공고매칭 : 사용자가 희망하는 직업에 맞는 공고를 매칭합니다.
     - 커뮤니티 : 사용자가 게시판에서 소통할 수 있는 공간을 제공합니다.
     
-    선택된 메뉴에 따라 해당하는 기능을 실행합니다.
+    선택된 메뉴에 따라 해당하는 기능을 실행합니다. 페이지 모듈은 선택되었을 때 불러옵니다.
     '''
     
     with st.sidebar:
-        choice = option_menu("Menu", ["Main", "직업추천", '취업시장 동향(Beta)',"교육매칭","공고매칭","커뮤니티"],
+        choice = option_menu("Menu", list(PAGES),
                             icons=['house', 'bi bi-search','bi bi-book-fill','bi bi-stack-overflow' ,'bi bi-person-badge-fill','bi bi-people-fill'],
                             menu_icon="app-indicator", default_index=0,
                             styles={
@@ -41,31 +69,8 @@ def main():
         }                  
         )
     
-    if choice=='Main':
-        home()
-        
-    if choice=='직업추천':
-        survey=SurveyMatcher()
-        survey.run_survey()
-        
-    if choice=='교육매칭':
-        edu=EduMatcher()
-        edu.app_interface()
-        
-    if choice=='공고매칭':
-        work=JobMatcher()
-        work.app_interface()
-        
-                      
-    if choice=='커뮤니티':
-        board=BoardApp()
-        board.run()
-        
-    if choice=='취업시장 동향(Beta)':
-        insight()
-        
-    
-    
+    # 선택된 페이지의 모듈만 불러와 실행
+    PAGES[choice]()
         
 if __name__=='__main__':
     main()
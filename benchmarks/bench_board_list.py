@@ -0,0 +1,76 @@
+'''
+댓글 수를 포함한 게시글 목록 한 페이지의 조회 시간을 비교하는 벤치마크.
+
+기존 방식(목록 조회 후 게시글마다 인덱스 없는 comments.post_id로 COUNT(*) 하는 N+1 조회)과
+BoardApp.list_posts()(트리거로 유지되는 posts.comment_count를 한 번의 조회로 읽음)를 비교합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_board_list [--posts 1000 10000 100000] [--comments 5] [--repeat 20]
+'''
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from board import BoardApp
+
+
+def fill_legacy(db_path, n_posts, n_comments):
+    '''
+    기존 스키마(comment_count 열과 comments.post_id 인덱스가 없음)로 게시글과 댓글을 추가합니다.
+    '''
+    rng = random.Random(0)
+    conn = sqlite3.connect(db_path)
+    conn.execute('CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT, content TEXT, likes INTEGER DEFAULT 0)')
+    conn.execute('CREATE TABLE comments (id INTEGER PRIMARY KEY, post_id INTEGER, content TEXT, likes INTEGER DEFAULT 0)')
+    conn.executemany('INSERT INTO posts (title, content) VALUES (?, ?)',
+                     ((f'제목 {i}', '내용') for i in range(n_posts)))
+    conn.executemany('INSERT INTO comments (post_id, content) VALUES (?, ?)',
+                     ((rng.randint(1, n_posts), '댓글') for _ in range(n_posts * n_comments)))
+    conn.commit()
+    return conn
+
+
+def legacy_page(conn, page_size):
+    '''
+    기존 BoardApp의 방식대로 목록을 읽고 게시글마다 get_comment_count()를 호출합니다.
+    '''
+    posts = conn.execute('SELECT id, title FROM posts ORDER BY id DESC LIMIT ?', (page_size,)).fetchall()
+    return [(post_id, title, conn.execute('SELECT COUNT(*) FROM comments WHERE post_id=?', (post_id,)).fetchone()[0])
+            for post_id, title in posts]
+
+
+def time_ms(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posts', type=int, nargs='+', default=[1000, 10000, 100000], help='게시글 수 목록')
+    parser.add_argument('--comments', type=int, default=5, help='게시글당 평균 댓글 수')
+    parser.add_argument('--repeat', type=int, default=20, help='반복 횟수')
+    args = parser.parse_args()
+
+    print(f'{"posts":>8}{"legacy N+1(ms)":>16}{"list_posts(ms)":>16}')
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_posts in args.posts:
+            db_path = os.path.join(tmp, f'board_{n_posts}.db')
+            conn = fill_legacy(db_path, n_posts, args.comments)
+            legacy_ms, expected = time_ms(lambda: legacy_page(conn, BoardApp.page_size), args.repeat)
+            conn.close()
+
+            # 기존 DB를 열면 comment_count 열과 인덱스가 추가되고 댓글 수가 채워짐
+            app = BoardApp(db_path)
+            new_ms, result = time_ms(lambda: app.list_posts(), args.repeat)
+            assert result == expected
+            app.db.close()
+            print(f'{n_posts:>8}{legacy_ms:>16.2f}{new_ms:>16.3f}')
+
+
+if __name__ == '__main__':
+    main()
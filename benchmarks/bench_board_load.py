@@ -0,0 +1,109 @@
+'''
+커뮤니티 게시판 DB 접근의 부하 테스트.
+
+N개의 글쓰기 스레드와 M개의 읽기 스레드가 동시에 게시판을 사용할 때의 작업별 지연시간(p50/p99)을 측정합니다.
+Streamlit rerun과 같이 작업마다 BoardApp을 새로 만드는 상황을 가정하여,
+기존 방식(매번 새 연결 + 테이블 초기화 + 동기 commit)과 ConnectionManager 방식을 비교합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_board_load [--posters 4] [--readers 16] [--ops 200]
+'''
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from board import BoardApp
+
+
+class LegacyBoard:
+    '''
+    기존 BoardApp의 DB 접근 방식(인스턴스마다 새 연결과 공유 커서, 작업마다 commit).
+    '''
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=5)
+        self.c = self.conn.cursor()
+        self.c.execute('CREATE TABLE IF NOT EXISTS posts (id INTEGER PRIMARY KEY, title TEXT, content TEXT, likes INTEGER DEFAULT 0)')
+        self.c.execute('CREATE TABLE IF NOT EXISTS comments (id INTEGER PRIMARY KEY, post_id INTEGER, content TEXT, likes INTEGER DEFAULT 0)')
+        self.conn.commit()
+
+    def add_post(self, title, content):
+        self.c.execute('INSERT INTO posts (title, content) VALUES (?, ?)', (title, content))
+        self.conn.commit()
+
+    def list_posts(self):
+        return self.c.execute('SELECT id, title FROM posts ORDER BY id DESC LIMIT 20').fetchall()
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] * 1000
+
+
+def run_load(make_app, add_post, list_posts, n_posters, n_readers, n_ops):
+    '''
+    글쓰기/읽기 스레드를 동시에 실행하고 작업별 지연시간 목록과 오류 수를 반환합니다.
+    '''
+    latencies = {'post': [], 'read': []}
+    errors = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(n_posters + n_readers)
+
+    def worker(kind, worker_id):
+        barrier.wait()
+        local = []
+        for i in range(n_ops):
+            start = time.perf_counter()
+            try:
+                app = make_app()
+                if kind == 'post':
+                    add_post(app, f'제목 {worker_id}-{i}', '내용 ' * 50)
+                else:
+                    list_posts(app)
+            except sqlite3.Error as error:
+                with lock:
+                    errors.append(error)
+                continue
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies[kind].extend(local)
+
+    threads = [threading.Thread(target=worker, args=('post', i)) for i in range(n_posters)]
+    threads += [threading.Thread(target=worker, args=('read', i)) for i in range(n_readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posters', type=int, default=4, help='동시 글쓰기 스레드 수')
+    parser.add_argument('--readers', type=int, default=16, help='동시 읽기 스레드 수')
+    parser.add_argument('--ops', type=int, default=200, help='스레드당 작업 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, 'legacy.db')
+        pooled_path = os.path.join(tmp, 'pooled.db')
+        runs = {
+            'legacy': run_load(lambda: LegacyBoard(legacy_path), LegacyBoard.add_post, LegacyBoard.list_posts,
+                               args.posters, args.readers, args.ops),
+            'pooled': run_load(lambda: BoardApp(pooled_path), BoardApp.add_post,
+                               lambda app: app.db.read('SELECT id, title FROM posts ORDER BY id DESC LIMIT 20'),
+                               args.posters, args.readers, args.ops),
+        }
+
+    print(f'{args.posters} posters, {args.readers} readers, {args.ops} ops each')
+    print(f'{"mode":<8}{"op":<6}{"p50(ms)":>10}{"p99(ms)":>10}{"errors":>8}')
+    for mode, (latencies, errors) in runs.items():
+        for kind, values in latencies.items():
+            if values:
+                print(f'{mode:<8}{kind:<6}{percentile(values, 0.5):>10.2f}{percentile(values, 0.99):>10.2f}{len(errors):>8}')
+
+
+if __name__ == '__main__':
+    main()
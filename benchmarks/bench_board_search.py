@@ -0,0 +1,115 @@
+'''
+커뮤니티 게시판 검색 지연시간을 비교하는 벤치마크.
+
+합성 게시글/댓글을 N개 넣은 뒤, 기존 방식(제목 LIKE '%키워드%' 전체 스캔)과
+BoardApp.search_posts()(FTS5 trigram 인덱스 + BM25 정렬)의 첫 페이지와 --deep-page번째 페이지 검색 시간을 비교합니다.
+깊은 페이지는 이전 페이지 마지막 결과의 (점수, ID) 커서로 읽습니다. 일치하는 결과가 그보다 적으면 '-'로 표시합니다.
+2글자 키워드는 trigram 인덱스를 쓸 수 없어 search_posts()도 LIKE로 검색합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_board_search [--posts 10000 100000 300000] [--repeat 20] [--deep-page 20]
+'''
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from board import BoardApp
+
+
+def make_vocabulary(n_words, seed=0):
+    '''
+    2~4음절의 합성 한글 단어 n_words개를 만듭니다. 앞쪽 단어일수록 자주 쓰입니다(Zipf 분포).
+    '''
+    rng = random.Random(seed)
+    vocabulary = set()
+    while len(vocabulary) < n_words:
+        vocabulary.add(''.join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(2, 4))))
+    vocabulary = sorted(vocabulary)
+    rng.shuffle(vocabulary)
+    return vocabulary
+
+
+VOCABULARY = make_vocabulary(5000)
+WEIGHTS = [1 / rank for rank in range(1, len(VOCABULARY) + 1)]
+
+
+def pick_keyword(rank, min_length=3):
+    '''
+    빈도 순위가 rank 이후인 단어 중 min_length 글자 이상인 첫 단어를 반환합니다.
+    '''
+    return next(word for word in VOCABULARY[rank:] if len(word) >= min_length)
+
+
+# 흔한 단어, 중간 빈도 단어, 드문 단어, 두 단어 구문, 2글자 단어(LIKE 검색)
+KEYWORDS = [pick_keyword(2), pick_keyword(100), pick_keyword(2000),
+            f'{VOCABULARY[30]} {VOCABULARY[31]}', next(word for word in VOCABULARY[100:] if len(word) == 2)]
+
+
+def make_text(rng, n_words):
+    return ' '.join(rng.choices(VOCABULARY, WEIGHTS, k=n_words))
+
+
+def fill_board(app, n_posts, seed=0):
+    '''
+    게시글 n_posts개와 게시글당 평균 2개의 댓글을 한 트랜잭션으로 추가합니다. 검색 인덱스는 트리거로 함께 채워집니다.
+    '''
+    rng = random.Random(seed)
+    with app.db.write() as conn:
+        conn.executemany('INSERT INTO posts (title, content) VALUES (?, ?)',
+                         ((make_text(rng, 4), make_text(rng, 40)) for _ in range(n_posts)))
+        conn.executemany('INSERT INTO comments (post_id, content) VALUES (?, ?)',
+                         ((rng.randint(1, n_posts), make_text(rng, 10)) for _ in range(n_posts * 2)))
+
+
+def legacy_search(app, keyword):
+    '''
+    기존 BoardApp.search_posts()와 같은 방식의 검색.
+    '''
+    return app.db.read('SELECT id, title FROM posts WHERE title LIKE ?', ('%' + keyword + '%',))
+
+
+def page_cursor(app, keyword, page):
+    '''
+    page번째 페이지(1부터)를 읽기 위한 커서를 첫 페이지부터 차례로 넘기며 찾습니다. 결과가 모자라면 None을 반환합니다.
+    '''
+    after = None
+    for _ in range(page - 1):
+        posts = app.search_posts(keyword, after)
+        if len(posts) < app.page_size:
+            return None
+        after = (posts[-1][3], posts[-1][0])
+    return after
+
+
+def time_ms(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posts', type=int, nargs='+', default=[10000, 100000, 300000], help='게시글 수 목록')
+    parser.add_argument('--repeat', type=int, default=20, help='키워드별 반복 횟수')
+    parser.add_argument('--deep-page', type=int, default=20, help='깊은 페이지 번호')
+    args = parser.parse_args()
+
+    print(f'{"posts":>8}  {"keyword":<12}{"legacy LIKE(ms)":>16}{"fts5 page(ms)":>15}{f"page {args.deep_page}(ms)":>15}')
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_posts in args.posts:
+            app = BoardApp(os.path.join(tmp, f'board_{n_posts}.db'))
+            fill_board(app, n_posts)
+            for keyword in KEYWORDS:
+                legacy_ms = time_ms(lambda: legacy_search(app, keyword), args.repeat)
+                fts_ms = time_ms(lambda: app.search_posts(keyword), args.repeat)
+                after = page_cursor(app, keyword, args.deep_page)
+                deep = f'{time_ms(lambda: app.search_posts(keyword, after), args.repeat):.2f}' if after else '-'
+                print(f'{n_posts:>8}  {keyword:<12}{legacy_ms:>16.2f}{fts_ms:>15.2f}{deep:>15}')
+            app.db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+'''
+크롤링 엔진의 전체 수집 시간을 비교하는 벤치마크.
+
+로컬 FixtureServer가 워크넷 목록 페이지를 흉내 낸 합성 페이지를 응답 지연과 함께 제공하고,
+기존 방식(한 페이지씩 순서대로 수집)과 CrawlEngine(작업 스레드 풀 + 호스트별 요청 간격 제한)의 수집 시간을 비교합니다.
+체크포인트로 중단된 수집을 이어서 실행하는 경우도 확인합니다.
+
+측정 전에 저장해 둔 워크넷 목록 페이지(fixtures/worknet_listing.html)를 FixtureServer로 제공하고
+crawling_works.crawl_positions(fetch_mode='http')로 수집하여 fixtures/worknet_listing.json의 기대 공고와 같은지 확인합니다.
+처음 몇 번은 실패하는 fetch로 CrawlEngine의 재시도와, 재시도 횟수를 넘긴 작업이 failures에 남는 것도 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_crawl_engine [--pages 100] [--delay 0.2] [--workers 8] [--interval 0.02]
+'''
+import argparse
+import collections
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+from benchmarks.bench_worknet_parser import FIXTURE_HTML, load_fixture
+from crawl_engine import CrawlEngine, FixtureServer, http_fetch
+from crawling_works import crawl_positions
+from page_parser import parse_worknet_listing
+
+
+def write_fixtures(directory, codes, rows_per_page=10):
+    '''
+    직업 코드별로 채용 공고 rows_per_page개가 있는 합성 목록 페이지를 만듭니다.
+    '''
+    os.makedirs(os.path.join(directory, 'works'), exist_ok=True)
+    for code in codes:
+        rows = ''.join(f'<tr id="list{i}"><td></td><td><a>회사 {code}-{i}</a></td>'
+                       f'<td><div><div><a href="/detail/{code}/{i}">공고 {i}</a></div></div></td></tr>'
+                       for i in range(1, rows_per_page + 1))
+        with open(os.path.join(directory, 'works', f'{code}.html'), 'w', encoding='utf-8') as f:
+            f.write(f'<html><body><table>{rows}</table></body></html>')
+
+
+def parse(code, html):
+    return [{'work_code_original': code, 'rows': html.count('<tr ')}]
+
+
+class FlakyFetch:
+    '''
+    URL마다 처음 fail_count번은 예외를 발생시키고, 그다음부터 fetch(url)의 결과를 반환하는 fetch 대역.
+
+    속성 :
+        fetch(callable) : 실제로 페이지를 가져올 함수
+        fail_count(int) : URL마다 실패시킬 횟수
+        attempts(Counter) : URL별 호출 횟수
+    '''
+    def __init__(self, fetch, fail_count):
+        self.fetch = fetch
+        self.fail_count = fail_count
+        self.lock = threading.Lock()
+        self.attempts = collections.Counter()
+
+    def __call__(self, url):
+        with self.lock:
+            self.attempts[url] += 1
+            attempt = self.attempts[url]
+        if attempt <= self.fail_count:
+            raise ConnectionError(f'{url}: 재시도 확인용 실패 ({attempt}/{self.fail_count})')
+        return self.fetch(url)
+
+
+def check_worknet_fixture():
+    '''
+    저장해 둔 워크넷 목록 페이지를 FixtureServer로 제공하여 실제 수집 경로의 결과를 확인합니다.
+
+    URL_WORK_1/URL_WORK_2를 서버 주소로 바꿔 crawl_positions(fetch_mode='http')로 수집한 공고가 기대 공고와 같은지,
+    max_retries번까지 실패하는 fetch도 재시도 끝에 같은 공고를 얻는지,
+    그보다 많이 실패하면 작업이 failures에 남는지 확인합니다.
+
+    반환값 :
+        row_count(int) : 확인한 공고 수
+    '''
+    _, page_url, expected = load_fixture()
+    origin = '{0.scheme}://{0.netloc}'.format(urlparse(page_url))
+
+    def parse(code, html):
+        return parse_worknet_listing(html, base_url=page_url)
+
+    with FixtureServer(os.path.dirname(FIXTURE_HTML)) as server:
+        # 실제 주소와 같은 URL_WORK_1{직업 코드}URL_WORK_2 형식. 서버는 쿼리 문자열을 무시하고 파일을 그대로 제공
+        os.environ['URL_WORK_1'] = f'{server.url}/{os.path.basename(FIXTURE_HTML)}?occupation='
+        os.environ['URL_WORK_2'] = '&resultCnt=10&pageIndex=1'
+        postings = crawl_positions(['084'], fetch_mode='http', min_interval=0, jitter=0)
+        assert (postings['work_code_original'] == '084').all()
+        rows = postings.drop(columns='work_code_original').to_dict('records')
+        # 상대 링크는 요청한 페이지 주소 기준으로 바뀌므로 워크넷 주소로 되돌려 비교
+        for row in rows:
+            row['link'] = row['link'].replace(server.url, origin, 1)
+        assert rows == expected
+
+        url = f'{server.url}/{os.path.basename(FIXTURE_HTML)}'
+        flaky = FlakyFetch(http_fetch, fail_count=2)
+        engine = CrawlEngine(flaky, parse, min_interval=0, max_retries=2, backoff=0.01)
+        assert engine.run([('084', url)]) == {'084': expected} and not engine.failures
+        assert flaky.attempts[url] == 3
+
+        flaky = FlakyFetch(http_fetch, fail_count=3)
+        engine = CrawlEngine(flaky, parse, min_interval=0, max_retries=2, backoff=0.01)
+        assert engine.run([('084', url)]) == {} and isinstance(engine.failures['084'], ConnectionError)
+        assert flaky.attempts[url] == 3
+    return len(expected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=100, help='수집할 페이지 수')
+    parser.add_argument('--delay', type=float, default=0.2, help='페이지당 서버 응답 지연(초)')
+    parser.add_argument('--workers', type=int, default=8, help='작업 스레드 수')
+    parser.add_argument('--interval', type=float, default=0.02, help='요청 사이의 최소 간격(초)')
+    args = parser.parse_args()
+
+    print(f'fixture: {check_worknet_fixture()} postings crawled from worknet_listing.html, retries ok')
+
+    codes = [f'{i:03X}' for i in range(args.pages)]
+    with tempfile.TemporaryDirectory() as tmp:
+        write_fixtures(tmp, codes)
+        with FixtureServer(tmp, delay=args.delay) as server:
+            tasks = [(code, f'{server.url}/works/{code}.html') for code in codes]
+
+            start = time.perf_counter()
+            expected = {code: parse(code, http_fetch(url)) for code, url in tasks}
+            sequential = time.perf_counter() - start
+
+            engine = CrawlEngine(http_fetch, parse, max_workers=args.workers, min_interval=args.interval)
+            start = time.perf_counter()
+            results = engine.run(tasks)
+            concurrent = time.perf_counter() - start
+            assert results == expected and not engine.failures
+
+            # 절반만 수집한 체크포인트에서 이어서 수집
+            checkpoint_path = os.path.join(tmp, 'checkpoint.jsonl')
+            CrawlEngine(http_fetch, parse, max_workers=args.workers, min_interval=args.interval,
+                        checkpoint_path=checkpoint_path).run(tasks[:len(tasks) // 2])
+            engine = CrawlEngine(http_fetch, parse, max_workers=args.workers, min_interval=args.interval,
+                                 checkpoint_path=checkpoint_path)
+            start = time.perf_counter()
+            results = engine.run(tasks)
+            resumed = time.perf_counter() - start
+            assert results == expected
+
+    print(f'{args.pages} pages, {args.delay * 1000:.0f} ms server delay')
+    print(f'{"sequential":<24}{sequential:>8.2f}s')
+    print(f'{f"engine ({args.workers} workers)":<24}{concurrent:>8.2f}s')
+    print(f'{"engine, resumed at 50%":<24}{resumed:>8.2f}s')
+
+
+if __name__ == '__main__':
+    main()
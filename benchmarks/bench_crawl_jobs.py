@@ -0,0 +1,126 @@
+'''
+직업별 NCS 분류 목록(crawling_jobs.py) 전체 수집 시간을 비교하는 벤치마크.
+
+로컬 FixtureServer가 직업별 NCS 분류 목록 페이지를 흉내 낸 합성 페이지 --pages장을 응답 지연과 함께 제공합니다.
+- 기존 방식 : 한 페이지씩 순서대로 열고, 행마다 선택자로 요소를 찾은 뒤 직업명마다 그 행의 NCS 링크 href를 모두 다시 읽습니다.
+  요소 호출마다 --roundtrip-ms만큼 지연을 넣어 WebDriver 왕복 비용을 흉내 내며, 페이지 사이의 2~5초 대기는
+  --legacy-sleep으로 지정합니다(기본 0, 실제 평균은 3.5초).
+- 새 방식 : CrawlEngine이 여러 작업 스레드로 페이지를 받아 page_parser.parse_ncs_jobs()로 한 번에 추출합니다.
+
+기존 URL 조합(url = f'{url}' + str(i))이 요청하던 주소도 출력하여, 두 번째 페이지부터 잘못된 주소를 요청했음을 보여 줍니다.
+두 방식의 추출 결과가 같은지 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_crawl_jobs [--pages 32] [--delay 0.2] [--workers 8] [--interval 0.02]
+'''
+import argparse
+import os
+import tempfile
+import time
+import urllib.error
+
+from benchmarks.bench_worknet_parser import RoundTripDriver
+from crawl_engine import CrawlEngine, FixtureServer, http_fetch
+from page_parser import parse_ncs_jobs
+
+
+def make_jobs_page(page, rows=11, jobs_per_row=2, codes_per_row=4, filler_blocks=200):
+    '''
+    직업별 NCS 분류 목록 페이지와 같은 구조의 합성 HTML을 만듭니다.
+    '''
+    filler = ''.join(f'<div class="menu"><a href="/m/{k}">메뉴 {k}</a></div>' for k in range(filler_blocks))
+    body = ''.join(f'''
+        <tr id="list_{i}">
+          <td>{page * rows + i}</td>
+          <td>직종 {i}</td>
+          <td class="pl_50 left">{''.join(f'<button type="button">직업 {page}-{i}-{k}</button>' for k in range(jobs_per_row))}</td>
+          <td><div class="ncs"><div><ul>{''.join(
+              f"""<li><a href="javascript:goNcs('{20010000 + (page * rows + i) * codes_per_row + c}', '0')">NCS {c}</a></li>"""
+              for c in range(codes_per_row))}</ul></div></div></td>
+        </tr>''' for i in range(rows))
+    return f'<html><body>{filler}<table><tbody>{body}</tbody></table>{filler}</body></html>'
+
+
+def legacy_crawling(driver):
+    '''
+    기존 crawling_jobs.crawling()과 같은 호출 순서의 추출. CSS 선택자는 같은 요소를 고르는 XPath로 바꿨습니다.
+    '''
+    job_data = []
+    for i in range(0, 11):
+        job_elements = driver.find_elements(
+            f'//*[@id="list_{i}"]/td[contains(concat(" ", normalize-space(@class), " "), " pl_50 ")]/button')
+        ncs_elements = driver.find_elements(f'//*[@id="list_{i}"]/*[4][self::td]/div/div/ul/li/a')
+        for job_element in job_elements:
+            job_title = job_element.text
+            ncs_codes = []
+            for ncs_element in ncs_elements:
+                href = ncs_element.get_attribute('href')
+                start = href.find("'") + 1
+                ncs_codes.append(href[start:start + 8])
+            for code in ncs_codes:
+                job_data.append({'직업명': job_title, 'NCS분류': code})
+    return job_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=32, help='수집할 페이지 수')
+    parser.add_argument('--delay', type=float, default=0.2, help='페이지당 서버 응답 지연(초)')
+    parser.add_argument('--roundtrip-ms', type=float, default=1.0, help='기존 방식의 WebDriver 호출 한 번의 왕복 지연(ms)')
+    parser.add_argument('--legacy-sleep', type=float, default=0.0, help='기존 방식의 페이지 사이 대기(초)')
+    parser.add_argument('--workers', type=int, default=8, help='작업 스레드 수')
+    parser.add_argument('--interval', type=float, default=0.02, help='요청 사이의 최소 간격(초)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'jobs'))
+        for page in range(args.pages):
+            with open(os.path.join(tmp, 'jobs', f'page{page}'), 'w', encoding='utf-8') as f:
+                f.write(make_jobs_page(page))
+
+        with FixtureServer(tmp, delay=args.delay) as server:
+            base_url = f'{server.url}/jobs/page'
+
+            # 기존 URL 조합: 이전 페이지의 URL 뒤에 번호를 계속 덧붙임
+            url = base_url
+            wrong = 0
+            for page in range(min(args.pages, 4)):
+                url = f'{url}' + str(page)
+                print(f'legacy url for page {page}: {url[len(server.url):]}')
+                try:
+                    http_fetch(url)
+                except urllib.error.HTTPError:
+                    wrong += 1
+            print(f'legacy url builder: {wrong} of {min(args.pages, 4)} pages not found')
+
+            # 기존 방식 (URL은 올바르게 조합)
+            start = time.perf_counter()
+            expected = []
+            calls = 0
+            for page in range(args.pages):
+                url = f'{base_url}{page}'
+                driver = RoundTripDriver(http_fetch(url), url, args.roundtrip_ms)
+                expected += legacy_crawling(driver)
+                calls += driver.calls
+                time.sleep(args.legacy_sleep)
+            legacy = time.perf_counter() - start
+
+            tasks = [(str(page), f'{base_url}{page}') for page in range(args.pages)]
+            engine = CrawlEngine(http_fetch, lambda page, html: parse_ncs_jobs(html), max_workers=args.workers,
+                                 min_interval=args.interval)
+            start = time.perf_counter()
+            cpu_start = time.process_time()
+            results = engine.run(tasks)
+            cpu = time.process_time() - cpu_start
+            concurrent = time.perf_counter() - start
+            assert not engine.failures
+            assert [row for rows in results.values() for row in rows] == expected
+
+    print(f'{args.pages} pages, {len(expected)} job-NCS pairs, {args.delay * 1000:.0f} ms server delay')
+    print(f'{"legacy (sequential, per-element calls)":<40}{legacy:>8.2f}s  ({calls} WebDriver calls)')
+    print(f'{"  + 2-5 s sleeps between pages (avg)":<40}{legacy + 3.5 * args.pages - args.legacy_sleep * args.pages:>8.2f}s')
+    print(f'{f"engine ({args.workers} workers) + lxml":<40}{concurrent:>8.2f}s  (CPU {cpu:.2f}s)')
+
+
+if __name__ == '__main__':
+    main()
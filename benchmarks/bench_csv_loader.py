@@ -0,0 +1,105 @@
+'''
+CSV → data.db 적재 시간을 비교하는 벤치마크.
+
+edu_program과 같은 형태(pandas 인덱스 열 "Unnamed: 0" 포함)의 합성 CSV를 --rows행 만들고,
+기존 tosql.load_data()(pd.read_csv로 전체 읽기 + to_sql(if_exists='replace') + 마이그레이션 재적용)와
+새 tosql.load_data()(청크 스트리밍 + executemany + 테이블 원자적 교체)의 적재 시간과 초당 행 수를 비교합니다.
+두 방식으로 적재한 edu_program의 내용이 같은지도 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_csv_loader [--rows 1000000] [--chunksize 50000]
+'''
+import argparse
+import csv
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+import pandas as pd
+
+from migrations import TABLE_SCHEMAS, migrate
+from precompute import build_job_postings_flat
+from tosql import load_data
+
+EDU_PROGRAM_COLUMNS = ['id_edu_program', 'id_edu_company', 'name_edu_program', 'date_start', 'date_end', 'cost',
+                       'oopc', 'link', 'online_status', 'employment_status', 'ncs_code']
+
+
+def write_edu_program_csv(path, rows, seed=0):
+    '''
+    edu_program.csv와 같은 열의 합성 CSV를 만듭니다. 첫 열은 pandas가 저장한 인덱스입니다.
+    '''
+    rng = random.Random(seed)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([''] + EDU_PROGRAM_COLUMNS)
+        for i in range(rows):
+            writer.writerow([i, i // 3, rng.randrange(5000), f'(2024) 데이터 분석 과정 {i}', 20240301, 20240901,
+                             rng.randrange(100000, 10000000), rng.choice([0, 29700, '']),
+                             f'https://www.hrd.go.kr/hrdp/co/pcobo/PCOBO0100P.do?tracseId=AIG{i:011d}&tracseTme=3',
+                             rng.choice(['온라인', '오프라인']), rng.choice(['구직자', '근로자']),
+                             20010000 + rng.randrange(2600)])
+
+
+def create_empty_db(path):
+    '''
+    참조 테이블이 모두 비어 있는 data.db를 만듭니다.
+    '''
+    conn = sqlite3.connect(path)
+    for name, schema in TABLE_SCHEMAS.items():
+        conn.execute(f'CREATE TABLE "{name}" {schema}')
+    conn.commit()
+    migrate(conn)
+    conn.close()
+
+
+def legacy_load_data(db_path, path):
+    '''
+    기존 tosql.load_data()의 edu_program 적재 과정.
+    '''
+    conn = sqlite3.connect(db_path)
+    edu_program = pd.read_csv(path + 'edu_program.csv')
+    edu_program.to_sql('edu_program', conn, if_exists='replace', index=False)
+    migrate(conn, reapply=True)
+    build_job_postings_flat(conn)
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000, help='합성 CSV의 행 수')
+    parser.add_argument('--chunksize', type=int, default=50000, help='executemany 한 번에 넣을 행 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_dir = tmp + '/'
+        write_edu_program_csv(os.path.join(tmp, 'edu_program.csv'), args.rows)
+
+        legacy_path = os.path.join(tmp, 'legacy.db')
+        create_empty_db(legacy_path)
+        start = time.perf_counter()
+        legacy_load_data(legacy_path, csv_dir)
+        legacy = time.perf_counter() - start
+
+        streaming_path = os.path.join(tmp, 'streaming.db')
+        create_empty_db(streaming_path)
+        start = time.perf_counter()
+        load_data(streaming_path, ['edu_program'], csv_dir, args.chunksize)
+        streaming = time.perf_counter() - start
+
+        query = f'SELECT {", ".join(EDU_PROGRAM_COLUMNS)} FROM edu_program ORDER BY rowid'
+        legacy_conn, streaming_conn = sqlite3.connect(legacy_path), sqlite3.connect(streaming_path)
+        assert legacy_conn.execute(query).fetchall() == streaming_conn.execute(query).fetchall()
+        legacy_conn.close()
+        streaming_conn.close()
+
+    print(f'edu_program.csv, {args.rows:,} rows')
+    print(f'{"mode":<36}{"seconds":>10}{"rows/s":>12}')
+    print(f'{"read_csv + to_sql + migrate (legacy)":<36}{legacy:>10.2f}{args.rows / legacy:>12,.0f}')
+    print(f'{"streaming executemany + swap":<36}{streaming:>10.2f}{args.rows / streaming:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main()
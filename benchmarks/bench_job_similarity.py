@@ -0,0 +1,104 @@
+'''
+설문 응답 → 유사 직업 상위 k개 검색의 지연시간을 비교하는 벤치마크.
+
+태그 인기도가 치우친(Zipf) 합성 tag_to_jobs(기본 100,000개 직업 x 20개 태그)로
+- 기존 방식 : tag_to_jobs를 isin으로 필터링한 뒤 groupby().count()와 정렬 (일치 태그 수)
+- 전체 스캔 : 정규화된 TF-IDF 직업 행렬 전체(CSR)와 응답 벡터의 곱
+- JobSimilarityIndex 'sparse' : 응답 태그의 열(CSC)만 읽는 희소 곱 + argpartition
+- JobSimilarityIndex 'dense' : 밀집 행렬과의 NumPy 곱 (직업 수가 작은 --dense-jobs 카탈로그에서 'sparse'와 함께 비교)
+의 응답당 시간을 비교합니다. 'sparse' 상위 k개가 전체 스캔과 같은지(재현율 1.0), 'dense'와 'sparse'의 유사도가 같은지도 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_job_similarity [--jobs 100000] [--tags 5000] [--tags-per-job 20] [--dense-jobs 100]
+'''
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from job_similarity import JobSimilarityIndex
+
+
+def make_tag_to_jobs(n_jobs, n_tags, tags_per_job, seed=0):
+    '''
+    직업마다 tags_per_job개의 태그를 가진 합성 tag_to_jobs 데이터를 만듭니다. 태그 인기도는 Zipf 분포를 따릅니다.
+    '''
+    rng = np.random.default_rng(seed)
+    popularity = 1 / np.arange(1, n_tags + 1)
+    job_ids = np.repeat(np.arange(n_jobs), tags_per_job)
+    tag_ids = rng.choice(n_tags, size=len(job_ids), p=popularity / popularity.sum()) + 1000
+    return pd.DataFrame({'id_jobs': job_ids, 'id_tag': tag_ids}).drop_duplicates()
+
+
+def pandas_counts(tag_to_jobs_df, selected_tags):
+    '''
+    기존 SurveyMatcher.display_matched_jobs()의 점수 계산 방식.
+    '''
+    return tag_to_jobs_df[tag_to_jobs_df['id_tag'].isin(selected_tags)].groupby('id_jobs')['id_tag'].count() \
+        .reset_index(name='match_count').sort_values(by='match_count', ascending=False)
+
+
+def full_scan_top_k(index, selected_tags, k):
+    '''
+    응답 벡터를 만들어 직업 행렬 전체와 곱한 뒤 상위 k개를 고르는 기준 방식.
+    '''
+    positions, weights = index.query_weights(selected_tags)
+    query = np.zeros(len(index.tag_ids))
+    query[positions] = weights
+    return index.scorer.top_k(index.scorer.matrix @ query, k)
+
+
+def timed(func, responses):
+    start = time.perf_counter()
+    results = [func(selected_tags) for selected_tags in responses]
+    return (time.perf_counter() - start) / len(responses) * 1000, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=100000, help='직업 수')
+    parser.add_argument('--tags', type=int, default=5000, help='태그 수')
+    parser.add_argument('--tags-per-job', type=int, default=20, help='직업당 태그 수')
+    parser.add_argument('--dense-jobs', type=int, default=100, help="'dense' 방식과 비교할 작은 카탈로그의 직업 수")
+    parser.add_argument('--selected', type=int, default=12, help='응답 하나에서 선택한 태그 수')
+    parser.add_argument('--responses', type=int, default=200, help='검색할 응답 수')
+    parser.add_argument('--k', type=int, default=10, help='반환할 직업 수')
+    args = parser.parse_args()
+
+    tag_to_jobs_df = make_tag_to_jobs(args.jobs, args.tags, args.tags_per_job)
+    rng = np.random.default_rng(1)
+    responses = [(rng.choice(args.tags, args.selected, replace=False) + 1000).tolist() for _ in range(args.responses)]
+
+    start = time.perf_counter()
+    index = JobSimilarityIndex.from_frame(tag_to_jobs_df)
+    build_ms = (time.perf_counter() - start) * 1000
+    assert index.mode == 'sparse'
+
+    legacy_ms, _ = timed(lambda tags: pandas_counts(tag_to_jobs_df, tags).head(args.k), responses)
+    full_ms, expected = timed(lambda tags: full_scan_top_k(index, tags, args.k), responses)
+    sparse_ms, results = timed(lambda tags: index.top_k(tags, args.k), responses)
+    hits = sum(len(np.intersect1d(result[0], reference[0])) for result, reference in zip(results, expected))
+    recall = hits / sum(len(reference[0]) for reference in expected)
+    assert recall == 1.0
+
+    # 작은 카탈로그에서 'dense'와 'sparse' 비교
+    small_df = tag_to_jobs_df[tag_to_jobs_df['id_jobs'] < args.dense_jobs]
+    dense_index = JobSimilarityIndex.from_frame(small_df, dense_max_cells=args.dense_jobs * args.tags)
+    small_sparse_index = JobSimilarityIndex.from_frame(small_df, dense_max_cells=0)
+    assert dense_index.mode == 'dense'
+    dense_ms, dense_results = timed(lambda tags: dense_index.similarities(tags), responses)
+    small_sparse_ms, sparse_results = timed(lambda tags: small_sparse_index.similarities(tags), responses)
+    assert all(np.allclose(dense, sparse, atol=1e-6) for dense, sparse in zip(dense_results, sparse_results))
+
+    print(f'{len(tag_to_jobs_df):,} job-tag pairs ({args.jobs:,} jobs, {args.tags:,} tags), index built in {build_ms:.1f} ms')
+    print(f'{"mode":<46}{"ms/response":>12}')
+    print(f'{"legacy isin + groupby count + sort":<46}{legacy_ms:>12.3f}')
+    print(f'{"full scan (CSR @ query) + top-k":<46}{full_ms:>12.3f}')
+    print(f'{"JobSimilarityIndex sparse top-k":<46}{sparse_ms:>12.3f}  recall@{args.k} {recall:.3f}')
+    print(f'{f"{args.dense_jobs:,} jobs: dense NumPy dot":<46}{dense_ms:>12.3f}')
+    print(f'{f"{args.dense_jobs:,} jobs: sparse column slice":<46}{small_sparse_ms:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
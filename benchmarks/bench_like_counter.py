@@ -0,0 +1,117 @@
+'''
+게시글 좋아요 처리량을 비교하는 벤치마크.
+
+N개의 스레드가 몇 개의 인기 게시글에 동시에 좋아요를 누를 때,
+기존 방식(좋아요마다 UPDATE 후 동기 commit), 공유 연결의 쓰기 트랜잭션(좋아요마다 ConnectionManager.write()),
+LikeCounter(메모리에 모아 주기적으로 일괄 저장)의 초당 처리 건수를 비교하고 저장된 합계가 맞는지 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_like_counter [--threads 1 8 32] [--likes 500] [--posts 5]
+'''
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from db_pool import ConnectionManager
+from like_counter import LikeCounter
+
+
+def create_db(db_path, n_posts):
+    conn = sqlite3.connect(db_path)
+    conn.execute('CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT, content TEXT, likes INTEGER DEFAULT 0)')
+    conn.execute('CREATE TABLE comments (id INTEGER PRIMARY KEY, post_id INTEGER, content TEXT, likes INTEGER DEFAULT 0)')
+    conn.executemany('INSERT INTO posts (title, content) VALUES (?, ?)', ((f'제목 {i}', '내용') for i in range(n_posts)))
+    conn.commit()
+    conn.close()
+
+
+def total_likes(db_path):
+    conn = sqlite3.connect(db_path)
+    total = conn.execute('SELECT SUM(likes) FROM posts').fetchone()[0]
+    conn.close()
+    return total
+
+
+def run_likes(n_threads, n_likes, n_posts, make_like):
+    '''
+    n_threads개의 스레드가 각각 n_likes번 좋아요를 누르고, 시작 시각을 반환합니다.
+    make_like()는 스레드마다 한 번 호출되어 post_id를 받는 좋아요 함수를 반환합니다.
+    '''
+    barrier = threading.Barrier(n_threads + 1)
+
+    def worker(worker_id):
+        like = make_like()
+        barrier.wait()
+        for i in range(n_likes):
+            like((worker_id + i) % n_posts + 1)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return start
+
+
+def legacy_like(db_path):
+    '''
+    기존 BoardApp.like_post()와 같은 방식의 좋아요 함수를 반환합니다.
+    '''
+    conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+
+    def like(post_id):
+        conn.execute('UPDATE posts SET likes = likes + 1 WHERE id=?', (post_id,))
+        conn.commit()
+    return like
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8, 32], help='동시 좋아요 스레드 수 목록')
+    parser.add_argument('--likes', type=int, default=500, help='스레드당 좋아요 수')
+    parser.add_argument('--posts', type=int, default=5, help='좋아요가 몰리는 게시글 수')
+    args = parser.parse_args()
+
+    print(f'{"threads":>8}{"legacy likes/s":>16}{"direct likes/s":>16}{"buffered likes/s":>18}')
+    for n_threads in args.threads:
+        total = n_threads * args.likes
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy_path = os.path.join(tmp, 'legacy.db')
+            create_db(legacy_path, args.posts)
+            start = run_likes(n_threads, args.likes, args.posts, lambda: legacy_like(legacy_path))
+            legacy_rate = total / (time.perf_counter() - start)
+            assert total_likes(legacy_path) == total
+
+            direct_path = os.path.join(tmp, 'direct.db')
+            create_db(direct_path, args.posts)
+            manager = ConnectionManager(direct_path)
+
+            def direct_like(post_id):
+                with manager.write() as conn:
+                    conn.execute('UPDATE posts SET likes = likes + 1 WHERE id=?', (post_id,))
+            start = run_likes(n_threads, args.likes, args.posts, lambda: direct_like)
+            direct_rate = total / (time.perf_counter() - start)
+            manager.close()
+            assert total_likes(direct_path) == total
+
+            # 마지막 일괄 저장까지 포함하여 측정
+            buffered_path = os.path.join(tmp, 'buffered.db')
+            create_db(buffered_path, args.posts)
+            manager = ConnectionManager(buffered_path)
+            counter = LikeCounter(manager)
+            start = run_likes(n_threads, args.likes, args.posts, lambda: lambda post_id: counter.add('posts', post_id))
+            counter.close()
+            buffered_rate = total / (time.perf_counter() - start)
+            manager.close()
+            assert total_likes(buffered_path) == total
+
+        print(f'{n_threads:>8}{legacy_rate:>16.0f}{direct_rate:>16.0f}{buffered_rate:>18.0f}')
+
+
+if __name__ == '__main__':
+    main()
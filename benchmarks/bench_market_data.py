@@ -0,0 +1,94 @@
+'''
+취업시장 동향 페이지(insight.py)의 rerun당 데이터 준비 시간을 비교하는 벤치마크.
+
+현재 CSV(직종 34개 x 연도 6개)를 월 단위, 지역 x 직종 규모로 늘린 합성 CSV(CP949, 천 단위 구분 기호)를 만들고,
+- 기존 방식 : rerun마다 pd.read_csv(encoding='CP949')로 전체를 다시 읽고 data.loc[선택]으로 문자열 값을 꺼냄
+- 새 방식 : job_openings 테이블로 한 번 변환한 뒤, rerun마다 load_market_data()(mtime 확인 + 캐시 조회)와
+  series_values()(행렬 한 행 자르기)만 실행
+의 시간을 비교합니다. 새 방식의 한 번뿐인 변환 시간도 출력하고, 두 방식의 값이 같은지 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_market_data [--regions 17] [--occupations 600] [--months 120] [--repeat 20]
+'''
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+import pandas as pd
+
+from market_data import load_market_data
+from migrations import migrate
+
+
+def write_market_csv(path, regions, occupations, months, seed=0):
+    '''
+    행: '지역 / 직종', 열: 월(YYYYMM), 값: 천 단위 구분 기호가 있는 구인인원인 합성 CSV를 CP949로 만듭니다.
+    '''
+    rng = random.Random(seed)
+    periods = [201500 + (m // 12) * 100 + m % 12 + 1 for m in range(months)]
+    lines = [',' + ','.join(str(p) for p in periods)]
+    labels = []
+    for r in range(regions):
+        for o in range(occupations):
+            label = f'지역{r} / 직종{o}'
+            labels.append(label)
+            lines.append(label + ',' + ','.join(f'"{rng.randrange(0, 400000):,}"' for _ in periods))
+    with open(path, 'w', encoding='CP949') as f:
+        f.write('\n'.join(lines) + '\n')
+    return labels
+
+
+def legacy_rerun(csv_path, selected):
+    '''
+    기존 insight()가 rerun마다 하던 데이터 준비.
+    '''
+    data = pd.read_csv(csv_path, index_col=0, encoding='CP949')
+    return data.loc[selected]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--regions', type=int, default=17, help='지역 수')
+    parser.add_argument('--occupations', type=int, default=600, help='직종 수')
+    parser.add_argument('--months', type=int, default=120, help='월 수')
+    parser.add_argument('--repeat', type=int, default=20, help='rerun 반복 횟수')
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'market.csv')
+        db_path = os.path.join(tmp, 'data.db')
+        labels = write_market_csv(csv_path, args.regions, args.occupations, args.months)
+        cells = len(labels) * args.months
+        conn = sqlite3.connect(db_path)
+        migrate(conn)
+        conn.close()
+
+        selections = [rng.choice(labels) for _ in range(args.repeat)]
+        start = time.perf_counter()
+        expected = [legacy_rerun(csv_path, selected) for selected in selections]
+        legacy = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        load_market_data(db_path, csv_path)
+        convert = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [load_market_data(db_path, csv_path).series_values(selected) for selected in selections]
+        cached = (time.perf_counter() - start) / args.repeat
+
+        for strings, values in zip(expected, results):
+            assert [int(s.replace(',', '')) for s in strings] == values.tolist()
+
+    print(f'{len(labels):,} series x {args.months} months = {cells:,} cells')
+    print(f'{"mode":<40}{"ms":>12}')
+    print(f'{"legacy read_csv + loc (per rerun)":<40}{legacy * 1000:>12.1f}')
+    print(f'{"convert to job_openings (once)":<40}{convert * 1000:>12.1f}')
+    print(f'{"cached load + row slice (per rerun)":<40}{cached * 1000:>12.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+'''
+취업시장 동향 추세 지표(전년 대비 증감률, CAGR, 비중, 순위)의 계산 시간을 비교하는 벤치마크.
+
+지역 x 직종 계열의 월 단위 합성 데이터(기본 10,200개 계열 x 120개월)로 MarketData를 만들고,
+- 클릭마다 재계산 : 선택이 바뀔 때마다 pandas로 전체 계열의 지표를 계산한 뒤 선택한 계열을 고름
+- MarketTrends : 데이터 버전마다 한 번 NumPy 행렬 연산으로 전체 지표를 계산하고, 클릭마다 선택한 행만 자름
+의 클릭당 시간을 비교합니다. 두 방식의 결과가 같은지도 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_market_trends [--regions 17] [--occupations 600] [--months 120] [--selected 24]
+'''
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from market_data import MarketData, MarketTrends
+
+
+def make_market_data(regions, occupations, months, seed=0):
+    '''
+    (region, occupation) 키의 월 단위 합성 MarketData를 만듭니다.
+    '''
+    rng = np.random.default_rng(seed)
+    series = pd.DataFrame([(r * occupations + o + 1, f'지역{r}', f'직종{o}')
+                           for r in range(regions) for o in range(occupations)],
+                          columns=['series_id', 'region', 'occupation'])
+    periods = [201500 + (m // 12) * 100 + m % 12 + 1 for m in range(months)]
+    openings = pd.DataFrame({
+        'series_id': np.repeat(series['series_id'].to_numpy(), months),
+        'period': np.tile(periods, len(series)),
+        'openings': rng.integers(1, 400000, len(series) * months),
+    })
+    return MarketData(series, openings)
+
+
+def legacy_click(frame, selected, lag):
+    '''
+    클릭마다 전체 계열의 지표를 pandas로 다시 계산하고 선택한 계열을 고릅니다.
+    '''
+    growth = frame.pct_change(periods=lag, axis=1)
+    share = frame / frame.sum(axis=0)
+    rank = frame.rank(axis=0, ascending=False, method='first').astype('int64')
+    years = (frame.shape[1] - 1) / lag
+    cagr = (frame.iloc[:, -1] / frame.iloc[:, 0]) ** (1 / years) - 1
+    return growth.loc[selected], share.loc[selected], rank.loc[selected], cagr.loc[selected]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--regions', type=int, default=17, help='지역 수')
+    parser.add_argument('--occupations', type=int, default=600, help='직종 수')
+    parser.add_argument('--months', type=int, default=120, help='월 수')
+    parser.add_argument('--selected', type=int, default=24, help='한 번에 비교할 계열 수')
+    parser.add_argument('--clicks', type=int, default=10, help='선택을 바꾸는 횟수')
+    args = parser.parse_args()
+
+    market = make_market_data(args.regions, args.occupations, args.months)
+    frame = market.frame().astype('float64')
+    rng = random.Random(1)
+    selections = [rng.sample(market.series, args.selected) for _ in range(args.clicks)]
+
+    start = time.perf_counter()
+    expected = [legacy_click(frame, selected, 12) for selected in selections]
+    legacy = (time.perf_counter() - start) / args.clicks
+
+    start = time.perf_counter()
+    trends = MarketTrends(market, periods_per_year=12)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [(trends.compare(selected, 'growth'), trends.compare(selected, 'share'), trends.compare(selected, 'rank'),
+                trends.summary(selected)) for selected in selections]
+    cached = (time.perf_counter() - start) / args.clicks
+
+    for (growth, share, rank, cagr), (new_growth, new_share, new_rank, summary) in zip(expected, results):
+        np.testing.assert_allclose(new_growth.to_numpy(), growth.to_numpy())
+        np.testing.assert_allclose(new_share.to_numpy(), share.to_numpy())
+        assert (new_rank.to_numpy() == rank.to_numpy()).all()
+        np.testing.assert_allclose(summary['cagr'].to_numpy(), cagr.to_numpy())
+
+    cells = market.values.size
+    print(f'{len(market.series):,} series x {args.months} months = {cells:,} cells, {args.selected} series compared')
+    print(f'{"mode":<36}{"ms":>10}')
+    print(f'{"recompute per click (pandas)":<36}{legacy * 1000:>10.1f}')
+    print(f'{"MarketTrends build (once)":<36}{build * 1000:>10.1f}')
+    print(f'{"MarketTrends slice per click":<36}{cached * 1000:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
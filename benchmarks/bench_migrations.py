@@ -0,0 +1,145 @@
+'''
+data.db 마이그레이션(기본키, 인덱스) 적용 전후의 조회 지연시간을 비교하는 벤치마크.
+
+현재 data.db 규모의 100배인 합성 데이터를 to_sql과 같은 형태(키, 인덱스 없음)로 만든 뒤,
+edu.py, work.py, survey.py의 조회 패턴을 마이그레이션 전후로 측정합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_migrations [--scale 100] [--repeat 200]
+'''
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from migrations import migrate
+
+# 현재 data.db의 테이블 규모
+BASE_ROWS = {
+    'jobs': 310,
+    'ncs_to_jobs': 1418,
+    'tag_to_jobs': 282,
+    'edu_program': 991,
+    'worknet_positions': 1102,
+    'jobs_to_worknet': 133,
+}
+
+
+def create_synthetic_db(path, scale, seed=0):
+    '''
+    키와 인덱스가 없는 합성 data.db를 생성합니다.
+    '''
+    rng = random.Random(seed)
+    rows = {name: count * scale for name, count in BASE_ROWS.items()}
+    n_jobs = rows['jobs']
+    ncs_codes = [20010000 + i for i in range(26 * scale)]
+    n_work_codes = 100 * scale
+
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE jobs (id_jobs INTEGER, name_jobs TEXT);
+        CREATE TABLE ncs_to_jobs (id_jobs INTEGER, ncs_code INTEGER);
+        CREATE TABLE tag (id_tag INTEGER, answer_tag TEXT);
+        CREATE TABLE tag_to_jobs (id_jobs INTEGER, id_tag INTEGER);
+        CREATE TABLE edu_company (id_edu_company INTEGER, name_edu_company TEXT, address TEXT);
+        CREATE TABLE edu_program ("Unnamed: 0" INTEGER, id_edu_program INTEGER, id_edu_company INTEGER,
+            name_edu_program TEXT, date_start INTEGER, date_end INTEGER, cost INTEGER, oopc INTEGER,
+            link TEXT, online_status TEXT, employment_status TEXT, ncs_code INTEGER);
+        CREATE TABLE jobs_to_worknet (id_jobs INTEGER, work_code INTEGER);
+        CREATE TABLE worknet_company (id_work_company INTEGER, work_company TEXT);
+        CREATE TABLE worknet_positions (id_work_positions INTEGER, id_work_company INTEGER, work_code INTEGER,
+            recruit TEXT, job_describ_1 TEXT, job_describ_2 TEXT, condition TEXT, date TEXT, link TEXT);
+    ''')
+    conn.executemany('INSERT INTO jobs VALUES (?, ?)', ((i, f'직업{i}') for i in range(n_jobs)))
+    pairs = {(rng.randrange(n_jobs), rng.choice(ncs_codes)) for _ in range(rows['ncs_to_jobs'])}
+    conn.executemany('INSERT INTO ncs_to_jobs VALUES (?, ?)', pairs)
+    tags = [1000 * c + t for c in range(1, 9) for t in range(1, 11)]
+    conn.executemany('INSERT INTO tag VALUES (?, ?)', ((t, f'태그{t}') for t in tags))
+    pairs = {(rng.randrange(n_jobs), rng.choice(tags)) for _ in range(rows['tag_to_jobs'])}
+    conn.executemany('INSERT INTO tag_to_jobs VALUES (?, ?)', pairs)
+    n_companies = 427 * scale
+    conn.executemany('INSERT INTO edu_company VALUES (?, ?, ?)',
+                     ((i, f'기관{i}', '서울 강남구') for i in range(n_companies)))
+    conn.executemany('INSERT INTO edu_program VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', (
+        (i, i, rng.randrange(n_companies), f'과정{i}', 20240301, 20240901, 1000000, 0,
+         'https://example.com', rng.choice(['온라인', '오프라인']), '구직자', rng.choice(ncs_codes))
+        for i in range(rows['edu_program'])))
+    pairs = {(rng.randrange(n_jobs), rng.randrange(n_work_codes)) for _ in range(rows['jobs_to_worknet'])}
+    conn.executemany('INSERT INTO jobs_to_worknet VALUES (?, ?)', pairs)
+    conn.executemany('INSERT INTO worknet_company VALUES (?, ?)', ((i, f'회사{i}') for i in range(800 * scale)))
+    conn.executemany('INSERT INTO worknet_positions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', (
+        (i, rng.randrange(800 * scale), rng.randrange(n_work_codes), f'공고{i}', '담당업무', '경력무관 학력무관 서울특별시 강남구',
+         '월급', '24/03/26 등록', 'https://example.com') for i in range(rows['worknet_positions'])))
+    conn.commit()
+    conn.close()
+    return n_jobs, ncs_codes, tags, n_work_codes
+
+
+def build_queries(n_jobs, ncs_codes, tags, n_work_codes, seed=1):
+    '''
+    각 모듈의 조회 패턴을 (이름, SQL, 파라미터 생성 함수) 목록으로 반환합니다.
+    '''
+    rng = random.Random(seed)
+    return [
+        ('jobs by id_jobs', 'SELECT * FROM jobs WHERE id_jobs = ?',
+         lambda: (rng.randrange(n_jobs),)),
+        ('jobs by name_jobs', 'SELECT id_jobs FROM jobs WHERE name_jobs = ?',
+         lambda: (f'직업{rng.randrange(n_jobs)}',)),
+        ('ncs_to_jobs by id_jobs', 'SELECT ncs_code FROM ncs_to_jobs WHERE id_jobs = ?',
+         lambda: (rng.randrange(n_jobs),)),
+        ('ncs_to_jobs by ncs_code IN', 'SELECT DISTINCT id_jobs FROM ncs_to_jobs WHERE ncs_code IN (?, ?, ?)',
+         lambda: tuple(rng.sample(ncs_codes, 3))),
+        ('edu_program by ncs_code IN', 'SELECT * FROM edu_program WHERE ncs_code IN (?, ?, ?)',
+         lambda: tuple(rng.sample(ncs_codes, 3))),
+        ('tag_to_jobs match count',
+         'SELECT id_jobs, COUNT(*) FROM tag_to_jobs WHERE id_tag IN (?, ?, ?, ?, ?, ?, ?, ?) GROUP BY id_jobs',
+         lambda: tuple(rng.sample(tags, 8))),
+        ('worknet_positions by work_code', 'SELECT * FROM worknet_positions WHERE work_code = ?',
+         lambda: (rng.randrange(n_work_codes),)),
+    ]
+
+
+def measure(conn, queries, repeat):
+    '''
+    각 조회의 평균 지연시간(ms)을 측정합니다.
+    '''
+    results = {}
+    for name, sql, make_params in queries:
+        params = [make_params() for _ in range(repeat)]
+        start = time.perf_counter()
+        for p in params:
+            conn.execute(sql, p).fetchall()
+        results[name] = (time.perf_counter() - start) / repeat * 1000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=100, help='현재 data.db 대비 데이터 배수')
+    parser.add_argument('--repeat', type=int, default=200, help='조회별 반복 횟수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'data.db')
+        start = time.perf_counter()
+        shape = create_synthetic_db(path, args.scale)
+        print(f'synthetic data.db (x{args.scale}) created in {time.perf_counter() - start:.1f}s')
+
+        queries = build_queries(*shape)
+        conn = sqlite3.connect(path)
+        before = measure(conn, queries, args.repeat)
+        start = time.perf_counter()
+        migrate(conn)
+        print(f'migrations applied in {time.perf_counter() - start:.1f}s')
+        after = measure(conn, queries, args.repeat)
+        conn.close()
+
+    print(f'{"query":<34}{"before(ms)":>12}{"after(ms)":>12}{"speedup":>10}')
+    for name in before:
+        print(f'{name:<34}{before[name]:>12.3f}{after[name]:>12.3f}{before[name] / after[name]:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+'''
+직업 분야(NCS 대분류) → 직업 목록 준비 시간을 비교하는 벤치마크.
+
+합성 교육 프로그램(기본 500,000행)과 직업-NCS 매핑(기본 2,000개 직업 x 8개 코드)을 migrations의 목표 스키마로 만들고,
+- 기존 방식 : ncs_code를 행마다 str(ncs)[:-6]로 잘라 분야 딕셔너리에서 찾고, 분야별 NCS 코드 목록으로 직업을 필터링
+- NCS 분류 열 : 저장된 정수 ncs_major를 인덱스로 읽어 분야로 변환 (EduMatcher.build_prepared_data,
+  JobMatcher.build_field_jobs, 'memory' 엔진의 EduMatcher.build_program_data)
+의 시간을 비교합니다. 두 방식의 분야별 직업 목록과 프로그램 분야가 같은지도 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_ncs_hierarchy [--programs 500000] [--jobs 2000] [--codes-per-job 8]
+'''
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from edu import EduMatcher
+from migrations import TABLE_SCHEMAS, migrate
+from refdata import load_reference_data
+from work import JobMatcher
+
+# 기존 edu.py / work.py의 분야 매핑 (NCS 코드의 뒤 6자리를 뺀 문자열 → 분야)
+LEGACY_CATEGORIES = {'13': '음식+식품', '21': '음식+식품', '20': '정보통신', '6': '보건', '14': '건설', '8': '문화'}
+
+
+def legacy_category(ncs_code):
+    return LEGACY_CATEGORIES.get(ncs_code, '기타')
+
+
+def legacy_edu_prepare(db_path, jobs_df, ncs_to_jobs_df):
+    '''
+    기존 EduMatcher: DISTINCT ncs_code를 문자열로 잘라 분야별 코드 목록을 만들고, 분야마다 직업을 필터링.
+    '''
+    conn = sqlite3.connect(db_path)
+    ncs_codes = [ncs for (ncs,) in conn.execute('SELECT DISTINCT ncs_code FROM edu_program')]
+    conn.close()
+    category_ncs_codes = {}
+    for ncs in ncs_codes:
+        category_ncs_codes.setdefault(legacy_category(str(ncs)[:-6]), []).append(ncs)
+    field_jobs = {}
+    for category, codes in category_ncs_codes.items():
+        related_job_ids = ncs_to_jobs_df[ncs_to_jobs_df['ncs_code'].isin(codes)]['id_jobs'].unique()
+        field_jobs[category] = jobs_df[jobs_df['id_jobs'].isin(related_job_ids)]['name_jobs'].unique().tolist()
+    return field_jobs
+
+
+def legacy_work_prepare(jobs_df, ncs_to_jobs_df):
+    '''
+    기존 JobMatcher: ncs_to_jobs 전체에 분야 컬럼을 lambda로 추가하고, 분야마다 직업을 필터링.
+    '''
+    ncs_to_jobs = ncs_to_jobs_df.copy()
+    ncs_to_jobs['field_name'] = ncs_to_jobs['ncs_code'].apply(lambda x: legacy_category(str(x)[:-6]))
+    return {field: jobs_df[jobs_df['id_jobs'].isin(ncs_to_jobs[ncs_to_jobs['field_name'] == field]['id_jobs'])]['name_jobs'].unique().tolist()
+            for field in sorted(ncs_to_jobs['field_name'].unique())}
+
+
+def make_db(db_path, programs, jobs, codes_per_job, seed=0):
+    '''
+    목표 스키마로 합성 jobs, ncs_to_jobs, edu_program 테이블과 빈 edu_company 테이블을 만듭니다.
+    '''
+    rng = random.Random(seed)
+    codes = [major * 1000000 + middle * 10000 + minor * 100 + detail
+             for major in range(1, 25) for middle in range(1, 4) for minor in range(1, 4) for detail in range(1, 4)]
+    conn = sqlite3.connect(db_path)
+    for name in ('jobs', 'ncs_to_jobs', 'edu_company', 'edu_program'):
+        conn.execute(f'CREATE TABLE {name} {TABLE_SCHEMAS[name]}')
+    conn.executemany('INSERT INTO jobs VALUES (?, ?)', ((i, f'직업{i}') for i in range(1, jobs + 1)))
+    conn.executemany('INSERT OR IGNORE INTO ncs_to_jobs (id_jobs, ncs_code) VALUES (?, ?)',
+                     ((i, rng.choice(codes)) for i in range(1, jobs + 1) for _ in range(codes_per_job)))
+    program_codes = rng.sample(codes, len(codes) // 2)
+    conn.executemany('INSERT INTO edu_program (id_edu_program, name_edu_program, ncs_code) VALUES (?, ?, ?)',
+                     ((i, f'과정{i}', rng.choice(program_codes)) for i in range(programs)))
+    conn.commit()
+    migrate(conn)
+    conn.close()
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--programs', type=int, default=500000, help='교육 프로그램 수')
+    parser.add_argument('--jobs', type=int, default=2000, help='직업 수')
+    parser.add_argument('--codes-per-job', type=int, default=8, help='직업당 NCS 코드 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'data.db')
+        make_db(db_path, args.programs, args.jobs, args.codes_per_job)
+        data = load_reference_data(db_path)
+        jobs_df, ncs_to_jobs_df, edu_program_df = data['jobs'], data['ncs_to_jobs'], data['edu_program']
+
+        legacy_edu, legacy_edu_time = timed(legacy_edu_prepare, db_path, jobs_df, ncs_to_jobs_df)
+        prepared, edu_time = timed(EduMatcher.build_prepared_data, data)
+        assert prepared['unique_categories'] == sorted(legacy_edu)
+        assert all(prepared['field_jobs'].get(field, []) == legacy_edu[field] for field in legacy_edu)
+
+        legacy_work, legacy_work_time = timed(legacy_work_prepare, jobs_df, ncs_to_jobs_df)
+        field_jobs, work_time = timed(JobMatcher.build_field_jobs, data)
+        assert field_jobs == legacy_work
+
+        legacy_categories, legacy_program_time = timed(
+            lambda: edu_program_df['ncs_code'].apply(lambda ncs: legacy_category(str(ncs)[:-6])))
+        programs, program_time = timed(EduMatcher.build_program_data, data)
+        assert (programs['job_category'] == legacy_categories).all()
+
+    print(f'{args.programs:,} programs, {len(ncs_to_jobs_df):,} job-NCS pairs, {len(jobs_df):,} jobs')
+    print(f'{"step":<38}{"legacy ms":>12}{"ncs_major ms":>14}')
+    print(f'{"edu field -> jobs":<38}{legacy_edu_time * 1000:>12.1f}{edu_time * 1000:>14.1f}')
+    print(f'{"work field -> jobs":<38}{legacy_work_time * 1000:>12.1f}{work_time * 1000:>14.1f}')
+    print(f'{"program categories (memory engine)":<38}{legacy_program_time * 1000:>12.1f}{program_time * 1000:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
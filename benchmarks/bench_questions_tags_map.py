@@ -0,0 +1,76 @@
+'''
+질문 → 태그 매핑 생성 시간을 비교하는 마이크로 벤치마크.
+
+기존 SurveyMatcher.prepare_questions_tags_map()의 iterrows() 방식과
+SurveyMatcher.build_questions_tags_map()의 접두사 묶음 방식을 질문/태그 수를 늘려가며 비교합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_questions_tags_map [--sizes 8:80 100:1000 1000:10000]
+'''
+import argparse
+import time
+
+import pandas as pd
+
+from survey import SurveyMatcher
+
+
+def legacy_questions_tags_map(question_df, tag_df):
+    '''
+    기존 SurveyMatcher.prepare_questions_tags_map()과 같은 방식의 구현.
+    '''
+    questions_tags_map = {}
+    tags_code_map = {}
+    for _, row in question_df.iterrows():
+        question_tags = tag_df[tag_df['id_tag'].astype(str).str.startswith(str(row['id_tag_class']))]
+        questions_tags_map[row['id_question']] = {
+            'question': f"Q{row['id_question']} {row['name_question']}",
+            'tags': [f"#{tag}" for tag in question_tags['answer_tag'].tolist()]
+        }
+        for _, tag_row in question_tags.iterrows():
+            tags_code_map[f"#{tag_row['answer_tag']}"] = str(tag_row['id_tag'])
+    return questions_tags_map, tags_code_map
+
+
+def make_frames(n_questions, n_tags):
+    '''
+    data.db와 같은 형태(태그 분류 id 접두사 + 일련번호)의 합성 질문/태그 데이터를 만듭니다.
+    '''
+    classes = [10 * (i + 1) for i in range(n_questions)]
+    question_df = pd.DataFrame({
+        'id_question': range(1, n_questions + 1),
+        'id_tag_class': classes,
+        'name_question': [f'질문{i}' for i in range(1, n_questions + 1)],
+    })
+    tags_per_class = max(1, n_tags // n_questions)
+    width = len(str(tags_per_class))
+    tag_ids = [int(f'{c // 10}{t:0{width + 2}d}') for c in classes for t in range(1, tags_per_class + 1)]
+    tag_df = pd.DataFrame({'id_tag': tag_ids, 'answer_tag': [f'태그_{t}' for t in tag_ids]})
+    return question_df, tag_df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', nargs='+', default=['8:80', '100:1000', '1000:10000'],
+                        help='질문수:태그수 목록')
+    args = parser.parse_args()
+
+    print(f'{"questions":>10}{"tags":>8}{"legacy(ms)":>14}{"vectorized(ms)":>16}')
+    for size in args.sizes:
+        n_questions, n_tags = map(int, size.split(':'))
+        question_df, tag_df = make_frames(n_questions, n_tags)
+
+        start = time.perf_counter()
+        expected = legacy_questions_tags_map(question_df, tag_df)
+        legacy_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        result = SurveyMatcher.build_questions_tags_map(question_df, tag_df)
+        vectorized_ms = (time.perf_counter() - start) * 1000
+
+        assert result == expected
+        print(f'{n_questions:>10}{len(tag_df):>8}{legacy_ms:>14.1f}{vectorized_ms:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
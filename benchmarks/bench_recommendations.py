@@ -0,0 +1,114 @@
+'''
+직업별 추천 교육 프로그램 조회 시간을 비교하는 벤치마크.
+
+합성 교육 프로그램(기본 200,000행)과 직업-NCS 매핑(기본 2,000개 직업 x 8개 코드)을 migrations의 목표 스키마로 만들고,
+- 기존 방식 : 버튼을 누를 때마다 jobs → ncs_to_jobs → edu_program → edu_company를 조인하여 순위 없이 전체를 읽음
+- 추천 테이블 : precompute.build_job_recommendations()가 미리 골라 둔 상위 k개를 (id_jobs, rank) 기본키로 읽음
+의 직업당 조회 시간을 비교합니다. 추천 목록이 기존 조회 결과의 부분집합이고, 점수 순서인지도 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_recommendations [--programs 200000] [--jobs 2000] [--codes-per-job 8] [--queries 200]
+'''
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+import pandas as pd
+
+from migrations import TABLE_SCHEMAS, migrate
+from precompute import build_job_postings_flat, build_job_recommendations
+
+# 기존 EduMatcher.build_programs_query()의 조회 (지역, 온라인 조건 없음)
+LEGACY_QUERY = '''SELECT p.*, c.name_edu_company, c.address, c.region_code
+    FROM edu_program p
+    LEFT JOIN edu_company c ON c.id_edu_company = p.id_edu_company
+    WHERE p.ncs_code IN (
+        SELECT ncs_code FROM ncs_to_jobs
+        WHERE id_jobs = (SELECT id_jobs FROM jobs WHERE name_jobs = ? LIMIT 1))
+    ORDER BY p.rowid'''
+
+# EduMatcher의 추천순 조회
+RANKED_QUERY = '''SELECT p.rowid AS program_rowid, p.*, c.name_edu_company, c.address, c.region_code
+    FROM job_program_ranks r
+    JOIN edu_program p ON p.rowid = r.program_rowid
+    LEFT JOIN edu_company c ON c.id_edu_company = p.id_edu_company
+    WHERE r.id_jobs = (SELECT id_jobs FROM jobs WHERE name_jobs = ? LIMIT 1)
+    ORDER BY r.rank'''
+
+
+def make_db(db_path, programs, jobs, codes_per_job, seed=0):
+    '''
+    목표 스키마로 합성 jobs, ncs_to_jobs, edu_company, edu_program 테이블과 빈 공고 테이블을 만듭니다.
+    '''
+    rng = random.Random(seed)
+    codes = [major * 1000000 + middle * 10000 + minor * 100 + detail
+             for major in range(1, 25) for middle in range(1, 4) for minor in range(1, 4) for detail in range(1, 4)]
+    conn = sqlite3.connect(db_path)
+    for name in ('jobs', 'ncs_to_jobs', 'edu_company', 'edu_program', 'jobs_to_worknet', 'worknet_company', 'worknet_positions'):
+        conn.execute(f'CREATE TABLE {name} {TABLE_SCHEMAS[name]}')
+    conn.executemany('INSERT INTO jobs VALUES (?, ?)', ((i, f'직업{i}') for i in range(1, jobs + 1)))
+    conn.executemany('INSERT OR IGNORE INTO ncs_to_jobs (id_jobs, ncs_code) VALUES (?, ?)',
+                     ((i, rng.choice(codes)) for i in range(1, jobs + 1) for _ in range(codes_per_job)))
+    conn.executemany('INSERT INTO edu_company (id_edu_company, name_edu_company, address, region_code) VALUES (?, ?, ?, ?)',
+                     ((i, f'훈련기관{i}', '서울특별시 어딘가', 0) for i in range(500)))
+    program_codes = rng.sample(codes, len(codes) // 2)
+    statuses = ['온라인', '오프라인', '스마트혼합']
+    conn.executemany('''INSERT INTO edu_program (id_edu_program, id_edu_company, name_edu_program, date_start, oopc, online_status, ncs_code)
+        VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                     ((i // 3, rng.randrange(500), f'과정{i // 3}', 20240300 + rng.randrange(1, 29), rng.randrange(0, 1000000),
+                       rng.choice(statuses), rng.choice(program_codes)) for i in range(programs)))
+    conn.commit()
+    migrate(conn)
+    build_job_postings_flat(conn)
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--programs', type=int, default=200000, help='교육 프로그램(회차) 수')
+    parser.add_argument('--jobs', type=int, default=2000, help='직업 수')
+    parser.add_argument('--codes-per-job', type=int, default=8, help='직업당 NCS 코드 수')
+    parser.add_argument('--queries', type=int, default=200, help='조회할 직업 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'data.db')
+        make_db(db_path, args.programs, args.jobs, args.codes_per_job)
+        conn = sqlite3.connect(db_path)
+        start = time.perf_counter()
+        program_rows, _ = build_job_recommendations(conn)
+        build_time = time.perf_counter() - start
+
+        names = [f'직업{i}' for i in random.Random(1).sample(range(1, args.jobs + 1), min(args.queries, args.jobs))]
+        legacy_time = ranked_time = 0.0
+        legacy_rows = ranked_rows = 0
+        for name in names:
+            start = time.perf_counter()
+            legacy = pd.read_sql_query(LEGACY_QUERY, conn, params=[name])
+            legacy_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            ranked = pd.read_sql_query(RANKED_QUERY, conn, params=[name])
+            ranked_time += time.perf_counter() - start
+
+            rowids = set(pd.read_sql_query(LEGACY_QUERY.replace('SELECT p.*', 'SELECT p.rowid AS program_rowid, p.*', 1),
+                                           conn, params=[name])['program_rowid'])
+            assert set(ranked['program_rowid']) <= rowids
+            assert len(ranked) == min(len(legacy), len(rowids), 100)
+            legacy_rows += len(legacy)
+            ranked_rows += len(ranked)
+        scores = pd.read_sql_query('SELECT id_jobs, rank, score FROM job_program_ranks', conn)
+        assert (scores.groupby('id_jobs')['score'].diff().dropna() <= 0).all()
+        conn.close()
+
+    print(f'{args.programs:,} programs, {args.jobs:,} jobs, {program_rows:,} ranked rows (build {build_time:.2f}s)')
+    print(f'{"mode":<36}{"ms/query":>10}{"rows/query":>12}')
+    print(f'{"legacy join (all, unranked)":<36}{legacy_time / len(names) * 1000:>10.2f}{legacy_rows / len(names):>12.1f}')
+    print(f'{"job_program_ranks (top-k)":<36}{ranked_time / len(names) * 1000:>10.2f}{ranked_rows / len(names):>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
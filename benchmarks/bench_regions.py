@@ -0,0 +1,105 @@
+'''
+채용 공고 지역 정규화와 지역 필터의 시간을 비교하는 벤치마크.
+
+'경력 학력 주소' 형태의 합성 job_describ_2 열(기본 200,000행)로
+- 기존 방식 : 행마다 split한 뒤 위치(2번째 또는 '~' 다음 4번째 단어)로 주소를 골라 매핑 딕셔너리로 변환하고,
+  시/도 정식 명칭 문자열로 필터링
+- regions : 미리 컴파일한 별칭 정규식으로 열 전체를 str.extract 한 번에 정규화하고, 정수 region_code로 필터링
+의 시간을 비교합니다. 기존 매핑이 알던 별칭에 대해서는 두 방식이 같은 시/도를 고르는지도 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_regions [--rows 200000] [--selected 3] [--repeat 5]
+'''
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from regions import REGION_CODES, normalize_regions
+
+# 기존 work.py / precompute.py의 매핑
+LEGACY_REGION_MAPPING = {
+    '경기': '경기도', '경남': '경상남도', '경북': '경상북도',
+    '광주': '광주광역시', '대구': '대구광역시', '대전': '대전광역시',
+    '부산': '부산광역시', '서울': '서울특별시', '인천': '인천광역시',
+    '전북': '전라북도', '충남': '충청남도', '전북특별자치도': '전라북도',
+    '강원특별자치도': '강원도', '세종특별자치시': '서울특별시', '제주': '제주특별자치도', '서울특별시': '서울특별시',
+    '경기도': '경기도', '전라남도': '전라남도', '경상북도': '경상북도', '광주광역시': '광주광역시', '울산광역시': '울산광역시',
+    '대구광역시': '대구광역시', '대전광역시': '대전광역시', '인천광역시': '인천광역시', '부산광역시': '부산광역시', '강원도': '강원도',
+    '전라북도': '전라북도', '경상남도': '경상남도'
+}
+
+
+def legacy_parse_region(job_describ_2):
+    '''
+    기존 방식의 행 단위 지역 추출.
+    '''
+    if job_describ_2 is None:
+        return None
+    parts = job_describ_2.split(' ')
+    if len(parts) > 4 and parts[2] == '~':
+        return LEGACY_REGION_MAPPING.get(parts[4])
+    if len(parts) > 2:
+        return LEGACY_REGION_MAPPING.get(parts[2])
+    return None
+
+
+def make_postings(rows, seed=0):
+    '''
+    기존 매핑이 알던 별칭(세종은 기존 매핑이 서울로 잘못 보내므로 제외)과 새로 지원하는 별칭을 섞은 합성 job_describ_2 열을 만듭니다.
+    '''
+    rng = random.Random(seed)
+    aliases = [alias for alias in REGION_CODES if alias != '세종특별자치시']
+    careers = ['경력무관', '신입', '경력1년', '경력5년']
+    educations = ['학력무관', '고졸', '대졸(4년)', '고졸 ~ 대졸(4년)']
+    return pd.Series([f'{rng.choice(careers)} {rng.choice(educations)} {rng.choice(aliases)} 어딘가시 어느로{i}'
+                      for i in range(rows)], name='job_describ_2')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000, help='공고 수')
+    parser.add_argument('--selected', type=int, default=3, help='필터로 고르는 지역 수')
+    parser.add_argument('--repeat', type=int, default=5, help='필터 반복 횟수')
+    args = parser.parse_args()
+
+    postings = make_postings(args.rows)
+
+    start = time.perf_counter()
+    legacy = postings.apply(legacy_parse_region)
+    legacy_normalize = time.perf_counter() - start
+
+    start = time.perf_counter()
+    regions = normalize_regions(postings)
+    normalize = time.perf_counter() - start
+    codes = regions.cat.codes.to_numpy()
+
+    # 기존 매핑이 아는 별칭은 같은 시/도여야 함 (기존 정식 명칭을 다시 정규화하여 비교)
+    known = legacy.notna()
+    assert (normalize_regions(legacy[known]).cat.codes.to_numpy() == codes[known.to_numpy()]).all()
+
+    selected_codes = list(range(args.selected))
+    selected_names = list(regions.cat.categories[selected_codes])
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        expected = legacy.isin(selected_names).to_numpy()
+    legacy_filter = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        result = np.isin(codes, selected_codes)
+    code_filter = (time.perf_counter() - start) / args.repeat
+    assert (result[known.to_numpy()] == expected[known.to_numpy()]).all()
+
+    print(f'{args.rows:,} postings, legacy mapping resolved {known.mean():.1%}, regions resolved {(codes >= 0).mean():.1%}')
+    print(f'{"mode":<40}{"ms":>10}')
+    print(f'{"legacy split + dict (per row)":<40}{legacy_normalize * 1000:>10.1f}')
+    print(f'{"regions str.extract (column)":<40}{normalize * 1000:>10.1f}')
+    print(f'{"legacy filter (region name isin)":<40}{legacy_filter * 1000:>10.2f}')
+    print(f'{"regions filter (region_code isin)":<40}{code_filter * 1000:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
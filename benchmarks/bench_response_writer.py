@@ -0,0 +1,102 @@
+'''
+설문 응답 저장 처리량을 비교하는 벤치마크.
+
+N개의 스레드가 동시에 응답을 제출할 때,
+기존 방식(제출마다 연결을 열고 태그별 INSERT 후 동기 commit)과
+ResponseWriter(write-behind 큐 + 일괄 executemany 트랜잭션 + WAL)의 초당 저장 건수를 비교합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_response_writer [--writers 1 4 16] [--responses 200] [--tags 8]
+'''
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from response_writer import ResponseWriter
+
+
+def legacy_save(db_path, tag_ids):
+    '''
+    기존 SurveyMatcher.save_responses()와 같은 방식의 저장.
+    '''
+    conn = sqlite3.connect(db_path, timeout=30)
+    c = conn.cursor()
+    c.execute('INSERT INTO responses DEFAULT VALUES')
+    response_id = c.lastrowid
+    for tag_id in tag_ids:
+        c.execute('INSERT INTO user_responses (response_id, tag_id) VALUES (?, ?)', (response_id, tag_id))
+    conn.commit()
+    conn.close()
+
+
+def create_db(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute('CREATE TABLE responses (response_id INTEGER PRIMARY KEY AUTOINCREMENT)')
+    conn.execute('CREATE TABLE user_responses (response_id INTEGER, tag_id INTEGER, FOREIGN KEY(response_id) REFERENCES responses(response_id))')
+    conn.commit()
+    conn.close()
+
+
+def run_writers(n_writers, n_responses, n_tags, submit):
+    '''
+    n_writers개의 스레드가 각각 n_responses개의 응답을 제출하고, 제출을 시작한 시각을 반환합니다.
+    '''
+    barrier = threading.Barrier(n_writers + 1)
+
+    def worker(worker_id):
+        barrier.wait()
+        for i in range(n_responses):
+            submit([1000 + (worker_id + i + t) % 80 for t in range(n_tags)])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_writers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return start
+
+
+def count_rows(db_path):
+    conn = sqlite3.connect(db_path)
+    counts = (conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0],
+              conn.execute('SELECT COUNT(*) FROM user_responses').fetchone()[0])
+    conn.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--writers', type=int, nargs='+', default=[1, 4, 16], help='동시 제출 스레드 수 목록')
+    parser.add_argument('--responses', type=int, default=200, help='스레드당 제출할 응답 수')
+    parser.add_argument('--tags', type=int, default=8, help='응답당 태그 수')
+    args = parser.parse_args()
+
+    print(f'{"writers":>8}{"legacy resp/s":>16}{"queued resp/s":>16}{"queued rows/s":>16}')
+    for n_writers in args.writers:
+        total = n_writers * args.responses
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy_path = os.path.join(tmp, 'legacy.db')
+            create_db(legacy_path)
+            start = run_writers(n_writers, args.responses, args.tags, lambda tag_ids: legacy_save(legacy_path, tag_ids))
+            legacy_rate = total / (time.perf_counter() - start)
+            assert count_rows(legacy_path)[0] == total
+
+            queued_path = os.path.join(tmp, 'queued.db')
+            create_db(queued_path)
+            writer = ResponseWriter(queued_path)
+            start = run_writers(n_writers, args.responses, args.tags, writer.submit)
+            writer.close()
+            elapsed = time.perf_counter() - start
+            responses, rows = count_rows(queued_path)
+            assert responses == total and rows == total * args.tags
+
+        print(f'{n_writers:>8}{legacy_rate:>16.0f}{total / elapsed:>16.0f}{rows / elapsed:>16.0f}')
+
+
+if __name__ == '__main__':
+    main()
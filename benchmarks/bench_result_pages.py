@@ -0,0 +1,101 @@
+'''
+교육 프로그램 추천 결과의 카드 생성 시간과 한 번의 실행에 보내는 HTML 크기를 비교하는 벤치마크.
+
+합성 추천 결과(기본 5,000행)로
+- 기존 방식 : 모든 행을 programs.iloc[index]로 꺼내 f-string 카드를 만들고, 카드마다 st.markdown 한 번 (블록 = 행 수)
+- result_pages : 현재 페이지(기본 20행)만 format_cards()로 열 단위로 만들고, 화면 열마다 st.markdown 한 번 (블록 = 열 수)
+의 시간, 블록 수, HTML 크기를 비교합니다. 같은 행에 대해 두 방식의 카드 내용이 같은지도 확인합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_result_pages [--rows 5000] [--page-size 20] [--repeat 5]
+'''
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from edu import EduMatcher
+from result_pages import ResultPager, format_cards
+
+
+def legacy_card(program):
+    '''
+    기존 EduMatcher.display_program_card()의 카드 HTML.
+    '''
+    return f"""
+            <div style="background-color: #cbf3f0; padding: 20px; border-radius: 10px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,.1);">
+                <h4 style="color: #333;">{program['name_edu_program']}</h4>
+                <p style="color: #666;"><b>{program['name_edu_company']}</b></p>
+                <p style="color: #666;">시작일: {program['date_start']} | 종료일: {program['date_end']}</p>
+                <p style="color: #666;">자가부담금: {program['oopc']}</p>
+                <p style="color: #666;">온라인 여부: {program['online_status']}</p>
+                <p style="color: #666;">지역: {program['region']}</p>
+                <a href="{program['link']}" target="_blank">More Info</a>
+            </div>
+            """
+
+
+def legacy_cards(programs):
+    '''
+    기존 EduMatcher.display_programs(): 모든 행을 iloc으로 꺼내 카드를 만듭니다.
+    '''
+    return [legacy_card(programs.iloc[index]) for index in range(len(programs))]
+
+
+def make_programs(rows, seed=0):
+    '''
+    EduMatcher의 조회 결과와 같은 열을 가진 합성 추천 결과를 만듭니다.
+    '''
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'name_edu_program': [f'과정{i} 실무 프로젝트' for i in range(rows)],
+        'name_edu_company': [f'훈련기관{rng.randrange(300)}' for _ in range(rows)],
+        'date_start': [20240300 + rng.randrange(1, 29) for _ in range(rows)],
+        'date_end': [20240600 + rng.randrange(1, 29) for _ in range(rows)],
+        'oopc': [rng.randrange(0, 500000) for _ in range(rows)],
+        'online_status': [rng.choice(['온라인', '오프라인']) for _ in range(rows)],
+        'region': pd.Categorical([rng.choice(['서울특별시', '경기도', '부산광역시']) for _ in range(rows)]),
+        'link': [f'https://example.com/program/{i}' for i in range(rows)],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=5000, help='추천 결과 수')
+    parser.add_argument('--page-size', type=int, default=20, help='한 페이지의 결과 수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수')
+    args = parser.parse_args()
+
+    programs = make_programs(args.rows)
+    page_size = ResultPager('bench', args.page_size).page_size
+    page = programs.iloc[:page_size]
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        legacy = legacy_cards(programs)
+    legacy_time = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        cards = format_cards(page, EduMatcher.program_card_template)
+    page_time = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    all_cards = format_cards(programs, EduMatcher.program_card_template)
+    all_time = time.perf_counter() - start
+
+    # 들여쓰기와 줄바꿈을 빼면 같은 카드
+    assert [''.join(line.strip() for line in card.splitlines()) for card in legacy] == all_cards
+    legacy_bytes = sum(len(card.encode()) for card in legacy)
+    page_bytes = sum(len(card.encode()) for card in cards)
+
+    print(f'{args.rows:,} programs, page size {page_size}')
+    print(f'{"mode":<42}{"ms":>10}{"blocks":>8}{"KB":>10}')
+    print(f'{"legacy iloc + f-string (all rows)":<42}{legacy_time * 1000:>10.1f}{len(legacy):>8}{legacy_bytes / 1024:>10.1f}')
+    print(f'{"format_cards (all rows)":<42}{all_time * 1000:>10.1f}{"-":>8}{"-":>10}')
+    print(f'{"format_cards (one page, 2 columns)":<42}{page_time * 1000:>10.2f}{2:>8}{page_bytes / 1024:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+'''
+app.py의 시작(import) 시간을 측정하는 벤치마크.
+
+새 파이썬 프로세스에서 python -X importtime으로 각 시나리오를 실행하고, 최상위 import의 누적 시간을 합산합니다.
+- legacy : 기존 app.py의 최상위 import (numpy, seaborn, matplotlib, plotly, 페이지 모듈 5개 전부)
+- app.py : 현재 app.py (페이지 모듈은 메뉴를 선택할 때 불러옴)
+- app.py + <페이지> : 첫 화면 이후 해당 메뉴를 처음 선택했을 때까지의 import
+설치되지 않은 모듈은 legacy 시나리오에서 건너뛰고 표시합니다.
+--budget-ms를 주면 app.py의 import 시간이 이를 넘을 때 종료 코드 1로 끝나므로, import 회귀를 잡는 데 사용할 수 있습니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_startup [--repeat 5] [--top 10] [--budget-ms 0]
+'''
+import argparse
+import importlib.util
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 기존 app.py의 최상위 import
+LEGACY_IMPORTS = [
+    'import streamlit as st',
+    'from streamlit_option_menu import option_menu',
+    'import pandas as pd',
+    'import numpy as np',
+    'import seaborn as sns',
+    'import matplotlib.pyplot as plt',
+    'import plotly.graph_objects as go',
+    'import plotly.express as px',
+    'from home import home',
+    'from survey import SurveyMatcher',
+    'from edu import EduMatcher',
+    'from work import JobMatcher',
+    'from board import BoardApp',
+    'from insight import insight',
+]
+
+# 메뉴별로 처음 불러오는 페이지 모듈
+PAGE_MODULES = ['home', 'survey', 'insight', 'edu', 'work', 'board']
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def installed(statement):
+    '''
+    import 문의 최상위 패키지가 설치되어 있는지 확인합니다.
+    '''
+    module = statement.split()[1].split('.')[0]
+    return importlib.util.find_spec(module) is not None
+
+
+def import_times(code):
+    '''
+    새 프로세스에서 code를 python -X importtime으로 실행하고, import된 모듈별 (자체 시간, 누적 시간, 깊이) 딕셔너리를 반환합니다.
+    시간 단위는 µs이며, 깊이 0이 최상위 import입니다 (하위 모듈의 시간은 누적 시간에 포함됨).
+    '''
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)), (len(match.group(3)) - 1) // 2)
+    return times
+
+
+def total_ms(times, startup):
+    '''
+    인터프리터 시작 시 불러오는 모듈(startup)을 제외한 최상위 import의 누적 시간(ms)을 반환합니다.
+    '''
+    return sum(cumulative for module, (_, cumulative, depth) in times.items()
+               if depth == 0 and module not in startup) / 1000
+
+
+def package_ms(times, startup):
+    '''
+    최상위 패키지별 자체 import 시간의 합(ms)을 반환합니다.
+    '''
+    packages = Counter()
+    for module, (self_time, _, _) in times.items():
+        if module not in startup:
+            packages[module.split('.')[0]] += self_time / 1000
+    return packages
+
+
+def measure(code, repeat, startup):
+    '''
+    repeat번 측정하여 전체 import 시간이 가장 짧은 실행의 결과를 반환합니다.
+    '''
+    return min((import_times(code) for _ in range(repeat)), key=lambda times: total_ms(times, startup))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='시나리오별 반복 횟수 (가장 빠른 실행을 사용)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 느린 패키지 수')
+    parser.add_argument('--budget-ms', type=float, default=0, help='app.py import 시간 상한(ms). 0이면 검사하지 않음')
+    args = parser.parse_args()
+
+    legacy_imports = [statement for statement in LEGACY_IMPORTS if installed(statement)]
+    skipped = [statement for statement in LEGACY_IMPORTS if statement not in legacy_imports]
+
+    startup = set(import_times('pass'))
+    scenarios = [('legacy', '\n'.join(legacy_imports)), ('app.py', 'import app')]
+    scenarios += [(f'app.py + {module}', f'import app\nimport {module}') for module in PAGE_MODULES]
+    results = {name: measure(code, args.repeat, startup) for name, code in scenarios}
+
+    if skipped:
+        print(f'legacy: skipped (not installed): {", ".join(skipped)}')
+    print(f'{"scenario":<22}{"import ms":>12}')
+    for name, times in results.items():
+        print(f'{name:<22}{total_ms(times, startup):>12.1f}')
+
+    for name in ('legacy', 'app.py'):
+        print(f'\nslowest packages ({name}, self time)')
+        for package, ms in package_ms(results[name], startup).most_common(args.top):
+            print(f'{package:<30}{ms:>10.1f} ms')
+
+    app_ms = total_ms(results['app.py'], startup)
+    if args.budget_ms and app_ms > args.budget_ms:
+        print(f'\napp.py import time {app_ms:.1f} ms exceeds budget {args.budget_ms:.1f} ms')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+'''
+설문 응답 → 직업 점수 계산의 지연시간을 비교하는 벤치마크.
+
+기존 방식(tag_to_jobs를 isin으로 필터링한 뒤 groupby().count()와 정렬)과
+TagScorer(직업×태그 희소 행렬-벡터 곱과 argpartition)를 합성 데이터에서 비교합니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_tag_scoring [--jobs 50000] [--tags 5000] [--tags-per-job 20]
+'''
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from tag_scoring import TagScorer
+
+
+def make_tag_to_jobs(n_jobs, n_tags, tags_per_job, seed=0):
+    '''
+    직업마다 tags_per_job개의 태그를 가진 합성 tag_to_jobs 데이터를 만듭니다.
+    '''
+    rng = np.random.default_rng(seed)
+    job_ids = np.repeat(np.arange(n_jobs), tags_per_job)
+    tag_ids = rng.integers(0, n_tags, size=len(job_ids)) + 1000
+    return pd.DataFrame({'id_jobs': job_ids, 'id_tag': tag_ids}).drop_duplicates()
+
+
+def pandas_scores(tag_to_jobs_df, selected_tags):
+    '''
+    기존 SurveyMatcher.display_matched_jobs()의 점수 계산 방식.
+    '''
+    return tag_to_jobs_df[tag_to_jobs_df['id_tag'].isin(selected_tags)].groupby('id_jobs')['id_tag'].count() \
+        .reset_index(name='match_count').sort_values(by='match_count', ascending=False)
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=50000)
+    parser.add_argument('--tags', type=int, default=5000)
+    parser.add_argument('--tags-per-job', type=int, default=20)
+    parser.add_argument('--selected', type=int, default=12, help='응답 하나에서 선택한 태그 수')
+    parser.add_argument('--batch', type=int, default=1000, help='일괄 점수 계산할 응답 수')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    tag_to_jobs_df = make_tag_to_jobs(args.jobs, args.tags, args.tags_per_job)
+    rng = np.random.default_rng(1)
+    responses = [list(rng.choice(args.tags, args.selected, replace=False) + 1000) for _ in range(args.batch)]
+
+    start = time.perf_counter()
+    scorer = TagScorer.from_frame(tag_to_jobs_df)
+    print(f'{len(tag_to_jobs_df)} job-tag pairs, matrix built in {(time.perf_counter() - start) * 1000:.1f} ms')
+
+    pandas_ms, expected = timed(lambda: pandas_scores(tag_to_jobs_df, responses[0]), args.repeat)
+    sparse_ms, (top_ids, top_scores) = timed(lambda: scorer.top_k(scorer.score(responses[0]), 10), args.repeat)
+    batch_ms, batch_scores = timed(lambda: scorer.score_batch(responses), max(1, args.repeat // 10))
+
+    # 두 방식의 최고 점수가 같은지 확인
+    assert top_scores[0] == expected['match_count'].iloc[0]
+    assert np.array_equal(batch_scores[0], scorer.score(responses[0]))
+
+    print(f'pandas isin+groupby+sort : {pandas_ms:8.3f} ms / response')
+    print(f'sparse mat-vec + top-k   : {sparse_ms:8.3f} ms / response')
+    print(f'sparse batch ({args.batch} responses): {batch_ms:8.3f} ms total, {batch_ms / args.batch:.4f} ms / response')
+
+
+if __name__ == '__main__':
+    main()
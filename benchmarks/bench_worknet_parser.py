@@ -0,0 +1,224 @@
+'''
+워크넷 목록 페이지 한 장의 공고 추출 시간을 비교하는 벤치마크.
+
+기존 crawling_works.crawling()은 공고마다 선택자 7개로 find_elements를 호출하고, 찾은 요소마다 .text나
+get_attribute를 다시 호출합니다. 이 호출들은 모두 WebDriver 왕복(IPC)입니다.
+이 벤치마크는 합성 목록 페이지를 lxml로 파싱한 트리 위에서 같은 호출 순서를 재현하되, 호출마다 --roundtrip-ms만큼
+지연을 넣어 WebDriver 왕복 비용을 흉내 냅니다. 이를 page_parser.parse_worknet_listing()의
+page_source 한 번 + 단일 파싱 방식과 비교하고, 두 방식의 추출 결과가 같은지 확인합니다.
+
+측정 전에 저장해 둔 워크넷 목록 페이지(fixtures/worknet_listing.html)를 두 방식으로 추출하여
+fixtures/worknet_listing.json의 기대 공고와 같은지 확인합니다. --browser를 주면 같은 페이지를
+crawling_works.BrowserFetcher(headless Chrome)로 열어 가져온 page_source도 확인합니다.
+--capture URL을 주면 실제 워크넷 목록 페이지를 BrowserFetcher로 저장하여 두 파일을 새로 만듭니다.
+
+실행 (저장소 최상위 경로에서) :
+    python -m benchmarks.bench_worknet_parser [--pages 20] [--roundtrip-ms 1.0] [--browser] [--capture URL]
+'''
+import argparse
+import json
+import os
+import pathlib
+import time
+
+import lxml.html
+
+from page_parser import element_text, parse_worknet_listing
+
+BASE_URL = 'https://www.work.go.kr/empInfo/empInfoSrch/list/dtlEmpSrchList.do'
+FIXTURE_HTML = os.path.join(os.path.dirname(__file__), 'fixtures', 'worknet_listing.html')
+FIXTURE_ROWS = os.path.join(os.path.dirname(__file__), 'fixtures', 'worknet_listing.json')
+
+
+def make_listing_page(page, how_many=10, filler_blocks=300):
+    '''
+    워크넷 목록 페이지와 같은 구조의 합성 HTML을 만듭니다. 머리글/바닥글 등 목록 외 요소를 filler_blocks개 넣습니다.
+    '''
+    filler = ''.join(f'<div class="menu"><a href="/m/{k}">메뉴 {k}</a><span>안내 문구 {k}</span></div>'
+                     for k in range(filler_blocks))
+    rows = ''.join(f'''
+        <tr id="list{i}">
+          <td><input type="checkbox" value="{page}-{i}"></td>
+          <td><a href="/company/{page}{i}">주식회사 회사{page}-{i}</a><br><span>중소기업</span></td>
+          <td><div class="cp-info-in">
+              <div><a href="/empInfo/detail.do?wantedAuthNo={page}{i}">  데이터 분석가 채용 {i}  </a></div>
+              <p id="jobContLine{i}">데이터 수집, 정제 및 시각화 업무
+                 <em>파이썬</em> 우대</p>
+              <p>경력 무관 | 대졸 이상 | 서울 강남구</p>
+          </div></td>
+          <td><div><p>연봉 3,000만원 이상</p><p>정규직</p></div></td>
+          <td><div><p>등록 24/03/0{i % 9 + 1}</p><p>마감일 24/04/{i + 10}</p></div></td>
+        </tr>''' for i in range(1, how_many + 1))
+    return f'<html><head><title>채용정보</title></head><body>{filler}<table><tbody>{rows}</tbody></table>{filler}</body></html>'
+
+
+class RoundTripElement:
+    '''
+    호출마다 WebDriver 왕복 지연을 넣는 WebElement 대역.
+    '''
+    def __init__(self, element, driver):
+        self.element = element
+        self.driver = driver
+
+    @property
+    def text(self):
+        self.driver.roundtrip()
+        return element_text(self.element)
+
+    def get_attribute(self, name):
+        self.driver.roundtrip()
+        value = self.element.get(name)
+        return self.driver.absolute(value) if name == 'href' and value is not None else value
+
+
+class RoundTripDriver:
+    '''
+    lxml 트리 위에서 find_elements를 실행하고, 호출마다 WebDriver 왕복 지연을 넣는 WebDriver 대역.
+    '''
+    def __init__(self, html, url, roundtrip_ms):
+        self.document = lxml.html.fromstring(html)
+        self.current_url = url
+        self.delay = roundtrip_ms / 1000
+        self.calls = 0
+
+    def roundtrip(self):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+
+    def absolute(self, href):
+        return lxml.html.urljoin(self.current_url, href)
+
+    def find_elements(self, xpath):
+        self.roundtrip()
+        return [RoundTripElement(element, self) for element in self.document.xpath(xpath)]
+
+
+def legacy_crawling(driver, how_many=10):
+    '''
+    기존 crawling_works.crawling()과 같은 호출 순서의 추출. CSS 선택자는 같은 요소를 고르는 XPath로 바꿨습니다.
+    '''
+    columns = {name: [] for name in ['work_company', 'recruit', 'job_describ_1', 'job_describ_2', 'condition', 'date', 'link']}
+    for i in range(1, how_many + 1):
+        company_elements = driver.find_elements(f'//*[@id="list{i}"]/td[2]/a')
+        if not company_elements:
+            company_elements = driver.find_elements(f'//*[@id="list{i}"]/td[2]')
+        recruit_elements = driver.find_elements(f'//*[@id="list{i}"]/*[3][self::td]/div/div/a')
+        jd_1_elements = driver.find_elements(f'//*[@id="jobContLine{i}"]')
+        jd_2_elements = driver.find_elements(f'//*[@id="list{i}"]/*[3][self::td]/div/*[3][self::p]')
+        condition_elements = driver.find_elements(f'//*[@id="list{i}"]/*[4][self::td]/div')
+        date_elements = driver.find_elements(f'//*[@id="list{i}"]/*[5][self::td]/div/*[2][self::p]')
+        link_elements = driver.find_elements(f'//*[@id="list{i}"]/*[3][self::td]/div/div/a')
+
+        columns['work_company'] += [element.text.split('\n')[0] for element in company_elements]
+        columns['recruit'] += [element.text for element in recruit_elements]
+        columns['job_describ_1'] += [element.text for element in jd_1_elements]
+        columns['job_describ_2'] += [element.text for element in jd_2_elements]
+        columns['condition'] += [element.text for element in condition_elements]
+        columns['date'] += [element.text for element in date_elements]
+        columns['link'] += [element.get_attribute('href') for element in link_elements]
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def load_fixture():
+    '''
+    저장해 둔 워크넷 목록 페이지와 기대 공고를 읽습니다.
+
+    반환값 :
+        html(str) : 목록 페이지 HTML
+        url(str) : 페이지를 저장한 URL (상대 링크의 기준)
+        rows(list) : 기대 공고 딕셔너리 리스트
+    '''
+    with open(FIXTURE_HTML, encoding='utf-8') as f:
+        html = f.read()
+    with open(FIXTURE_ROWS, encoding='utf-8') as f:
+        expected = json.load(f)
+    return html, expected['url'], expected['rows']
+
+
+def check_fixture(browser=False):
+    '''
+    저장해 둔 워크넷 목록 페이지에서 두 추출 방식의 결과가 기대 공고와 같은지 확인합니다.
+    browser가 참이면 BrowserFetcher로 페이지를 연 뒤 가져온 page_source도 확인합니다.
+    '''
+    html, url, expected = load_fixture()
+    assert parse_worknet_listing(html, base_url=url) == expected
+    assert legacy_crawling(RoundTripDriver(html, url, 0)) == expected
+    if browser:
+        # selenium과 Chrome이 있어야 하므로 필요할 때만 불러옴
+        from crawling_works import BrowserFetcher
+
+        fetcher = BrowserFetcher(driver_path=None)
+        try:
+            page_source = fetcher(pathlib.Path(FIXTURE_HTML).resolve().as_uri())
+        finally:
+            fetcher.close()
+        assert parse_worknet_listing(page_source, base_url=url) == expected
+    return len(expected)
+
+
+def capture_fixture(url):
+    '''
+    실제 워크넷 목록 페이지를 BrowserFetcher로 열어 fixture HTML과 기대 공고 JSON을 새로 저장합니다.
+    기대 공고는 현재 파서의 추출 결과이므로, 저장한 뒤 페이지와 대조하여 검토해야 합니다.
+    '''
+    from crawling_works import BrowserFetcher
+
+    fetcher = BrowserFetcher(driver_path=None)
+    try:
+        html = fetcher(url)
+    finally:
+        fetcher.close()
+    rows = parse_worknet_listing(html, base_url=url)
+    with open(FIXTURE_HTML, 'w', encoding='utf-8') as f:
+        f.write(html)
+    with open(FIXTURE_ROWS, 'w', encoding='utf-8') as f:
+        json.dump({'url': url, 'rows': rows}, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=20, help='추출할 페이지 수')
+    parser.add_argument('--roundtrip-ms', type=float, default=1.0, help='WebDriver 호출 한 번의 왕복 지연(ms)')
+    parser.add_argument('--browser', action='store_true', help='저장한 페이지를 BrowserFetcher로도 열어 확인 (selenium, Chrome 필요)')
+    parser.add_argument('--capture', metavar='URL', help='이 워크넷 목록 페이지를 BrowserFetcher로 저장하여 fixture를 새로 만듦')
+    args = parser.parse_args()
+
+    if args.capture:
+        print(f'captured {capture_fixture(args.capture)} postings -> {FIXTURE_HTML}')
+        return
+    print(f'fixture: {check_fixture(args.browser)} postings match {os.path.basename(FIXTURE_ROWS)}')
+
+    pages = [make_listing_page(page) for page in range(args.pages)]
+
+    legacy_total = 0.0
+    calls = 0
+    expected = []
+    for html in pages:
+        # 기존 방식은 브라우저가 이미 만든 DOM에서 시작하므로 트리 생성은 측정에서 제외
+        driver = RoundTripDriver(html, BASE_URL, args.roundtrip_ms)
+        start = time.perf_counter()
+        expected.append(legacy_crawling(driver))
+        legacy_total += time.perf_counter() - start
+        calls += driver.calls
+
+    start = time.perf_counter()
+    # page_source 한 번 가져오기(왕복 1회) + 단일 파싱
+    results = []
+    for html in pages:
+        if args.roundtrip_ms:
+            time.sleep(args.roundtrip_ms / 1000)
+        results.append(parse_worknet_listing(html, base_url=BASE_URL))
+    single_total = time.perf_counter() - start
+    assert results == expected
+
+    print(f'{args.pages} pages, {args.roundtrip_ms} ms per WebDriver call')
+    print(f'{"mode":<22}{"ms/page":>10}{"calls/page":>12}')
+    print(f'{"per-selector (legacy)":<22}{legacy_total / args.pages * 1000:>10.2f}{calls / args.pages:>12.0f}')
+    print(f'{"page_source + lxml":<22}{single_total / args.pages * 1000:>10.2f}{1:>12}')
+
+
+if __name__ == '__main__':
+    main()
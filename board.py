@@ -1,15 +1,28 @@
-import streamlit as st
 import sqlite3
 
+import streamlit as st
+from db_pool import get_connection_manager
+from like_counter import get_like_counter
+
 class BoardApp:
     '''
     Streamlit과 SQLite를 사용하여 구현된 간단한 커뮤니티 게시판 애플리케이션.
 
     사용자는 게시글을 작성, 조회, 수정, 삭제할 수 있으며, 각 게시글에 대해 댓글을 달고 좋아요를 할 수 있습니다.
     게시글과 댓글 데이터는 SQLite 데이터베이스에 저장됩니다.
+    DB 연결은 프로세스 전체에서 공유하는 ConnectionManager(db_pool.py)가 관리하며,
+    읽기는 스레드별 연결, 쓰기는 WAL 모드의 쓰기 트랜잭션으로 처리합니다.
+    게시글(제목, 내용)과 댓글(내용)은 트리거로 동기화되는 FTS5 trigram 인덱스(posts_fts, comments_fts)로 검색합니다.
+    게시글의 댓글 수는 트리거가 갱신하는 posts.comment_count 열에 저장하여, 목록을 한 번의 조회로 표시합니다.
+    좋아요는 프로세스 전체에서 공유하는 LikeCounter(like_counter.py)가 메모리에 모았다가 주기적으로 한 번에 저장합니다.
 
     속성:
         db_path (str): SQLite 데이터베이스 파일의 경로.
+        db (ConnectionManager): DB 연결 관리자.
+        like_counter (LikeCounter): 좋아요 증가분을 모아 저장하는 버퍼.
+        page_size (int): 게시글 목록 한 페이지에 표시할 게시글 수.
+        comment_page_size (int): 게시글 상세 페이지에 한 번에 표시할 댓글 수.
+        fts_enabled (bool): FTS5 검색 인덱스 사용 가능 여부. SQLite가 FTS5 trigram을 지원하지 않으면 LIKE 검색을 사용합니다.
     
     메서드:
         initialize_db(): 데이터베이스 및 필요한 테이블을 초기화합니다.
@@ -17,8 +30,12 @@ class BoardApp:
         update_comment(comment_id, content): 주어진 ID의 댓글을 업데이트합니다.
         like_post(post_id): 주어진 ID의 게시글에 좋아요를 추가합니다.
         like_comment(comment_id): 주어진 ID의 댓글에 좋아요를 추가합니다.
+        get_likes(kind, item_id): 아직 저장되지 않은 좋아요까지 포함한 좋아요 수를 반환합니다.
         get_comment_count(post_id): 주어진 ID의 게시글에 대한 댓글 수를 반환합니다.
-        search_posts(keyword): 제목에 주어진 키워드가 포함된 게시글을 검색합니다.
+        list_posts(before_id, limit): 주어진 ID보다 오래된 게시글을 최신순으로 limit개 반환합니다.
+        list_comments(post_id, after_id, limit): 주어진 게시글의 댓글을 작성순으로 limit개 반환합니다.
+        search_posts(keyword, after, limit): 제목, 내용, 댓글에 주어진 키워드가 포함된 게시글을 관련도순으로 검색합니다.
+        search_truncated(keyword): 관련도순 검색이 최근 일치 결과로 제한되는지 확인합니다.
         add_post(title, content): 새 게시글을 추가합니다.
         add_comment(post_id, content): 새 댓글을 추가합니다.
         delete_post(post_id): 주어진 ID의 게시글을 삭제합니다.
@@ -27,35 +44,141 @@ class BoardApp:
         run(): 애플리케이션의 메인 루프를 실행합니다.
     '''
 
+    page_size = 20
+    comment_page_size = 50
+
+    # 게시글 검색 시 제목 일치를 내용보다 크게 반영하는 BM25 가중치(제목, 내용)와 댓글 일치 점수의 비율
+    title_weight = 10.0
+    content_weight = 1.0
+    comment_weight = 0.5
+
+    # trigram 토크나이저는 3글자 이상만 인덱스로 찾을 수 있음
+    min_fts_keyword_length = 3
+
+    # 검색 결과를 BM25로 정렬할 최근 일치 게시글/댓글 수
+    # 전체 일치 결과를 정렬하면 대부분의 글에 나오는 키워드는 10만 개 게시글에서 0.7초 이상 걸림 (benchmarks/bench_board_search.py)
+    search_candidates = 1000
+
     def __init__(self, db_path='./db/bulletin_board.db'):
         '''
-        BoardApp 클래스의 인스턴스를 초기화하고, DB연결을 설정
+        BoardApp 클래스의 인스턴스를 초기화하고, 공유 DB 연결 관리자를 가져옵니다.
         
         매개변수 : 
             db_path(str) : SQLite DB 파일의 경로
         '''
         self.db_path = db_path
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.c = self.conn.cursor()
-        self.initialize_db()
-
-    def initialize_db(self):
+        self.db = get_connection_manager(self.db_path)
+        self.db.initialize(self.initialize_db)
+        self.like_counter = get_like_counter(self.db_path)
+        self.fts_enabled = self.db.read_one(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name IN ('posts_fts', 'comments_fts')")[0] == 2
+
+    @staticmethod
+    def initialize_db(conn):
         '''
-        DB에 필요한 테이블을 초기화합니다.
+        DB에 필요한 테이블을 초기화합니다. 연결 관리자를 통해 프로세스당 한 번만 실행됩니다.
+
+        매개변수:
+            conn (sqlite3.Connection): 쓰기 트랜잭션이 열린 DB 연결.
         '''
-        self.c.execute('''CREATE TABLE IF NOT EXISTS posts (
+        conn.execute('''CREATE TABLE IF NOT EXISTS posts (
             id INTEGER PRIMARY KEY, 
             title TEXT, 
             content TEXT, 
             likes INTEGER DEFAULT 0
         )''')
-        self.c.execute('''CREATE TABLE IF NOT EXISTS comments (
+        conn.execute('''CREATE TABLE IF NOT EXISTS comments (
             id INTEGER PRIMARY KEY,
             post_id INTEGER, 
             content TEXT, 
             likes INTEGER DEFAULT 0
         )''')
-        self.conn.commit()
+        BoardApp.initialize_comment_counts(conn)
+        BoardApp.initialize_search_index(conn)
+
+    @staticmethod
+    def initialize_comment_counts(conn):
+        '''
+        게시글별 댓글 수 열(posts.comment_count)과 댓글 조회 인덱스, 댓글 수를 갱신하는 트리거를 만듭니다.
+
+        댓글이 추가/삭제되거나 다른 게시글로 옮겨지면 트리거가 같은 트랜잭션 안에서 댓글 수를 갱신하므로,
+        게시글 목록은 댓글 테이블을 읽지 않고 댓글 수를 함께 조회할 수 있습니다.
+        comment_count 열이 없던 기존 DB는 열을 추가하고 지금까지의 댓글 수로 채웁니다.
+
+        매개변수:
+            conn (sqlite3.Connection): 쓰기 트랜잭션이 열린 DB 연결.
+        '''
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_comments_post ON comments (post_id, id)')
+
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(posts)')}
+        if 'comment_count' not in columns:
+            conn.execute('ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0')
+            conn.execute('UPDATE posts SET comment_count = (SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id)')
+
+        conn.execute('''CREATE TRIGGER IF NOT EXISTS comments_count_insert AFTER INSERT ON comments BEGIN
+            UPDATE posts SET comment_count = comment_count + 1 WHERE id = new.post_id;
+        END''')
+        conn.execute('''CREATE TRIGGER IF NOT EXISTS comments_count_delete AFTER DELETE ON comments BEGIN
+            UPDATE posts SET comment_count = comment_count - 1 WHERE id = old.post_id;
+        END''')
+        conn.execute('''CREATE TRIGGER IF NOT EXISTS comments_count_update AFTER UPDATE OF post_id ON comments
+        WHEN old.post_id IS NOT new.post_id BEGIN
+            UPDATE posts SET comment_count = comment_count - 1 WHERE id = old.post_id;
+            UPDATE posts SET comment_count = comment_count + 1 WHERE id = new.post_id;
+        END''')
+
+    @staticmethod
+    def initialize_search_index(conn):
+        '''
+        게시글과 댓글의 FTS5 검색 인덱스와 동기화 트리거를 만듭니다.
+
+        인덱스는 원본 테이블을 content로 참조하는 external content 테이블이라 텍스트를 중복 저장하지 않으며,
+        INSERT/UPDATE/DELETE 트리거가 같은 트랜잭션 안에서 인덱스를 갱신합니다.
+        한국어는 형태소 분석 없이도 부분 문자열로 찾을 수 있도록 trigram 토크나이저를 사용합니다.
+        인덱스를 처음 만들 때는 기존 게시글과 댓글로 인덱스를 다시 채웁니다.
+        SQLite가 FTS5 trigram을 지원하지 않으면(3.34 미만) 인덱스를 만들지 않습니다.
+
+        매개변수:
+            conn (sqlite3.Connection): 쓰기 트랜잭션이 열린 DB 연결.
+        '''
+        existing = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE name IN ('posts_fts', 'comments_fts')")}
+        try:
+            conn.execute('''CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+                title, content, content='posts', content_rowid='id', tokenize='trigram'
+            )''')
+            conn.execute('''CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(
+                content, content='comments', content_rowid='id', tokenize='trigram'
+            )''')
+        except sqlite3.OperationalError:
+            return
+
+        conn.execute('''CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+            INSERT INTO posts_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+        END''')
+        conn.execute('''CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+            INSERT INTO posts_fts (posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        END''')
+        conn.execute('''CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF title, content ON posts BEGIN
+            INSERT INTO posts_fts (posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+            INSERT INTO posts_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+        END''')
+        conn.execute('''CREATE TRIGGER IF NOT EXISTS comments_fts_insert AFTER INSERT ON comments BEGIN
+            INSERT INTO comments_fts (rowid, content) VALUES (new.id, new.content);
+        END''')
+        conn.execute('''CREATE TRIGGER IF NOT EXISTS comments_fts_delete AFTER DELETE ON comments BEGIN
+            INSERT INTO comments_fts (comments_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        END''')
+        conn.execute('''CREATE TRIGGER IF NOT EXISTS comments_fts_update AFTER UPDATE OF content ON comments BEGIN
+            INSERT INTO comments_fts (comments_fts, rowid, content) VALUES ('delete', old.id, old.content);
+            INSERT INTO comments_fts (rowid, content) VALUES (new.id, new.content);
+        END''')
+
+        # 인덱스가 없던 기존 DB는 지금까지의 게시글/댓글로 인덱스를 채움
+        if 'posts_fts' not in existing:
+            conn.execute("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')")
+        if 'comments_fts' not in existing:
+            conn.execute("INSERT INTO comments_fts (comments_fts) VALUES ('rebuild')")
 
     def update_post(self, post_id, title, content):
         '''
@@ -66,8 +189,8 @@ class BoardApp:
             title (str): 게시글의 새 제목.
             content (str): 게시글의 새 내용.
         '''
-        self.c.execute("UPDATE posts SET title=?, content=? WHERE id=?", (title, content, post_id))
-        self.conn.commit()
+        with self.db.write() as conn:
+            conn.execute("UPDATE posts SET title=?, content=? WHERE id=?", (title, content, post_id))
 
     def update_comment(self, comment_id, content):
         """
@@ -77,31 +200,48 @@ class BoardApp:
             comment_id (int): 업데이트할 댓글의 ID.
             content (str): 댓글의 새 내용.
         """
-        self.c.execute("UPDATE comments SET content=? WHERE id=?", (content, comment_id))
-        self.conn.commit()
+        with self.db.write() as conn:
+            conn.execute("UPDATE comments SET content=? WHERE id=?", (content, comment_id))
 
     def like_post(self, post_id):
         """
-        특정 게시글의 좋아요 수를 증가시킵니다.
+        특정 게시글의 좋아요 수를 증가시킵니다. 증가분은 LikeCounter가 모아서 저장합니다.
 
         매개변수:
             post_id (int): 좋아요를 추가할 게시글의 ID.
         """
-        self.c.execute("UPDATE posts SET likes = likes + 1 WHERE id=?", (post_id,))
-        self.conn.commit()
+        self.like_counter.add('posts', post_id)
         self.rerun_if_possible()
 
     def like_comment(self, comment_id):
         """
-        특정 댓글의 좋아요 수를 증가시킵니다.
+        특정 댓글의 좋아요 수를 증가시킵니다. 증가분은 LikeCounter가 모아서 저장합니다.
 
         매개변수:
             comment_id (int): 좋아요를 추가할 댓글의 ID.
         """
-        self.c.execute("UPDATE comments SET likes = likes + 1 WHERE id=?", (comment_id,))
-        self.conn.commit()
+        self.like_counter.add('comments', comment_id)
         self.rerun_if_possible()
 
+    def get_likes(self, kind, item_id):
+        """
+        DB에 저장된 좋아요 수에 아직 저장되지 않은 증가분을 더해 반환합니다.
+        좋아요를 누른 직후에도 사용자가 자신의 좋아요가 반영된 값을 보게 합니다.
+
+        매개변수:
+            kind (str): 좋아요 대상 종류 ('posts' 또는 'comments').
+            item_id (int): 게시글 또는 댓글의 ID.
+
+        반환값:
+            int: 화면에 표시할 좋아요 수.
+        """
+        if kind not in ('posts', 'comments'):
+            raise ValueError(f'알 수 없는 좋아요 대상입니다: {kind}')
+        # 저장 중인 증가분이 빠지지 않도록 메모리의 증가분을 DB보다 먼저 읽음
+        pending = self.like_counter.pending(kind, item_id)
+        row = self.db.read_one(f"SELECT likes FROM {kind} WHERE id=?", (item_id,))
+        return (row[0] if row else 0) + pending
+
     def get_comment_count(self, post_id):
         """
         특정 게시글에 달린 댓글의 수를 반환합니다.
@@ -110,21 +250,140 @@ class BoardApp:
             post_id (int): 댓글 수를 조회할 게시글의 ID.
 
         반환값:
-            int: 해당 게시글에 달린 댓글의 총 수.
+            int: 해당 게시글에 달린 댓글의 총 수. 게시글이 없으면 0.
         """
-        return self.c.execute("SELECT COUNT(*) FROM comments WHERE post_id=?", (post_id,)).fetchone()[0]
+        row = self.db.read_one("SELECT comment_count FROM posts WHERE id=?", (post_id,))
+        return row[0] if row else 0
 
-    def search_posts(self, keyword):
+    def list_posts(self, before_id=None, limit=None):
         """
-        제목에 주어진 키워드가 포함된 게시글을 검색합니다.
+        주어진 ID보다 오래된 게시글을 최신순으로 limit개 반환합니다 (keyset 페이지네이션).
+        기본키 인덱스를 before_id부터 거꾸로 읽으므로 전체 게시글 수와 관계없이 limit개만 읽습니다.
+
+        매개변수:
+            before_id (int): 이전 페이지의 마지막 게시글 ID. None이면 가장 최신 게시글부터.
+            limit (int): 반환할 최대 게시글 수. None이면 page_size.
+
+        반환값:
+            list of tuples: 게시글의 ID, 제목, 댓글 수를 포함하는 튜플의 리스트.
+        """
+        if before_id is None:
+            return self.db.read("SELECT id, title, comment_count FROM posts ORDER BY id DESC LIMIT ?",
+                                (limit or self.page_size,))
+        return self.db.read("SELECT id, title, comment_count FROM posts WHERE id < ? ORDER BY id DESC LIMIT ?",
+                            (before_id, limit or self.page_size))
+
+    def list_comments(self, post_id, after_id=None, limit=None):
+        """
+        주어진 게시글의 댓글 중 after_id 이후에 작성된 댓글을 작성순으로 limit개 반환합니다 (keyset 페이지네이션).
+        comments(post_id, id) 인덱스를 따라 읽으므로 게시글의 댓글 수와 관계없이 limit개만 읽습니다.
+
+        매개변수:
+            post_id (int): 댓글을 조회할 게시글의 ID.
+            after_id (int): 이전 페이지의 마지막 댓글 ID. None이면 첫 댓글부터.
+            limit (int): 반환할 최대 댓글 수. None이면 comment_page_size.
+
+        반환값:
+            list of tuples: 댓글의 ID, 내용, 좋아요 수를 포함하는 튜플의 리스트.
+        """
+        return self.db.read("SELECT id, content, likes FROM comments WHERE post_id = ? AND id > ? ORDER BY id LIMIT ?",
+                            (post_id, after_id or 0, limit or self.comment_page_size))
+
+    def search_posts(self, keyword, after=None, limit=None):
+        """
+        제목, 내용 또는 댓글에 주어진 키워드가 포함된 게시글을 관련도순으로 limit개 검색합니다 (keyset 페이지네이션).
+
+        FTS5 인덱스를 사용할 수 있으면 BM25 점수로 정렬하며, 제목 일치에 가장 큰 가중치를 주고
+        댓글에서만 일치한 게시글은 점수를 낮춥니다. 관련도가 같으면 최신 게시글이 먼저 옵니다.
+        대부분의 게시글에 나오는 흔한 키워드도 일정한 시간 안에 검색하도록,
+        게시글과 댓글 각각 가장 최근에 일치한 search_candidates개만 정렬 대상으로 삼습니다 (search_truncated() 참고).
+        키워드가 trigram보다 짧거나(2글자 이하) FTS5를 사용할 수 없으면 제목과 내용을 LIKE로 최신 게시글부터 검색하여,
+        한 페이지를 채우는 즉시 검색을 멈춥니다. 이때 점수는 모두 0입니다.
+        다음 페이지는 이전 페이지 마지막 결과의 (점수, 게시글 ID) 뒤부터 읽으므로, 앞 페이지의 결과를 다시 건너뛰지 않습니다.
 
         매개변수:
             keyword (str): 검색할 키워드.
+            after (tuple): 이전 페이지 마지막 결과의 (점수, 게시글 ID). None이면 첫 페이지.
+            limit (int): 반환할 최대 게시글 수. None이면 page_size.
 
         반환값:
-            list of tuples: 검색 결과에 해당하는 게시글의 ID와 제목을 포함하는 튜플의 리스트.
+            list of tuples: 검색 결과에 해당하는 게시글의 ID, 제목, 댓글 수, 점수(작을수록 관련도가 높음)를 포함하는 튜플의 리스트.
+        """
+        limit = limit or self.page_size
+        if not self.uses_fts(keyword):
+            pattern = '%' + keyword + '%'
+            if after is None:
+                return self.db.read("SELECT id, title, comment_count, 0.0 FROM posts "
+                                    "WHERE title LIKE ? OR content LIKE ? ORDER BY id DESC LIMIT ?", (pattern, pattern, limit))
+            return self.db.read("SELECT id, title, comment_count, 0.0 FROM posts "
+                                "WHERE (title LIKE ? OR content LIKE ?) AND id < ? ORDER BY id DESC LIMIT ?",
+                                (pattern, pattern, after[1], limit))
+
+        # 키워드 전체를 하나의 구문으로 검색 (FTS5 쿼리 문법 문자는 구문 안에서 그대로 취급됨)
+        # 흔한 키워드도 빠르게 찾도록 BM25 정렬은 가장 최근에 일치한 search_candidates개 안에서만 수행
+        params = {'query': self.fts_phrase(keyword), 'candidates': self.search_candidates,
+                  'title_weight': self.title_weight, 'content_weight': self.content_weight,
+                  'comment_weight': self.comment_weight, 'limit': limit}
+        cursor = ''
+        if after is not None:
+            cursor = 'HAVING MIN(m.score) > :after_score OR (MIN(m.score) = :after_score AND p.id < :after_id)'
+            params.update(after_score=after[0], after_id=after[1])
+        return self.db.read(f"""SELECT p.id, p.title, p.comment_count, MIN(m.score)
+            FROM (
+                SELECT rowid AS post_id, bm25(posts_fts, :title_weight, :content_weight) AS score
+                FROM posts_fts
+                WHERE posts_fts MATCH :query AND rowid >= (
+                    SELECT MIN(rowid) FROM (SELECT rowid FROM posts_fts WHERE posts_fts MATCH :query
+                                            ORDER BY rowid DESC LIMIT :candidates))
+                UNION ALL
+                SELECT c.post_id, f.score * :comment_weight
+                FROM (
+                    SELECT rowid AS comment_id, bm25(comments_fts) AS score
+                    FROM comments_fts
+                    WHERE comments_fts MATCH :query AND rowid >= (
+                        SELECT MIN(rowid) FROM (SELECT rowid FROM comments_fts WHERE comments_fts MATCH :query
+                                                ORDER BY rowid DESC LIMIT :candidates))
+                ) f
+                JOIN comments c ON c.id = f.comment_id
+            ) m
+            JOIN posts p ON p.id = m.post_id
+            GROUP BY p.id
+            {cursor}
+            ORDER BY MIN(m.score), p.id DESC
+            LIMIT :limit""", params)
+
+    def uses_fts(self, keyword):
+        """
+        주어진 키워드를 FTS5 인덱스로 검색할 수 있는지 반환합니다.
+        """
+        return self.fts_enabled and len(keyword) >= self.min_fts_keyword_length
+
+    @staticmethod
+    def fts_phrase(keyword):
+        """
+        키워드 전체를 하나의 FTS5 구문으로 감쌉니다. 쿼리 문법 문자는 구문 안에서 그대로 취급됩니다.
+        """
+        return '"' + keyword.replace('"', '""') + '"'
+
+    def search_truncated(self, keyword):
+        """
+        키워드와 일치하는 게시글이나 댓글이 search_candidates개보다 많아, 관련도순 검색이 최근 일치 결과로 제한되는지 확인합니다.
+        각 인덱스에서 최근 일치 결과를 search_candidates + 1개까지만 읽습니다.
+
+        매개변수:
+            keyword (str): 검색할 키워드.
+
+        반환값:
+            bool: 오래된 일치 결과가 검색 대상에서 빠졌으면 True.
         """
-        return self.c.execute("SELECT id, title FROM posts WHERE title LIKE ? ORDER BY id DESC", ('%' + keyword + '%',)).fetchall()
+        if not self.uses_fts(keyword):
+            return False
+        params = {'query': self.fts_phrase(keyword), 'limit': self.search_candidates + 1}
+        counts = self.db.read_one("""SELECT
+            (SELECT COUNT(*) FROM (SELECT rowid FROM posts_fts WHERE posts_fts MATCH :query ORDER BY rowid DESC LIMIT :limit)),
+            (SELECT COUNT(*) FROM (SELECT rowid FROM comments_fts WHERE comments_fts MATCH :query ORDER BY rowid DESC LIMIT :limit))""",
+                                  params)
+        return max(counts) > self.search_candidates
 
     def add_post(self, title, content):
         """
@@ -134,8 +393,8 @@ class BoardApp:
             title (str): 게시글의 제목.
             content (str): 게시글의 내용.
         """
-        self.c.execute("INSERT INTO posts (title, content) VALUES (?, ?)", (title, content))
-        self.conn.commit()
+        with self.db.write() as conn:
+            conn.execute("INSERT INTO posts (title, content) VALUES (?, ?)", (title, content))
 
     def add_comment(self, post_id, content):
         """
@@ -145,8 +404,8 @@ class BoardApp:
             post_id (int): 댓글을 추가할 게시글의 ID.
             content (str): 댓글의 내용.
         """
-        self.c.execute("INSERT INTO comments (post_id, content) VALUES (?, ?)", (post_id, content))
-        self.conn.commit()
+        with self.db.write() as conn:
+            conn.execute("INSERT INTO comments (post_id, content) VALUES (?, ?)", (post_id, content))
 
     def delete_post(self, post_id):
         """
@@ -155,9 +414,9 @@ class BoardApp:
         매개변수:
             post_id (int): 삭제할 게시글의 ID.
         """
-        self.c.execute("DELETE FROM comments WHERE post_id=?", (post_id,))
-        self.c.execute("DELETE FROM posts WHERE id=?", (post_id,))
-        self.conn.commit()
+        with self.db.write() as conn:
+            conn.execute("DELETE FROM comments WHERE post_id=?", (post_id,))
+            conn.execute("DELETE FROM posts WHERE id=?", (post_id,))
 
     def delete_comment(self, comment_id):
         """
@@ -166,8 +425,8 @@ class BoardApp:
         매개변수:
             comment_id (int): 삭제할 댓글의 ID.
         """
-        self.c.execute("DELETE FROM comments WHERE id=?", (comment_id,))
-        self.conn.commit()
+        with self.db.write() as conn:
+            conn.execute("DELETE FROM comments WHERE id=?", (comment_id,))
 
     def rerun_if_possible(self):
         """
@@ -202,7 +461,7 @@ class BoardApp:
         매개변수:
             post_id (int): 수정할 게시글의 ID.
         """
-        post_details = self.c.execute("SELECT title, content FROM posts WHERE id = ?", (post_id,)).fetchone()
+        post_details = self.db.read_one("SELECT title, content FROM posts WHERE id = ?", (post_id,))
         if post_details:
             new_title = st.text_input("제목", post_details[0])
             new_content = st.text_area("내용", post_details[1])
@@ -218,15 +477,15 @@ class BoardApp:
         """
         특정 게시글과 관련된 상세 정보를 사용자에게 표시합니다.
 
-        게시글의 제목, 내용, 좋아요 수를 포함하여 사용자에게 보여주고, 게시글에 달린 댓글을 함께 표시합니다.
+        게시글의 제목과 내용을 사용자에게 보여주고, 게시글에 달린 댓글을 함께 표시합니다. (좋아요 수 표시는 주석 처리되어 있어 읽지 않습니다.)
         사용자는 '메인으로 돌아가기' 버튼을 통해 메인 페이지로 돌아갈 수 있습니다.
 
         매개변수:
             post_id (int): 상세 정보를 보여줄 게시글의 ID.
         """
-        post = self.c.execute("SELECT title, content, likes FROM posts WHERE id = ?", (post_id,)).fetchone()
+        post = self.db.read_one("SELECT title, content FROM posts WHERE id = ?", (post_id,))
         if post:
-            title, content, likes = post
+            title, content = post
             st.subheader(title)
             st.write(content)
             #st.write(f"Likes: {likes}")
@@ -255,19 +514,30 @@ class BoardApp:
         """
         특정 게시글에 달린 댓글을 표시합니다.
 
-        사용자는 이 메서드를 통해 게시글에 달린 모든 댓글을 확인할 수 있으며, 새 댓글을 추가할 수 있는 입력창이 제공됩니다.
+        댓글은 작성순으로 comment_page_size개씩 표시하며, '댓글 더 보기' 버튼으로 다음 댓글을 확인할 수 있습니다.
+        새 댓글을 추가할 수 있는 입력창이 제공됩니다.
         '댓글 올리기' 버튼을 클릭하여 새 댓글을 게시할 수 있습니다.
 
         매개변수:
             post_id (int): 댓글을 표시할 게시글의 ID.
         """
-        comments = self.c.execute("SELECT id, content, likes FROM comments WHERE post_id = ?", (post_id,)).fetchall()
+        # 게시글 목록과 같은 방식으로, 이전 페이지의 마지막 댓글 ID를 커서로 기억
+        cursors = st.session_state.setdefault('comment_cursors', {}).setdefault(post_id, [])
+        comments = self.list_comments(post_id, cursors[-1] if cursors else None, self.comment_page_size + 1)
+        has_more = len(comments) > self.comment_page_size
+        comments = comments[:self.comment_page_size]
         for comment_id, content, likes in comments:
             st.markdown(f"- {content} ")
             #if st.button("좋아요", key=f"like_comment_{comment_id}"):
             #    self.like_comment(comment_id)
             #    self.rerun_if_possible()
-            
+
+        col1, col2 = st.columns(2)
+        if cursors:
+            col1.button("처음 댓글부터", key=f"comment_first_{post_id}", on_click=cursors.clear)
+        if has_more:
+            col2.button("댓글 더 보기", key=f"comment_more_{post_id}", on_click=cursors.append, args=(comments[-1][0],))
+
         comment_content = st.text_area("댓글 작성하기", key=f"comment_{post_id}")
         if st.button("댓글 올리기"):
             if comment_content.strip():
@@ -304,20 +574,51 @@ class BoardApp:
         사용자는 이 메서드를 통해 '새 게시글 작성' 버튼을 클릭하여 게시글 작성 양식으로 이동할 수 있으며,
         게시글 검색 기능을 사용하여 특정 게시글을 찾을 수 있습니다. 검색 결과에 나타난 게시글 제목을 클릭하면,
         해당 게시글의 상세 페이지로 이동합니다.
+
+        게시글 목록은 page_size개씩 표시하며, '더 보기' 버튼으로 다음 페이지로 이동합니다.
+        게시글 목록의 페이지 위치는 이전 페이지의 마지막 게시글 ID(커서)로 기억하므로, 게시글이 아무리 많아도 한 번에 page_size개만 읽습니다.
+        검색 결과는 관련도순으로 표시하며, 페이지 위치는 이전 페이지 마지막 결과의 (점수, 게시글 ID)로 기억합니다.
+        일치 결과가 많아 최근 search_candidates개 안에서만 정렬한 경우에는 그 사실을 함께 알립니다.
         """
         st.markdown('<h1 style = "color : #2ec4b6; font-size : 50px; text-align : left;">커뮤니티</h1>', unsafe_allow_html=True)
         if st.button("새 게시글 작성"):
             st.session_state['current_view'] = 'add_post'
         search_keyword = st.text_input("게시물 검색")
+
+        # 검색어가 바뀌면 첫 페이지부터 다시 표시
+        if st.session_state.get('board_search_keyword') != search_keyword:
+            st.session_state['board_search_keyword'] = search_keyword
+            st.session_state['board_cursors'] = []
+        cursors = st.session_state.setdefault('board_cursors', [])
+        cursor = cursors[-1] if cursors else None
+
+        # 다음 페이지가 있는지 알기 위해 한 개를 더 읽음
+        # 검색 결과는 관련도순이므로 커서로 마지막 결과의 (점수, 게시글 ID)를 기억
         if search_keyword:
-            posts = self.search_posts(search_keyword)
+            if self.search_truncated(search_keyword):
+                st.info(f"일치하는 글이 많아 최근 {self.search_candidates}개 일치 결과 안에서 관련도순으로 보여줘. "
+                        "오래된 글을 찾으려면 검색어를 더 자세히 적어줘!")
+            posts = self.search_posts(search_keyword, cursor, self.page_size + 1)
+            next_cursor = (posts[self.page_size - 1][3], posts[self.page_size - 1][0]) if len(posts) > self.page_size else None
         else:
-            posts = self.c.execute("SELECT id, title FROM posts ORDER BY id DESC").fetchall()
-        for post_id, title in posts:
-            if st.button(title, key=f"post_{post_id}"):
+            posts = self.list_posts(cursor, self.page_size + 1)
+            next_cursor = posts[self.page_size - 1][0] if len(posts) > self.page_size else None
+        has_more = len(posts) > self.page_size
+        posts = posts[:self.page_size]
+
+        for post_id, title, comment_count, *_ in posts:
+            label = f"{title} [{comment_count}]" if comment_count else title
+            if st.button(label, key=f"post_{post_id}"):
                 st.session_state['current_view'] = 'view_post'
                 st.session_state['post_id'] = post_id
 
+        # 버튼 콜백은 다음 실행 전에 호출되므로, 클릭 즉시 이동한 페이지가 표시됨
+        col1, col2 = st.columns(2)
+        if cursors:
+            col1.button("처음으로", on_click=cursors.clear)
+        if has_more:
+            col2.button("더 보기", on_click=cursors.append, args=(next_cursor,))
+
 if __name__ == '__main__':
     app = BoardApp()
     app.run()
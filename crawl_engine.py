@@ -0,0 +1,309 @@
+import functools
+import http.server
+import json
+import logging
+import os
+import random
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    '''
+    호스트별로 요청 시작 간격을 제한하는 클래스.
+
+    같은 호스트에 대한 요청은 최소 min_interval(+ 0~jitter초의 임의 간격)만큼 떨어져 시작되고,
+    서로 다른 호스트에 대한 요청은 서로 기다리지 않습니다.
+
+    속성 :
+        min_interval(float) : 같은 호스트에 대한 요청 사이의 최소 간격(초)
+        jitter(float) : 간격에 더할 임의 시간의 최댓값(초)
+
+    메서드 :
+        wait(url) : url의 호스트에 요청을 보낼 수 있을 때까지 기다립니다.
+    '''
+    def __init__(self, min_interval=1.0, jitter=0.0):
+        '''
+        RateLimiter 클래스의 인스턴스를 초기화합니다.
+
+        매개변수 :
+            min_interval(float) : 같은 호스트에 대한 요청 사이의 최소 간격(초)
+            jitter(float) : 간격에 더할 임의 시간의 최댓값(초)
+        '''
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self.lock = threading.Lock()
+        self.next_time = {}
+
+    def wait(self, url):
+        '''
+        url의 호스트에 요청을 보낼 수 있을 때까지 기다립니다.
+        다음 요청 시각을 잠금 안에서 예약하므로 여러 스레드가 동시에 호출해도 간격이 지켜집니다.
+
+        매개변수 :
+            url(str) : 요청할 URL
+        '''
+        host = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time.get(host, now))
+            self.next_time[host] = start + self.min_interval + random.uniform(0, self.jitter)
+        if start > now:
+            time.sleep(start - now)
+
+
+class Checkpoint:
+    '''
+    완료된 크롤링 작업의 결과를 JSON Lines 파일에 한 줄씩 기록하는 클래스.
+
+    작업이 끝날 때마다 바로 기록하므로, 크롤링이 중간에 중단되어도 다시 실행하면 완료된 작업은 건너뜁니다.
+
+    속성 :
+        path(str) : 체크포인트 파일 경로
+        results(dict) : 작업 키별 결과
+
+    메서드 :
+        save(key, rows) : 작업 결과를 기록합니다.
+        clear() : 체크포인트 파일을 삭제합니다.
+    '''
+    def __init__(self, path):
+        '''
+        Checkpoint 클래스의 인스턴스를 초기화하고, 기존 체크포인트 파일이 있으면 읽어 옵니다.
+
+        매개변수 :
+            path(str) : 체크포인트 파일 경로
+        '''
+        self.path = path
+        self.lock = threading.Lock()
+        self.results = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    # 기록 도중 중단되어 마지막 줄이 잘린 경우는 무시
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self.results[record['key']] = record['rows']
+
+    def save(self, key, rows):
+        '''
+        작업 결과를 파일에 한 줄로 추가합니다.
+
+        매개변수 :
+            key(str) : 작업 키
+            rows(list) : JSON으로 저장할 수 있는 작업 결과
+        '''
+        line = json.dumps({'key': key, 'rows': rows}, ensure_ascii=False)
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self.results[key] = rows
+
+    def clear(self):
+        '''
+        체크포인트 파일을 삭제합니다. 크롤링이 모두 끝난 뒤 호출합니다.
+        '''
+        with self.lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self.results = {}
+
+
+class CrawlEngine:
+    '''
+    여러 페이지를 제한된 수의 작업 스레드로 동시에 수집하는 크롤링 엔진.
+
+    각 작업은 (키, URL) 쌍이며, 작업 스레드는 호스트별 요청 간격을 지키며 fetch(url)로 페이지를 가져오고
+    parse(key, page)로 결과를 추출합니다. 실패한 작업은 지수 백오프로 재시도하고,
+    checkpoint_path를 주면 완료된 작업을 기록하여 다음 실행에서 이어서 수집합니다.
+    fetch와 parse는 작업 스레드에서 호출되므로, 브라우저처럼 스레드마다 따로 필요한 자원은 fetch 쪽에서 스레드별로 관리합니다.
+
+    속성 :
+        fetch(callable) : URL을 받아 페이지를 반환하는 함수
+        parse(callable) : 작업 키와 페이지를 받아 결과 행 목록을 반환하는 함수
+        max_workers(int) : 동시에 실행할 작업 스레드 수
+        rate_limiter(RateLimiter) : 호스트별 요청 간격 제한
+        max_retries(int) : 작업당 최대 재시도 횟수
+        backoff(float) : 첫 재시도 전 대기 시간(초). 재시도마다 두 배가 됩니다.
+        checkpoint(Checkpoint) : 완료된 작업 기록. 없으면 None
+        failures(dict) : 마지막 실행에서 재시도 후에도 실패한 작업 키별 예외
+
+    메서드 :
+        run(tasks, on_result) : 작업 목록을 수집하여 키별 결과를 반환하거나 on_result로 넘깁니다.
+    '''
+    def __init__(self, fetch, parse, max_workers=4, min_interval=1.0, jitter=0.0,
+                 max_retries=3, backoff=1.0, checkpoint_path=None):
+        '''
+        CrawlEngine 클래스의 인스턴스를 초기화합니다.
+
+        매개변수 :
+            fetch(callable) : URL을 받아 페이지를 반환하는 함수
+            parse(callable) : 작업 키와 페이지를 받아 결과 행 목록을 반환하는 함수
+            max_workers(int) : 동시에 실행할 작업 스레드 수
+            min_interval(float) : 같은 호스트에 대한 요청 사이의 최소 간격(초)
+            jitter(float) : 요청 간격에 더할 임의 시간의 최댓값(초)
+            max_retries(int) : 작업당 최대 재시도 횟수
+            backoff(float) : 첫 재시도 전 대기 시간(초)
+            checkpoint_path(str) : 체크포인트 파일 경로. None이면 기록하지 않습니다.
+        '''
+        self.fetch = fetch
+        self.parse = parse
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(min_interval, jitter)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
+        self.failures = {}
+
+    def run(self, tasks, on_result=None):
+        '''
+        작업 목록을 수집하여 키별 결과를 작업 순서대로 반환합니다.
+        체크포인트에 이미 있는 작업은 다시 수집하지 않고, 끝내 실패한 작업은 결과에서 빠지고 failures에 남습니다.
+
+        on_result를 주면 결과를 모으지 않고, 작업이 끝나는 대로 run()을 호출한 스레드에서 on_result(key, rows)를 호출합니다.
+        체크포인트에 있던 결과도 먼저 on_result로 넘기므로, 중단 전에 처리되지 못한 결과도 빠지지 않습니다.
+
+        매개변수 :
+            tasks(list) : (작업 키, URL) 튜플의 리스트
+            on_result(callable) : 작업 키와 결과 행 목록을 받는 함수. None이면 결과를 모아 반환합니다.
+
+        반환값 :
+            results(dict) : 작업 키별 결과 행 목록. on_result를 주면 빈 딕셔너리
+        '''
+        tasks = list(tasks)
+        keys = {key for key, _ in tasks}
+        done = {key: rows for key, rows in self.checkpoint.results.items() if key in keys} if self.checkpoint else {}
+        pending = [(key, url) for key, url in tasks if key not in done]
+        if done:
+            logger.info('체크포인트에서 %d개 작업을 건너뜁니다.', len(done))
+        if on_result is not None:
+            for key, rows in done.items():
+                on_result(key, rows)
+            done = {}
+
+        self.failures = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='crawl') as executor:
+            futures = {executor.submit(self.run_task, key, url): key for key, url in pending}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    rows = future.result()
+                except Exception as error:
+                    logger.error('%s 수집에 실패했습니다: %r', key, error)
+                    self.failures[key] = error
+                    continue
+                if on_result is not None:
+                    on_result(key, rows)
+                else:
+                    done[key] = rows
+        return {key: done[key] for key, _ in tasks if key in done}
+
+    def run_task(self, key, url):
+        '''
+        작업 하나를 수집합니다. 실패하면 backoff * 2^(시도 횟수)초(+ 임의 시간)를 기다렸다가 재시도합니다.
+
+        매개변수 :
+            key(str) : 작업 키
+            url(str) : 수집할 URL
+
+        반환값 :
+            rows(list) : parse()가 반환한 결과 행 목록
+        '''
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.wait(url)
+            try:
+                rows = self.parse(key, self.fetch(url))
+            except Exception as error:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff * 2 ** attempt
+                logger.warning('%s 수집 실패(%r), %.1f초 후 재시도합니다.', key, error, delay)
+                time.sleep(delay + random.uniform(0, delay / 2))
+            else:
+                if self.checkpoint:
+                    self.checkpoint.save(key, rows)
+                return rows
+
+
+def http_fetch(url, timeout=30, encoding='utf-8'):
+    '''
+    HTTP GET으로 페이지를 가져와 문자열로 반환합니다. HTTP 오류 응답은 예외로 발생하여 재시도 대상이 됩니다.
+
+    매개변수 :
+        url(str) : 요청할 URL
+        timeout(float) : 응답 대기 시간(초)
+        encoding(str) : 응답 본문의 기본 인코딩. 응답 헤더에 charset이 있으면 그것을 사용합니다.
+
+    반환값 :
+        html(str) : 응답 본문
+    '''
+    request = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read().decode(response.headers.get_content_charset() or encoding)
+
+
+class FixtureServer:
+    '''
+    저장해 둔 페이지를 로컬에서 제공하는 테스트용 HTTP 서버.
+
+    directory 아래의 파일을 경로 그대로 제공합니다. 크롤러의 URL 환경변수를 이 서버 주소로 바꾸면
+    실제 사이트에 접속하지 않고 크롤링 전체 과정을 실행해 볼 수 있습니다.
+    delay를 주면 응답마다 그만큼 지연시켜 실제 사이트의 응답 시간을 흉내 냅니다.
+
+    사용 예 (저장소 최상위 경로에서, 직업 코드 084의 저장된 목록 페이지를 URL_WORK_1{직업 코드}URL_WORK_2 형식으로 제공) :
+        with FixtureServer('benchmarks/fixtures') as server:
+            os.environ['URL_WORK_1'] = server.url + '/worknet_listing.html?occupation='
+            os.environ['URL_WORK_2'] = '&resultCnt=10&pageIndex=1'
+            crawl_positions(['084'], fetch_mode='http', min_interval=0)
+
+    속성 :
+        directory(str) : 제공할 파일이 있는 디렉터리
+        delay(float) : 응답마다 추가할 지연 시간(초)
+        url(str) : 서버 주소 (예: http://127.0.0.1:8000)
+    '''
+    def __init__(self, directory, delay=0.0, port=0):
+        '''
+        FixtureServer 클래스의 인스턴스를 초기화합니다. 서버는 start() 또는 with 문으로 시작합니다.
+
+        매개변수 :
+            directory(str) : 제공할 파일이 있는 디렉터리
+            delay(float) : 응답마다 추가할 지연 시간(초)
+            port(int) : 사용할 포트. 0이면 빈 포트를 자동으로 고릅니다.
+        '''
+        self.directory = directory
+        self.delay = delay
+        delay_seconds = delay
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            def do_GET(self):
+                if delay_seconds:
+                    time.sleep(delay_seconds)
+                super().do_GET()
+
+            def log_message(self, format, *args):
+                pass
+
+        handler = functools.partial(Handler, directory=directory)
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, name='FixtureServer', daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
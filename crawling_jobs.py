@@ -1,25 +1,27 @@
-import selenium
 import pandas as pd
-import time
-import random
-
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 
 # 환경변수 파일 업로드
 from dotenv import load_dotenv
 import os
 load_dotenv()
 
+from crawl_engine import CrawlEngine, http_fetch
+from crawling_works import BrowserFetcher
+from page_parser import parse_ncs_jobs
+
+# 수집하는 열
+JOB_COLUMNS = ['직업명', 'NCS분류']
+
+# 데이터 수집 범위
+last_page = 31
+
 # 웹페이지에서 데이터를 수집
 def crawling(driver):
     """
-    주어진 웹 드라이버 인스턴스를 사용하여 웹 페이지에서 직업명과 NCS 분류 코드를 크롤링합니다.
+    Selenium WebDriver가 연 현재 웹 페이지에서 직업명과 NCS 분류 코드를 수집합니다.
 
-    페이지 내에 특정 CSS 선택자를 사용하여 직업명과 NCS 코드가 담긴 요소를 찾고,
-    이를 딕셔너리 형태로 변환하여 리스트에 저장합니다. 최종적으로, 이 리스트를 바탕으로
-    Pandas DataFrame을 생성하여 반환합니다.
+    요소마다 WebDriver를 호출하지 않고 page_source를 한 번만 가져와 parse_ncs_jobs()로 한 번에 추출합니다.
+    각 행의 NCS 링크는 한 번만 읽어 그 행의 모든 직업명과 짝짓습니다.
 
     매개변수:
         driver (selenium.webdriver.Chrome): Selenium WebDriver 인스턴스.
@@ -27,73 +29,88 @@ def crawling(driver):
     반환값:
         pandas.DataFrame: 수집된 데이터를 포함하는 DataFrame.
     """
+    return pd.DataFrame(parse_ncs_jobs(driver.page_source), columns=JOB_COLUMNS)
 
-    # 데이터를 저장할 리스트 생성
-    job_data = []
-
-    for i in range(0, 11):
-        jobs_css_path = f'#list_{i} > td.pl_50 > button'
-        ncs_css_path = f'#list_{i} > td:nth-child(4) > div > div > ul > li > a'
-        
-        # 수집할 선택자 요소
-        job_elements = driver.find_elements(By.CSS_SELECTOR, jobs_css_path)
-        ncs_elements = driver.find_elements(By.CSS_SELECTOR, ncs_css_path)
-
-        # 찾은 데이터를 딕셔너리 형태로 저장
-        for job_index, job_element in enumerate(job_elements):
-            job_title = job_element.text
-            ncs_codes = []
-            for ncs_element in ncs_elements:
-                href = ncs_element.get_attribute('href')
-                start = href.find("'") + 1
-                code = href[start:start+8]
-                ncs_codes.append(code)
-           
-           # 딕셔너리를 리스트에 추가
-            for code in ncs_codes:
-                job_data.append({'직업명': job_title, 'NCS분류': code})
-
-    # 데이터 프레임 생성
-    return pd.DataFrame(job_data)
-
-def main():
+def page_url(base_url, page):
+    """
+    목록 페이지 번호의 URL을 만듭니다. 환경변수 URL_JOB은 페이지 번호 앞까지의 주소입니다.
+
+    매개변수:
+        base_url (str): 페이지 번호 앞까지의 URL.
+        page (int): 페이지 번호.
+
+    반환값:
+        str: 페이지 URL.
     """
-    메인 함수에서는 Selenium WebDriver를 설정하고, 환경변수에서 URL을 로드하여
-    지정된 페이지 범위에 대해 크롤링을 수행합니다. 각 페이지에서 수집된 데이터는
-    하나의 DataFrame으로 합쳐지며, 최종적으로 CSV 파일로 저장됩니다.
+    return f'{base_url}{page}'
+
+def crawl_jobs(pages, fetch_mode='browser', max_workers=4, min_interval=1.0, jitter=1.0, checkpoint_path=None):
     """
-    # Chrome WebDriver 설정
-    options = Options()
-    options.add_argument('--headless')  
-    options.add_argument('--disable-gpu')  
-    options.add_argument("user-agent=Yeti") 
-    driver = webdriver.Chrome(options=options)
+    직업별 NCS 분류 목록 페이지를 여러 작업 스레드로 동시에 수집합니다.
 
-    # 데이터를 저장할 데이터 프레임 생성
-    df = None
+    fetch_mode가 'browser'이면 작업 스레드마다 headless Chrome으로 페이지를 열고,
+    'http'이면 브라우저 없이 HTTP로 HTML을 받아옵니다. 어느 쪽이든 HTML은 parse_ncs_jobs()로 한 번에 추출합니다.
+    같은 사이트에 대한 요청은 min_interval(+ 0~jitter초) 간격을 두고 시작하며, 실패한 페이지는 재시도합니다.
+    URL_JOB을 crawl_engine.FixtureServer 주소로 바꾸면 저장해 둔 페이지로 전체 과정을 실행해 볼 수 있습니다.
 
-    # 데이터 수집 범위
-    last_page = 31
+    매개변수:
+        pages (iterable): 수집할 페이지 번호.
+        fetch_mode (str): 페이지를 가져오는 방식 ('browser' 또는 'http').
+        max_workers (int): 동시에 실행할 작업 스레드(브라우저) 수.
+        min_interval (float): 요청 사이의 최소 간격(초).
+        jitter (float): 요청 간격에 더할 임의 시간의 최댓값(초).
+        checkpoint_path (str): 체크포인트 파일 경로. None이면 기록하지 않습니다.
 
+    반환값:
+        pandas.DataFrame: 페이지 순서대로 수집된 직업명과 NCS 분류 코드.
+    """
     # 환경변수에서 url 호출
-    url = os.getenv('URL_JOB')
-
-    for i in range(0, last_page + 1):
-        # url 조합 후 chrome.driver 실행
-        url = f'{url}'+str(i)
-        driver.get(url=url)
+    base_url = os.getenv('URL_JOB')
+
+    # 체크포인트에 JSON으로 기록되므로 작업 키는 문자열로 사용
+    tasks = [(str(page), page_url(base_url, page)) for page in pages]
+
+    if fetch_mode == 'browser':
+        fetcher = BrowserFetcher(driver_path=None, arguments=('--headless', '--disable-gpu', 'user-agent=Yeti'))
+    elif fetch_mode == 'http':
+        fetcher = http_fetch
+    else:
+        raise ValueError(f"fetch_mode는 'browser' 또는 'http'여야 합니다: {fetch_mode}")
+    engine = CrawlEngine(fetcher, lambda page, html: parse_ncs_jobs(html), max_workers=max_workers,
+                         min_interval=min_interval, jitter=jitter, checkpoint_path=checkpoint_path)
+    try:
+        results = engine.run(tasks)
+    finally:
+        if fetch_mode == 'browser':
+            fetcher.close()
+    if engine.failures:
+        raise RuntimeError(f'{len(engine.failures)}개 페이지를 수집하지 못했습니다: {sorted(engine.failures, key=int)}')
+
+    # 페이지별 결과를 한 번에 합침
+    return pd.DataFrame([row for rows in results.values() for row in rows], columns=JOB_COLUMNS)
+
+def main(fetch_mode='browser', max_workers=4, min_interval=1.0, output_path='db_data/jobs.csv',
+         checkpoint_path='db_data/jobs_crawl.jsonl'):
+    """
+    메인 함수에서는 환경변수의 URL로 0 ~ last_page 페이지를 crawl_jobs()로 수집하여 CSV 파일로 저장합니다.
+    일부 페이지를 끝내 수집하지 못하면 체크포인트를 남기고 중단하므로, 다시 실행하면 남은 페이지만 수집합니다.
 
-        # 데이터 수집 실행
-        result_crawl = crawling(driver)
+    매개변수:
+        fetch_mode (str): 페이지를 가져오는 방식 ('browser' 또는 'http').
+        max_workers (int): 동시에 실행할 작업 스레드(브라우저) 수.
+        min_interval (float): 요청 사이의 최소 간격(초).
+        output_path (str): 저장할 CSV 파일 경로.
+        checkpoint_path (str): 체크포인트 파일 경로.
+    """
+    df = crawl_jobs(range(0, last_page + 1), fetch_mode=fetch_mode, max_workers=max_workers,
+                    min_interval=min_interval, checkpoint_path=checkpoint_path)
 
-        # 수집한 데이터 저장
-        df = pd.concat([df, result_crawl], ignore_index=True)
-        
-        time.sleep(random.uniform(2,5))
-        
     # csv 파일로 저장
-    df.to_csv('db_data/jobs.csv', index=False)
-    driver.quit()
+    df.to_csv(output_path, index=False)
+
+    # 모두 저장했으므로 체크포인트 삭제
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
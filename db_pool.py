@@ -0,0 +1,148 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class ConnectionManager:
+    '''
+    하나의 SQLite DB 파일에 대한 연결을 관리하는 클래스.
+
+    DB는 WAL 모드로 열어 읽기와 쓰기가 서로를 막지 않게 합니다.
+    읽기는 스레드마다 하나씩 만들어 재사용하는 읽기 전용 연결로 처리하고,
+    쓰기는 프로세스 안에서 하나의 쓰기 연결을 잠금으로 보호하여 BEGIN IMMEDIATE 트랜잭션으로 처리합니다.
+    다른 프로세스가 쓰기 잠금을 잡고 있으면 busy_timeout 동안 기다립니다.
+
+    속성 :
+        db_path(str) : SQLite DB 파일 경로
+        busy_timeout(float) : 잠금을 기다리는 최대 시간(초)
+
+    메서드 :
+        read(sql, params) : 조회 결과를 모두 반환합니다.
+        read_one(sql, params) : 조회 결과의 첫 행을 반환합니다.
+        write() : 쓰기 트랜잭션을 여는 컨텍스트 매니저를 반환합니다.
+        initialize(func) : 스키마 초기화 함수를 프로세스당 한 번만 실행합니다.
+        close() : 쓰기 연결과 현재 스레드의 읽기 연결을 닫습니다.
+    '''
+    def __init__(self, db_path, busy_timeout=5.0):
+        '''
+        ConnectionManager 클래스의 인스턴스를 초기화합니다.
+
+        매개변수 :
+            db_path(str) : SQLite DB 파일 경로
+            busy_timeout(float) : 잠금을 기다리는 최대 시간(초)
+        '''
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.local = threading.local()
+        self.write_lock = threading.RLock()
+        self.initialized = False
+        self.write_conn = self.connect(check_same_thread=False)
+        self.write_conn.execute('PRAGMA journal_mode=WAL')
+        self.write_conn.execute('PRAGMA synchronous=NORMAL')
+
+    def connect(self, check_same_thread=True):
+        '''
+        autocommit 모드의 새 연결을 만듭니다. 트랜잭션은 명시적으로 BEGIN/COMMIT 합니다.
+        '''
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout,
+                               isolation_level=None, check_same_thread=check_same_thread)
+        conn.execute(f'PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}')
+        return conn
+
+    def reader(self):
+        '''
+        현재 스레드의 읽기 전용 연결을 반환합니다. 없으면 새로 만듭니다.
+        연결은 스레드 로컬에 보관되므로 스레드가 종료되면 함께 정리됩니다.
+        '''
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.connect()
+            conn.execute('PRAGMA query_only = ON')
+            self.local.conn = conn
+        return conn
+
+    def read(self, sql, params=()):
+        '''
+        조회 결과를 모두 반환합니다.
+
+        매개변수 :
+            sql(str) : 조회 SQL
+            params(tuple) : SQL 파라미터
+
+        반환값 :
+            rows(list) : 조회 결과 튜플의 리스트
+        '''
+        return self.reader().execute(sql, params).fetchall()
+
+    def read_one(self, sql, params=()):
+        '''
+        조회 결과의 첫 행을 반환합니다. 결과가 없으면 None을 반환합니다.
+        '''
+        return self.reader().execute(sql, params).fetchone()
+
+    @contextmanager
+    def write(self):
+        '''
+        쓰기 트랜잭션을 엽니다. 블록이 정상 종료되면 commit, 예외가 발생하면 rollback 합니다.
+
+        사용 예 :
+            with manager.write() as conn:
+                conn.execute('INSERT INTO posts (title, content) VALUES (?, ?)', (title, content))
+        '''
+        with self.write_lock:
+            conn = self.write_conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            else:
+                conn.execute('COMMIT')
+
+    def initialize(self, func):
+        '''
+        스키마 초기화 함수를 하나의 쓰기 트랜잭션 안에서 프로세스당 한 번만 실행합니다.
+
+        매개변수 :
+            func(callable) : 쓰기 연결을 받아 테이블 등을 생성하는 함수
+        '''
+        if self.initialized:
+            return
+        with self.write_lock:
+            if not self.initialized:
+                with self.write() as conn:
+                    func(conn)
+                self.initialized = True
+
+    def close(self):
+        '''
+        쓰기 연결과 현재 스레드의 읽기 연결을 닫습니다.
+        '''
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+        with self.write_lock:
+            self.write_conn.close()
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(db_path, busy_timeout=5.0):
+    '''
+    DB 경로별로 프로세스 전체에서 공유하는 ConnectionManager를 반환합니다.
+
+    매개변수 :
+        db_path(str) : SQLite DB 파일 경로
+        busy_timeout(float) : 잠금을 기다리는 최대 시간(초)
+    '''
+    manager = _managers.get(db_path)
+    if manager is not None:
+        return manager
+    with _managers_lock:
+        if db_path not in _managers:
+            _managers[db_path] = ConnectionManager(db_path, busy_timeout)
+        return _managers[db_path]
@@ -1,6 +1,10 @@
 import pandas as pd
 import streamlit as st
 import sqlite3
+from ncs_hierarchy import field_names, group_jobs_by_field
+from refdata import load_reference_data
+from regions import region_name, regions_from_codes
+from result_pages import ResultPager
 
 class EduMatcher:
     '''
@@ -8,66 +12,151 @@ class EduMatcher:
     
     이 클래스는 교육 프로그램 데이터를 로드하고, 사용자의 선호에 따라 맞춤형 교육 프로그램을 추천합니다.
     Streamlit을 사용하여 웹 기반 인터페이스를 제공하며, 사용자는 직업과 원하는 교육의 지역, 온라인 여부를 선택할 수 있습니다.
+
+    조회 엔진은 두 가지를 지원합니다.
+    - 'sql' (기본값) : 직업, NCS, 온라인 여부, 지역 조건과 교육기관 조인을 하나의 파라미터화된 SQL로 처리하여
+      조건에 맞는 교육 프로그램만 읽어옵니다. edu_program 전체를 메모리에 올리지 않습니다.
+      지역 조건은 적재할 때 주소에서 추출해 둔 edu_company.region_code의 정수 비교입니다.
+    - 'memory' : edu_program 전체를 DataFrame으로 올려 pandas로 필터링합니다.
+
+    추천 결과는 ResultPager(result_pages.py)로 page_size개씩 나누어 표시하며, 한 페이지만 조회하고 카드로 만듭니다.
+    기본 정렬인 추천순은 precompute.py가 직업별로 미리 점수를 매겨 둔 상위 교육 프로그램(job_program_ranks)을
+    (id_jobs, rank) 기본키로 읽으며, 나머지 정렬은 직업의 NCS 코드에 해당하는 교육 프로그램 전체를 보여줍니다.
+    지역이나 온라인 조건이 있으면 추천순도 조건에 맞는 교육 프로그램 전체를 미리 저장한 점수 항목으로 정렬합니다.
     
     속성 :
-        path (str): 교육 프로그램 및 관련 데이터 파일이 위치한 디렉토리의 경로.
+        db_path (str): SQLite DB 파일 경로.
+        engine (str): 교육 프로그램 조회 엔진 ('sql' 또는 'memory').
         
     메서드 :
         load_data() : 교육 프로그램, 직업, NCS 코드, 교육 기관 데이터를 로드합니다.
         prepare_data() : 로드된 데이터를 처리하고, 사용자 인터페이스에 필요한 형태로 준비합니다.
         app_interface() : Streamlit을 통해 사용자 인터페이스를 구성하고 사용자 입력을 처리합니다.
-        get_programs_for_job(job_title, regions, mode) : 사용자의 선택에 따라 적합한 교육 프로그램을 조회합니다.
-        display_programs(programs) : 추천된 교육 프로그램을 사용자에게 표시합니다.
-        display_program_card(program) : 개별 교육 프로그램 정보를 카드 형식으로 표시합니다.
+        get_programs_for_job(job_title, region_codes, mode, limit, offset, sort) : 사용자의 선택에 따라 적합한 교육 프로그램을 조회합니다.
+        count_programs(job_title, region_codes, mode, sort) : 사용자의 선택에 맞는 교육 프로그램 수를 반환합니다.
+        display_programs(programs, pager, total) : 추천된 교육 프로그램 한 페이지를 사용자에게 표시합니다.
     '''
-    def __init__(self, db_path='./db/data.db'):
+    # 온라인 여부 선택값과 online_status 값의 매핑
+    online_status_by_mode = {'응': '온라인', '아니': '오프라인'}
+
+    # 미리 계산한 직업별 추천 순위로 정렬하는 선택값 (기본값)
+    recommended_sort = '추천순'
+
+    # 나머지 정렬 선택값과 정렬 열. 값이 없는 프로그램은 뒤에, 정렬 열이 같으면 edu_program의 저장 순서로 놓습니다.
+    sort_columns = {
+        '기본순': [],
+        '시작일 빠른순': ['date_start'],
+        '자가부담금 낮은순': ['oopc'],
+    }
+
+    # 추천 결과 한 페이지의 교육 프로그램 수
+    page_size = 20
+
+    # 교육 프로그램 카드 HTML (result_pages.format_cards()의 템플릿)
+    program_card_template = '''
+        <div style="background-color: #cbf3f0; padding: 20px; border-radius: 10px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,.1);">
+            <h4 style="color: #333;">{name_edu_program}</h4>
+            <p style="color: #666;"><b>{name_edu_company}</b></p>
+            <p style="color: #666;">시작일: {date_start} | 종료일: {date_end}</p>
+            <p style="color: #666;">자가부담금: {oopc}</p>
+            <p style="color: #666;">온라인 여부: {online_status}</p>
+            <p style="color: #666;">지역: {region}</p>
+            <a href="{link}" target="_blank">More Info</a>
+        </div>
+    '''
+
+    def __init__(self, db_path='./db/data.db', engine='sql'):
         '''
         EduMatcher 클래스의 인스턴스를 초기화합니다.
 
         매개변수 : 
             db_path(str) : SQLite DB 파일 경로.
+            engine(str) : 교육 프로그램 조회 엔진 ('sql' 또는 'memory')
         '''
+        if engine not in ('sql', 'memory'):
+            raise ValueError(f"engine은 'sql' 또는 'memory'여야 합니다: {engine}")
         self.db_path = db_path
+        self.engine = engine
         self.load_data()
         self.prepare_data()
 
     def load_data(self):
         '''
-        SQLite 데이터베이스에서 교육 프로그램, 직업, NCS코드, 교육기관 데이터를 로드합니다.
+        프로세스 전체에서 공유하는 참조 데이터에서 직업, NCS코드 데이터를 가져옵니다.
+        DB가 바뀌지 않았다면 SQLite를 다시 읽지 않습니다.
         '''
-        conn = sqlite3.connect(self.db_path)
-        self.edu_program_df = pd.read_sql_query('SELECT * FROM edu_program', conn)
-        self.jobs_df = pd.read_sql_query('SELECT * FROM jobs', conn)
-        self.ncs_to_jobs_df = pd.read_sql_query('SELECT * FROM ncs_to_jobs', conn)
-        self.edu_company_df = pd.read_sql_query('SELECT * FROM edu_company', conn)
-        conn.close()
+        self.data = load_reference_data(self.db_path)
+        self.jobs_df = self.data['jobs']
+        self.ncs_to_jobs_df = self.data['ncs_to_jobs']
 
     def prepare_data(self):
         '''
         로드된 데이터를 처리하고, 사용자 인터페이스에 필요한 형태로 준비합니다.
-        분야에 따른 NCS 코드 분류 로직을 추가합니다.
+        직업 분야는 edu_program과 ncs_to_jobs에 저장된 NCS 대분류(ncs_major)로 정합니다.
+        가공 결과는 참조 데이터와 함께 캐시되어 DB가 바뀌기 전까지 다시 계산하지 않습니다.
         '''
-        self.edu_company_df['simplified_address'] = self.edu_company_df['address'].apply(
-            lambda x: x.split()[0] if pd.notnull(x) else x)
-        self.unique_regions = sorted(self.edu_company_df['simplified_address'].unique())
+        prepared = self.data.derived('edu_prepared', self.build_prepared_data)
+        self.edu_company_df = prepared['edu_company']
+        self.unique_regions = prepared['unique_regions']
+        self.unique_categories = prepared['unique_categories']
+        self.field_jobs = prepared['field_jobs']
+        if self.engine == 'memory':
+            self.edu_program_df = self.data.derived('edu_program_with_category', self.build_program_data)
 
-        # edu_program_df에서 ncs_code를 기반으로 대분류를 결정하는 로직 수정
-        # ncs_code의 뒤 6자리를 제외한 나머지 부분을 사용
-        self.edu_program_df['job_category'] = self.edu_program_df['ncs_code'].apply(
-            lambda ncs: self.ncs_code_to_category(str(ncs)[:-6]))  # 뒤의 6자리를 제외
+    @staticmethod
+    def build_prepared_data(data):
+        '''
+        교육기관 데이터를 복사하여 region_code로부터 지역명 컬럼을 추가하고, 교육 프로그램이 있는 직업 분야와 분야별 직업 목록을 만듭니다.
+        교육 프로그램의 (대분류, NCS 코드)는 (ncs_major, ncs_code) 인덱스만 읽는 DISTINCT 조회로 가져오고,
+        분야별 직업은 그 NCS 코드에 연결된 ncs_to_jobs 행의 저장된 대분류로 묶으므로 교육 프로그램 수와 무관하게 가볍습니다.
 
-        self.unique_categories = sorted(self.edu_program_df['job_category'].unique())
-        
-    def ncs_code_to_category(self, ncs_code):
-        categories = {
-            '13': '음식+식품',
-            '21': '음식+식품',
-            '20': '정보통신',
-            '6': '보건',
-            '14': '건설',
-            '8': '문화'
+        매개변수 :
+            data(ReferenceData) : 공유 참조 데이터
+
+        반환값 :
+            prepared(dict) : 가공된 edu_company 데이터, 지역 코드 목록, 직업 분야 목록, 분야별 직업명 목록
+        '''
+        edu_company_df = data['edu_company'].copy()
+        edu_company_df['region'] = regions_from_codes(edu_company_df['region_code'])
+
+        conn = sqlite3.connect(data.db_path)
+        program_codes = pd.read_sql_query('SELECT DISTINCT ncs_major, ncs_code FROM edu_program', conn)
+        conn.close()
+
+        ncs_to_jobs = data['ncs_to_jobs']
+        related = ncs_to_jobs.loc[ncs_to_jobs['ncs_code'].isin(program_codes['ncs_code']), ['id_jobs', 'ncs_major']]
+        pairs = data['jobs'][['id_jobs', 'name_jobs']].merge(related, on='id_jobs')
+
+        return {
+            'edu_company': edu_company_df,
+            'unique_regions': sorted(edu_company_df['region_code'].dropna().astype('int64').unique().tolist()),
+            'unique_categories': sorted(field_names(program_codes['ncs_major']).unique()),
+            'field_jobs': group_jobs_by_field(pairs['ncs_major'], pairs['name_jobs']),
         }
-        return categories.get(ncs_code, '기타')
+
+    @staticmethod
+    def build_program_data(data):
+        '''
+        'memory' 엔진에서 사용할 교육 프로그램 데이터를 읽어 직업 분야 컬럼을 추가합니다.
+        추천 목록(job_program_ranks)과 연결할 수 있도록 회차를 가리키는 rowid를 program_rowid 컬럼으로 추가합니다.
+        공유 edu_program 데이터는 rowid 순서의 테이블 전체 조회 결과이므로 같은 순서의 rowid 목록을 붙입니다.
+
+        매개변수 :
+            data(ReferenceData) : 공유 참조 데이터
+        '''
+        edu_program_df = data['edu_program'].copy()
+        conn = sqlite3.connect(data.db_path)
+        edu_program_df['program_rowid'] = [rowid for (rowid,) in conn.execute('SELECT rowid FROM edu_program ORDER BY rowid')]
+        conn.close()
+        edu_program_df['job_category'] = field_names(edu_program_df['ncs_major'])
+        return edu_program_df
+
+    @staticmethod
+    def region_option_label(option):
+        '''
+        지역 선택 위젯의 선택지('All' 또는 지역 코드)를 화면에 표시할 이름으로 바꿉니다.
+        '''
+        return option if option == 'All' else region_name(option)
 
     def app_interface(self):
         '''
@@ -79,94 +168,203 @@ class EduMatcher:
         selected_category = st.selectbox("먼저 직업 분야를 골라줘!", ['All'] + list(self.unique_categories))
 
         if selected_category != 'All':
-            filtered_programs = self.edu_program_df[self.edu_program_df['job_category'] == selected_category]
-            filtered_ncs_codes = filtered_programs['ncs_code'].unique()
-            related_job_ids = self.ncs_to_jobs_df[self.ncs_to_jobs_df['ncs_code'].isin(filtered_ncs_codes)]['id_jobs'].unique()
-            filtered_jobs = self.jobs_df[self.jobs_df['id_jobs'].isin(related_job_ids)]
+            job_titles = self.field_jobs.get(selected_category, [])
         else:
-            filtered_jobs = self.jobs_df
+            job_titles = self.jobs_df['name_jobs'].unique()
 
-        selected_job = st.selectbox("이제 직업을 선택해!", filtered_jobs["name_jobs"].unique())
+        selected_job = st.selectbox("이제 직업을 선택해!", job_titles)
 
-        selected_regions = st.multiselect("교육을 들을 지역을 골라줘", options=['All'] + list(self.unique_regions), default='All')
+        selected_regions = st.multiselect("교육을 들을 지역을 골라줘", options=['All'] + list(self.unique_regions), default='All',
+                                          format_func=self.region_option_label)
         selected_mode = st.selectbox("온라인 강의만 들을거야?", ['상관없어', '응', '아니'])
 
+        # 페이지나 정렬을 바꿔도 결과가 유지되도록 마지막으로 추천받은 조건을 세션 상태에 저장
         if st.button("교육추천"):
-            recommended_programs = self.get_programs_for_job(selected_job, selected_regions, selected_mode)
-            self.display_programs(recommended_programs)
+            st.session_state['edu_search'] = (selected_job, tuple(selected_regions), selected_mode)
+
+        if 'edu_search' in st.session_state:
+            search = st.session_state['edu_search']
+            pager = ResultPager('edu_programs', self.page_size, [self.recommended_sort] + list(self.sort_columns))
+            sort = pager.sort()
+            offset = pager.offset(search + (sort,))
+            recommended_programs = self.get_programs_for_job(*search, limit=pager.page_size, offset=offset, sort=sort)
+            self.display_programs(recommended_programs, pager, self.count_programs(*search, sort=sort))
 
-    def get_programs_for_job(self, job_title, regions, mode):
+    def get_programs_for_job(self, job_title, region_codes, mode, limit=None, offset=0, sort=None):
         '''
         사용자의 선택에 따라 적합한 교육 프로그램을 조회합니다.
         사용자는 직업, 지역, 온라인 여부들에 대해 선택하여 필터링 할 수 있습니다.
         
         매개변수 : 
             job_title(str) : 사용자가 선택한 직업
-            regions(list) : 사용자가 선택한 지역 리스트
+            region_codes(list) : 사용자가 선택한 지역 코드 리스트. 'All'이 있으면 모든 지역
             mode(str) : 사용자가 선택한 온라인 여부
+            limit(int) : 반환할 최대 교육 프로그램 수. None이면 전체
+            offset(int) : 건너뛸 교육 프로그램 수
+            sort(str) : recommended_sort 또는 sort_columns의 정렬 선택값. None이면 기본순
             
+        반환값 :
+            recomended_programs(DataFrame) : 추천된 교육 프로그램 목록
+        '''
+        if self.engine == 'memory':
+            recommended_programs = self.get_programs_for_job_in_memory(job_title, region_codes, mode, sort)
+            columns = self.sort_columns.get(sort) or []
+            if columns:
+                recommended_programs = recommended_programs.sort_values(columns, kind='stable', na_position='last')
+            end = None if limit is None else offset + limit
+            return recommended_programs.iloc[offset:end].reset_index(drop=True)
+
+        query, params = self.build_programs_query(job_title, region_codes, mode, sort)
+        query += ' LIMIT ? OFFSET ?'
+        params += [-1 if limit is None else limit, offset]
+        conn = sqlite3.connect(self.db_path)
+        recommended_programs = pd.read_sql_query(query, conn, params=params)
+        conn.close()
+        recommended_programs['region'] = regions_from_codes(recommended_programs['region_code'])
+        return recommended_programs
+
+    def count_programs(self, job_title, region_codes, mode, sort=None):
+        '''
+        사용자의 선택에 맞는 교육 프로그램 수를 반환합니다. 페이지 수를 계산하는 데 사용합니다.
+
+        매개변수 :
+            job_title(str) : 사용자가 선택한 직업
+            region_codes(list) : 사용자가 선택한 지역 코드 리스트. 'All'이 있으면 모든 지역
+            mode(str) : 사용자가 선택한 온라인 여부
+            sort(str) : 정렬 선택값. 조건이 없는 추천순은 추천 목록 안에서만 셉니다.
+
+        반환값 :
+            count(int) : 교육 프로그램 수
+        '''
+        if self.engine == 'memory':
+            return len(self.get_programs_for_job_in_memory(job_title, region_codes, mode, sort))
+
+        query, params = self.build_programs_query(job_title, region_codes, mode, sort)
+        conn = sqlite3.connect(self.db_path)
+        count = conn.execute(f'SELECT COUNT(*) FROM ({query})', params).fetchone()[0]
+        conn.close()
+        return count
+
+    def build_programs_query(self, job_title, region_codes, mode, sort=None):
+        '''
+        교육 프로그램 조회용 SQL과 파라미터를 만듭니다.
+        직업명 → id_jobs → NCS 코드 → 교육 프로그램 순서로 인덱스를 따라가며, 교육기관은 기본키로 조인합니다.
+        추천순은 job_program_ranks의 (id_jobs, rank) 기본키 범위를 읽고 교육 프로그램을 rowid로 조인합니다.
+        지역이나 온라인 조건이 있는 추천순은 상위 k개 밖의 프로그램도 보여야 하므로, 조건에 맞는 교육 프로그램 전체를
+        edu_program_scores와 job_ncs_scores에 저장된 점수 항목의 합으로 정렬합니다. 순서는 job_program_ranks와 같습니다.
+
+        매개변수 :
+            job_title(str) : 사용자가 선택한 직업
+            region_codes(list) : 사용자가 선택한 지역 코드 리스트. 'All'이 있으면 모든 지역
+            mode(str) : 사용자가 선택한 온라인 여부
+            sort(str) : recommended_sort 또는 sort_columns의 정렬 선택값. None이면 기본순
+
+        반환값 :
+            query(str) : 파라미터화된 SQL
+            params(list) : SQL 파라미터
+        '''
+        online_status = self.online_status_by_mode.get(mode)
+        filtered = bool(online_status) or 'All' not in region_codes
+        if sort == self.recommended_sort and not filtered:
+            query = '''SELECT p.*, c.name_edu_company, c.address, c.region_code
+                FROM job_program_ranks r
+                JOIN edu_program p ON p.rowid = r.program_rowid
+                LEFT JOIN edu_company c ON c.id_edu_company = p.id_edu_company
+                WHERE r.id_jobs = (SELECT id_jobs FROM jobs WHERE name_jobs = ? LIMIT 1)'''
+            order = ['r.rank']
+        elif sort == self.recommended_sort:
+            # 상위 k개 밖의 프로그램도 조건에 맞을 수 있으므로, 조건에 맞는 전체를 저장된 점수 항목의 합으로 정렬
+            query = '''SELECT p.*, c.name_edu_company, c.address, c.region_code
+                FROM job_ncs_scores j
+                JOIN edu_program p ON p.ncs_code = j.ncs_code
+                JOIN edu_program_scores s ON s.program_rowid = p.rowid
+                LEFT JOIN edu_company c ON c.id_edu_company = p.id_edu_company
+                WHERE j.id_jobs = (SELECT id_jobs FROM jobs WHERE name_jobs = ? LIMIT 1)'''
+            order = ['s.score + j.score DESC', 'p.rowid']
+        else:
+            query = '''SELECT p.*, c.name_edu_company, c.address, c.region_code
+                FROM edu_program p
+                LEFT JOIN edu_company c ON c.id_edu_company = p.id_edu_company
+                WHERE p.ncs_code IN (
+                    SELECT ncs_code FROM ncs_to_jobs
+                    WHERE id_jobs = (SELECT id_jobs FROM jobs WHERE name_jobs = ? LIMIT 1))'''
+            order = [f'p.{column} NULLS LAST' for column in self.sort_columns.get(sort) or []] + ['p.rowid']
+        params = [job_title]
+
+        if online_status:
+            query += ' AND p.online_status = ?'
+            params.append(online_status)
+
+        if 'All' not in region_codes:
+            query += f" AND c.region_code IN ({', '.join('?' * len(region_codes))})"
+            params += list(region_codes)
+
+        query += f" ORDER BY {', '.join(order)}"
+        return query, params
+
+    def get_programs_for_job_in_memory(self, job_title, region_codes, mode, sort=None):
+        '''
+        'memory' 엔진에서 메모리에 올린 DataFrame으로 교육 프로그램을 조회합니다.
+
+        매개변수 : 
+            job_title(str) : 사용자가 선택한 직업
+            region_codes(list) : 사용자가 선택한 지역 코드 리스트. 'All'이 있으면 모든 지역
+            mode(str) : 사용자가 선택한 온라인 여부
+            sort(str) : 정렬 선택값. 추천순이면 추천 점수 순서로 반환하며, 지역이나 온라인 조건이 없으면 추천 목록만 반환합니다.
+
         반환값 :
             recomended_programs(DataFrame) : 추천된 교육 프로그램 목록
         '''
         # job_title을 사용하여 jobs_df에서 해당 직업의 id_jobs를 찾습니다.
         job_id = self.jobs_df[self.jobs_df['name_jobs'] == job_title]['id_jobs'].iloc[0]
         
-        # ncs_to_jobs_df를 사용하여 해당 job_id에 매칭되는 ncs_code를 찾습니다.
-        ncs_codes = self.ncs_to_jobs_df[self.ncs_to_jobs_df['id_jobs'] == job_id]['ncs_code']
-        
-        # 찾은 ncs_codes를 사용하여 edu_program_df에서 해당 교육 프로그램을 필터링합니다.
-        recommended_programs = self.edu_program_df[self.edu_program_df['ncs_code'].isin(ncs_codes)]
+        online_status = self.online_status_by_mode.get(mode)
+        filtered = bool(online_status) or 'All' not in region_codes
+        if sort == self.recommended_sort and not filtered:
+            # 미리 계산한 추천 목록을 순위 순서대로 교육 프로그램과 연결합니다.
+            ranks = self.data['job_program_ranks']
+            ranks = ranks[ranks['id_jobs'] == job_id].sort_values('rank')
+            recommended_programs = ranks[['program_rowid']].merge(self.edu_program_df, on='program_rowid')
+        elif sort == self.recommended_sort:
+            # 조건이 있으면 직업의 NCS 코드에 해당하는 전체를 저장된 점수 항목의 합으로 정렬합니다.
+            ncs_scores = self.data['job_ncs_scores']
+            ncs_scores = ncs_scores.loc[ncs_scores['id_jobs'] == job_id, ['ncs_code', 'score']]
+            recommended_programs = self.edu_program_df.merge(ncs_scores, on='ncs_code')
+            program_scores = self.data['edu_program_scores'].set_index('program_rowid')['score']
+            recommended_programs['score'] += recommended_programs['program_rowid'].map(program_scores)
+            recommended_programs = recommended_programs.sort_values(['score', 'program_rowid'], ascending=[False, True]) \
+                .drop(columns='score')
+        else:
+            # ncs_to_jobs_df를 사용하여 해당 job_id에 매칭되는 ncs_code를 찾습니다.
+            ncs_codes = self.ncs_to_jobs_df[self.ncs_to_jobs_df['id_jobs'] == job_id]['ncs_code']
+
+            # 찾은 ncs_codes를 사용하여 edu_program_df에서 해당 교육 프로그램을 필터링합니다.
+            recommended_programs = self.edu_program_df[self.edu_program_df['ncs_code'].isin(ncs_codes)]
         recommended_programs = recommended_programs.merge(self.edu_company_df, on='id_edu_company', how='left')
 
-        if mode == '응':
-            recommended_programs = recommended_programs[recommended_programs['online_status'] == '온라인']
-        elif mode == '아니':
-            recommended_programs = recommended_programs[recommended_programs['online_status'] == '오프라인']
+        if online_status:
+            recommended_programs = recommended_programs[recommended_programs['online_status'] == online_status]
 
-        if 'All' not in regions:
-            recommended_programs = recommended_programs[recommended_programs['simplified_address'].isin(regions)]
+        if 'All' not in region_codes:
+            recommended_programs = recommended_programs[recommended_programs['region_code'].isin(region_codes)]
 
         return recommended_programs
 
-    def display_programs(self, programs):
+    def display_programs(self, programs, pager, total):
         '''
-        추천된 교육 프로그램을 사용자에게 표시합니다.
+        추천된 교육 프로그램 한 페이지를 두 열의 카드로 표시하고, 페이지 이동 버튼을 표시합니다.
         
         매개변수 :
-            programs(DataFrame) : 추천된 교육 프로그램 데이터'''
+            programs(DataFrame) : 현재 페이지의 교육 프로그램 데이터
+            pager(ResultPager) : 페이지 상태를 관리하는 컴포넌트
+            total(int) : 조건에 맞는 전체 교육 프로그램 수
+        '''
         if not programs.empty:
-            for i in range(0, len(programs), 2):
-                cols = st.columns(2)
-                for col_num, index in enumerate(range(i, min(i + 2, len(programs)))):
-                    program = programs.iloc[index]
-                    with cols[col_num]:
-                        self.display_program_card(program)
+            pager.render(programs, self.program_card_template, columns=2)
+            pager.controls(total)
         else:
             st.write("아쉽지만 조건에 맞는 교육 프로그램이 없어...")
 
-    @staticmethod
-    def display_program_card(program):
-        '''
-        개별 교육 프로그램 정보를 카드 형식으로 표시합니다.
-        
-        매개변수 :
-            program(DataFrame) : 추천된 교육 프로그램 데이터
-        '''
-        st.markdown(
-            f"""
-            <div style="background-color: #cbf3f0; padding: 20px; border-radius: 10px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,.1);">
-                <h4 style="color: #333;">{program['name_edu_program']}</h4>
-                <p style="color: #666;"><b>{program['name_edu_company']}</b></p>
-                <p style="color: #666;">시작일: {program['date_start']} | 종료일: {program['date_end']}</p>
-                <p style="color: #666;">자가부담금: {program['oopc']}</p>
-                <p style="color: #666;">온라인 여부: {program['online_status']}</p>
-                <p style="color: #666;">지역: {program['simplified_address']}</p>
-                <a href="{program['link']}" target="_blank">More Info</a>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-
 if __name__ == '__main__':
     edu_matcher = EduMatcher()
     edu_matcher.app_interface()
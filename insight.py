@@ -1,28 +1,55 @@
 import streamlit as st
-import pandas as pd
 import plotly.graph_objs as go
 
+from market_data import load_market_trends
+
+# 비교할 수 있는 지표 (화면 이름: (MarketTrends 지표 이름, y축 형식))
+METRICS = {
+    '구인인원': ('openings', ','),
+    '전년 대비 증감률': ('growth', '.1%'),
+    '전체 대비 비중': ('share', '.1%'),
+    '순위': ('rank', 'd'),
+}
+
 def insight():
-    # 데이터 불러오기
-    file_path = '연도별 직종별 신규구인인원.csv'
-    data = pd.read_csv(file_path, index_col=0, encoding='CP949')
+    # 데이터 불러오기 (원본 CSV나 data.db가 바뀌지 않았다면 캐시된 데이터와 지표를 그대로 사용)
+    trends = load_market_trends()
+    data = trends.market
 
     # Streamlit 앱 시작
     st.markdown('<h1 style = "color : #2ec4b6; font-size : 50px; text-align : left;">취업시장 동향(Beta)</h1>', unsafe_allow_html=True)
 
-    # 직종 선택 드롭다운
-    selected_job = st.selectbox('확인해보고 싶은 직종을 선택해!', data.index)
+    # 직종 선택 (여러 직종을 함께 비교)
+    selected_jobs = st.multiselect('확인해보고 싶은 직종을 선택해!', data.series, default=data.series[:1])
+    metric_label = st.radio('지표', list(METRICS), horizontal=True)
+    metric, tickformat = METRICS[metric_label]
 
-    # 선택한 직종에 대한 그래프 표시
-    if selected_job:
+    # 선택한 직종에 대한 그래프 표시 (미리 계산된 지표에서 선택한 직종의 행만 잘라 사용)
+    if selected_jobs:
+        compared = trends.compare(selected_jobs, metric)
         fig = go.Figure()
-        fig.add_trace(go.Bar(x=data.columns.astype(str), 
-                            y=data.loc[selected_job], 
-                            name=selected_job))  
-        fig.update_layout(title='연도별 구인인원수 변화 - {}'.format(selected_job))
-        fig.update_xaxes(tickvals=data.columns, ticktext=[f'{year}년' for year in data.columns])
+        for job, values in compared.iterrows():
+            if metric == 'openings':
+                fig.add_trace(go.Bar(x=data.period_labels, y=values, name=job))
+            else:
+                fig.add_trace(go.Scatter(x=data.period_labels, y=values, name=job, mode='lines+markers'))
+        fig.update_layout(title='연도별 {} 변화 - {}'.format(metric_label, ', '.join(selected_jobs)))
+        fig.update_xaxes(tickvals=data.period_labels, ticktext=[f'{year}년' for year in data.periods])
+        fig.update_yaxes(tickformat=tickformat, autorange='reversed' if metric == 'rank' else True)
         st.plotly_chart(fig)
 
+        # 선택한 직종의 최근 값과 추세 요약
+        summary = trends.summary(selected_jobs)
+        summary.columns = [f'{data.periods[-1]}년 구인인원', '전년 대비 증감률', '연평균 성장률(CAGR)',
+                           '전체 대비 비중', '순위', f'{data.periods[0]}년 대비 순위 변화']
+        st.dataframe(summary.style.format({
+            f'{data.periods[-1]}년 구인인원': '{:,.0f}',
+            '전년 대비 증감률': '{:.1%}',
+            '연평균 성장률(CAGR)': '{:.1%}',
+            '전체 대비 비중': '{:.1%}',
+            f'{data.periods[0]}년 대비 순위 변화': '{:+d}',
+        }))
+
     # 데이터프레임 출력 (옵션)
     if st.checkbox('데이터 확인하러 가기'):
-        st.write(data)
\ No newline at end of file
+        st.write(data.frame())
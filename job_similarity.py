@@ -0,0 +1,127 @@
+import numpy as np
+
+from tag_scoring import TagScorer
+
+
+class JobSimilarityIndex:
+    '''
+    직업을 TF-IDF 가중 태그 벡터로 표현하고, 설문 응답 벡터와 코사인 유사도가 높은 직업을 찾는 인덱스.
+
+    직업 벡터는 (직업, 태그) 쌍의 수(TF)에 태그의 IDF를 곱한 뒤 길이 1로 정규화하여 한 번만 만들어 둡니다.
+    여러 직업에 흔한 태그는 가중치가 낮아지므로, 일치하는 태그 수가 같아도 드문 태그가 일치한 직업이 앞에 옵니다.
+    응답 벡터는 선택한 태그의 IDF를 길이 1로 정규화한 벡터이며, 유사도는 두 벡터의 내적입니다.
+
+    유사도 계산은 카탈로그 크기에 따라 두 가지 방식 중 하나를 사용하며, 두 방식 모두 정확한 값을 계산합니다.
+    - 'dense' : 직업 × 태그 칸 수가 dense_max_cells 이하이면 밀집 행렬을 만들어 NumPy 행렬-벡터 곱 한 번으로 계산합니다.
+    - 'sparse' : 그보다 크면 TagScorer의 태그별(CSC) 희소 행렬에서 응답 태그의 열만 읽어 계산합니다.
+      계산량이 선택한 태그에 연결된 직업 수에만 비례하므로, 직업이 수십만 개여도 근사 없이 빠릅니다.
+
+    속성 :
+        job_ids(ndarray) : 벡터의 행 순서에 대응하는 직업 id (오름차순)
+        tag_ids(ndarray) : 벡터의 열 순서에 대응하는 태그 id (오름차순)
+        idf(ndarray) : tag_ids 순서의 태그별 IDF
+        scorer(TagScorer) : 정규화된 TF-IDF 가중치의 직업×태그 희소 행렬
+        dense(ndarray) : 'dense' 방식의 직업×태그 행렬 (float32). 'sparse' 방식이면 None
+        mode(str) : 유사도 계산 방식 ('dense' 또는 'sparse')
+
+    메서드 :
+        from_frame(tag_to_jobs_df, dense_max_cells) : tag_to_jobs DataFrame으로부터 생성합니다.
+        query_weights(selected_tags) : 응답을 태그 열 위치별 TF-IDF 가중치로 변환합니다.
+        similarities(selected_tags) : 하나의 응답에 대한 직업별 코사인 유사도를 계산합니다.
+        top_k(selected_tags, k) : 유사도가 높은 상위 k개 직업을 반환합니다.
+    '''
+    # 밀집 행렬로 계산하는 최대 직업 × 태그 칸 수 (float32로 약 2MB).
+    # 이보다 크면 응답 태그의 열만 읽는 희소 곱이 더 빠릅니다 (benchmarks/bench_job_similarity.py 참고).
+    dense_max_cells = 500000
+
+    def __init__(self, job_ids, tag_ids, dense_max_cells=None):
+        '''
+        JobSimilarityIndex 클래스의 인스턴스를 초기화합니다.
+
+        매개변수 :
+            job_ids(array-like) : (직업, 태그) 쌍의 직업 id
+            tag_ids(array-like) : (직업, 태그) 쌍의 태그 id
+            dense_max_cells(int) : 밀집 행렬로 계산하는 최대 칸 수. None이면 클래스 기본값
+        '''
+        counts = TagScorer(job_ids, tag_ids).matrix
+        self.job_ids = np.unique(np.asarray(job_ids, dtype=np.int64))
+        self.tag_ids = np.unique(np.asarray(tag_ids, dtype=np.int64))
+
+        # 스무딩한 IDF: 모든 직업에 있는 태그도 가중치가 0이 되지 않습니다.
+        document_frequency = np.bincount(counts.indices, minlength=len(self.tag_ids))
+        self.idf = np.log((1 + len(self.job_ids)) / (1 + document_frequency)) + 1
+
+        # TF × IDF를 행(직업)마다 길이 1로 정규화
+        weights = counts.data * self.idf[counts.indices]
+        norms = np.sqrt(np.add.reduceat(weights ** 2, counts.indptr[:-1])) if len(weights) else weights
+        weights = weights / np.repeat(norms, np.diff(counts.indptr))
+        rows = np.repeat(np.arange(len(self.job_ids)), np.diff(counts.indptr))
+        self.scorer = TagScorer(self.job_ids[rows], self.tag_ids[counts.indices], weights)
+
+        if dense_max_cells is None:
+            dense_max_cells = self.dense_max_cells
+        if len(self.job_ids) * len(self.tag_ids) <= dense_max_cells:
+            self.dense = self.scorer.matrix.toarray().astype(np.float32)
+            self.mode = 'dense'
+        else:
+            self.dense = None
+            self.mode = 'sparse'
+
+    @classmethod
+    def from_frame(cls, tag_to_jobs_df, dense_max_cells=None):
+        '''
+        tag_to_jobs DataFrame으로부터 JobSimilarityIndex를 생성합니다.
+
+        매개변수 :
+            tag_to_jobs_df(DataFrame) : id_jobs, id_tag 컬럼을 가진 데이터
+            dense_max_cells(int) : 밀집 행렬로 계산하는 최대 칸 수
+        '''
+        return cls(tag_to_jobs_df['id_jobs'].to_numpy(), tag_to_jobs_df['id_tag'].to_numpy(), dense_max_cells)
+
+    def query_weights(self, selected_tags):
+        '''
+        응답(선택한 태그 목록)을 길이 1로 정규화한 TF-IDF 태그 가중치로 변환합니다. 인덱스에 없는 태그는 제외합니다.
+
+        매개변수 :
+            selected_tags(list) : 사용자가 선택한 태그 id 목록
+
+        반환값 :
+            positions(ndarray) : 태그의 열 위치 (중복 없음)
+            weights(ndarray) : 열 위치별 가중치
+        '''
+        positions, _ = self.scorer.tag_positions(selected_tags)
+        positions, counts = np.unique(positions, return_counts=True)
+        weights = counts * self.idf[positions]
+        norm = np.sqrt((weights ** 2).sum())
+        return positions, (weights / norm if norm else weights)
+
+    def similarities(self, selected_tags):
+        '''
+        하나의 응답에 대한 직업별 코사인 유사도를 계산합니다.
+
+        매개변수 :
+            selected_tags(list) : 사용자가 선택한 태그 id 목록
+
+        반환값 :
+            similarities(ndarray) : job_ids 순서의 0~1 유사도
+        '''
+        positions, weights = self.query_weights(selected_tags)
+        if self.mode == 'dense':
+            query = np.zeros(len(self.tag_ids), dtype=np.float32)
+            query[positions] = weights
+            return (self.dense @ query).astype(np.float64)
+        return np.asarray(self.scorer.matrix_by_tag[:, positions] @ weights).ravel()
+
+    def top_k(self, selected_tags, k=10):
+        '''
+        유사도가 높은 상위 k개 직업을 반환합니다. 유사도가 0인 직업(일치하는 태그가 없는 직업)은 제외합니다.
+
+        매개변수 :
+            selected_tags(list) : 사용자가 선택한 태그 id 목록
+            k(int) : 반환할 직업 수
+
+        반환값 :
+            job_ids(ndarray) : 유사도 내림차순의 직업 id
+            similarities(ndarray) : 직업별 유사도
+        '''
+        return self.scorer.top_k(self.similarities(selected_tags), k)
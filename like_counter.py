@@ -0,0 +1,162 @@
+import atexit
+import logging
+import sqlite3
+import threading
+from collections import Counter
+
+from db_pool import get_connection_manager
+
+logger = logging.getLogger(__name__)
+
+
+class LikeCounter:
+    '''
+    게시글/댓글 좋아요 증가분을 메모리에 모아 두었다가 주기적으로 한 번에 저장하는 버퍼.
+
+    요청 스레드는 add()로 메모리의 카운터만 올리고 바로 돌아갑니다.
+    백그라운드 스레드가 flush_interval마다 모인 증가분을 대상별로 합쳐 하나의 쓰기 트랜잭션에서 저장하므로,
+    인기 게시글에 좋아요가 몰려도 쓰기 트랜잭션은 주기마다 한 번만 일어납니다.
+    아직 저장되지 않은 증가분은 pending()으로 조회할 수 있어, DB 값에 더해 표시하면 좋아요를 누른 사용자가 곧바로 반영된 값을 봅니다.
+
+    속성 :
+        db(ConnectionManager) : 게시판 DB 연결 관리자
+        flush_interval(float) : 증가분을 저장하는 주기(초)
+
+    메서드 :
+        add(kind, item_id, count) : 좋아요 증가분을 메모리에 더합니다.
+        pending(kind, item_id) : 아직 DB에 저장되지 않은 증가분을 반환합니다.
+        flush() : 모인 증가분을 지금 저장합니다.
+        close() : 남은 증가분을 저장하고 백그라운드 스레드를 종료합니다.
+    '''
+    # 좋아요 대상 종류별 증가 SQL
+    update_sql = {
+        'posts': 'UPDATE posts SET likes = likes + ? WHERE id = ?',
+        'comments': 'UPDATE comments SET likes = likes + ? WHERE id = ?',
+    }
+
+    def __init__(self, db, flush_interval=0.2):
+        '''
+        LikeCounter 클래스의 인스턴스를 초기화하고 백그라운드 스레드를 시작합니다.
+
+        매개변수 :
+            db(ConnectionManager) : 게시판 DB 연결 관리자
+            flush_interval(float) : 증가분을 저장하는 주기(초)
+        '''
+        self.db = db
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.counts = Counter()
+        self.in_flight = Counter()
+        self.closed = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f'LikeCounter({db.db_path})', daemon=True)
+        self.thread.start()
+
+    def add(self, kind, item_id, count=1):
+        '''
+        좋아요 증가분을 메모리에 더합니다. DB에는 다음 저장 주기에 반영됩니다.
+
+        매개변수 :
+            kind(str) : 좋아요 대상 종류 ('posts' 또는 'comments')
+            item_id(int) : 게시글 또는 댓글 ID
+            count(int) : 더할 좋아요 수
+        '''
+        if kind not in self.update_sql:
+            raise ValueError(f'알 수 없는 좋아요 대상입니다: {kind}')
+        if self.closed.is_set():
+            raise RuntimeError('LikeCounter가 이미 종료되었습니다.')
+        with self.lock:
+            self.counts[(kind, item_id)] += count
+
+    def pending(self, kind, item_id):
+        '''
+        아직 DB에 저장되지 않은(저장 중인 것 포함) 좋아요 증가분을 반환합니다.
+
+        DB 값보다 먼저 조회해야 합니다. 그 사이에 저장이 끝나면 잠시 크게 보일 수는 있어도,
+        좋아요를 누른 사용자가 자신의 좋아요가 빠진 값을 보는 일은 없습니다.
+
+        매개변수 :
+            kind(str) : 좋아요 대상 종류 ('posts' 또는 'comments')
+            item_id(int) : 게시글 또는 댓글 ID
+
+        반환값 :
+            count(int) : 저장되지 않은 좋아요 수
+        '''
+        key = (kind, item_id)
+        with self.lock:
+            return self.counts[key] + self.in_flight[key]
+
+    def flush(self):
+        '''
+        지금까지 모인 증가분을 대상별로 합쳐 하나의 쓰기 트랜잭션으로 저장합니다.
+        저장에 실패하면 증가분을 다시 메모리에 되돌려 다음 주기에 저장합니다.
+        '''
+        with self.flush_lock:
+            with self.lock:
+                if not self.counts:
+                    return
+                self.in_flight, self.counts = self.counts, Counter()
+            batch = self.in_flight
+            try:
+                with self.db.write() as conn:
+                    for kind, sql in self.update_sql.items():
+                        conn.executemany(sql, ((count, item_id) for (item_kind, item_id), count in batch.items()
+                                               if item_kind == kind))
+            except sqlite3.Error:
+                logger.exception('좋아요 %d건을 저장하지 못했습니다.', sum(batch.values()))
+                with self.lock:
+                    self.counts.update(batch)
+                    self.in_flight = Counter()
+            else:
+                with self.lock:
+                    self.in_flight = Counter()
+
+    def close(self):
+        '''
+        남은 증가분을 모두 저장하고 백그라운드 스레드를 종료합니다.
+        '''
+        if self.closed.is_set():
+            return
+        self.closed.set()
+        self.thread.join()
+        self.flush()
+
+    def run(self):
+        '''
+        백그라운드 스레드의 메인 루프. close()가 호출될 때까지 flush_interval마다 flush()를 호출합니다.
+        '''
+        while not self.closed.wait(self.flush_interval):
+            self.flush()
+
+
+_counters = {}
+_counters_lock = threading.Lock()
+
+
+def get_like_counter(db_path, flush_interval=0.2):
+    '''
+    DB 경로별로 프로세스 전체에서 공유하는 LikeCounter를 반환합니다.
+
+    매개변수 :
+        db_path(str) : 게시판 SQLite DB 파일 경로
+        flush_interval(float) : 증가분을 저장하는 주기(초)
+    '''
+    counter = _counters.get(db_path)
+    if counter is not None:
+        return counter
+    with _counters_lock:
+        if db_path not in _counters:
+            _counters[db_path] = LikeCounter(get_connection_manager(db_path), flush_interval)
+        return _counters[db_path]
+
+
+@atexit.register
+def close_like_counters():
+    '''
+    프로세스 종료 시 모든 LikeCounter의 남은 증가분을 저장합니다.
+    '''
+    with _counters_lock:
+        counters = list(_counters.values())
+        _counters.clear()
+    for counter in counters:
+        counter.close()
@@ -0,0 +1,256 @@
+import os
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from precompute import MARKET_CSV, ensure_job_openings, source_stamp
+from refdata import load_reference_data
+
+# DB 경로별로 job_openings를 마지막으로 확인한 원본 CSV의 스탬프
+_checked_sources = {}
+_checked_lock = threading.Lock()
+
+
+class MarketData:
+    '''
+    계열(직종 등) x 기간의 신규 구인인원을 숫자 행렬로 보관하는 읽기 전용 데이터.
+
+    계열 목록과 긴 형태의 (계열 id, 기간, 값) 데이터를 한 번만 행렬로 변환해 두고, 계열 하나의 기간별 값은
+    계열 위치를 딕셔너리로 찾아 행렬의 한 행을 잘라 반환하므로 데이터 크기와 관계없이 일정한 시간이 걸립니다.
+    계열 키는 직종 하나일 수도 있고, 지역별 직종처럼 여러 열의 튜플일 수도 있습니다.
+    여러 세션이 같은 객체를 공유하므로 반환된 배열과 DataFrame은 수정하면 안 됩니다.
+
+    속성 :
+        series(list) : 계열 키 목록 (데이터에 처음 나온 순서)
+        periods(list) : 기간 목록 (오름차순)
+        period_labels(list) : 그래프 축에 쓸 기간 문자열 목록
+        values(numpy.ndarray) : 계열 x 기간 값 행렬. 빈 칸이 없으면 int64, 있으면 NaN을 포함한 float64
+
+    메서드 :
+        series_values(key) : 계열 하나의 기간별 값을 반환합니다.
+        frame() : 계열 x 기간 DataFrame을 반환합니다.
+    '''
+    def __init__(self, series, openings, period='period', value='openings'):
+        '''
+        계열 목록과 긴 형태의 값 데이터를 계열 x 기간 행렬로 변환합니다.
+
+        매개변수 :
+            series(DataFrame) : series_id 열과 계열 키 열(예: occupation, 또는 region과 occupation). 행 순서가 계열 순서가 됩니다.
+            openings(DataFrame) : series_id 열, 기간 열, 값 열을 가진 긴 형태의 데이터
+            period(str) : 기간 열 이름
+            value(str) : 값 열 이름
+        '''
+        keys = [column for column in series.columns if column != 'series_id']
+        rows = pd.Index(series['series_id']).get_indexer(openings['series_id'])
+        period_codes, periods = pd.factorize(openings[period], sort=True)
+
+        values = openings[value].to_numpy()
+        shape = (len(series), len(periods))
+        if len(values) == shape[0] * shape[1]:
+            matrix = np.zeros(shape, dtype=values.dtype)
+        else:
+            matrix = np.full(shape, np.nan)
+        matrix[rows, period_codes] = values
+
+        self.series = (series[keys[0]].tolist() if len(keys) == 1
+                       else list(series[keys].itertuples(index=False, name=None)))
+        self.periods = list(periods)
+        self.period_labels = [str(p) for p in self.periods]
+        self.values = matrix
+        self.positions = {key: position for position, key in enumerate(self.series)}
+        self.keys = keys
+        self._frame = None
+
+    def series_values(self, key):
+        '''
+        계열 하나의 기간별 값을 반환합니다. 행렬의 한 행을 복사 없이 잘라 반환합니다.
+
+        매개변수 :
+            key : 계열 키 (직종명 또는 키 튜플)
+
+        반환값 :
+            values(numpy.ndarray) : periods 순서의 값 (수정 금지)
+        '''
+        return self.values[self.positions[key]]
+
+    def frame(self):
+        '''
+        계열 x 기간 DataFrame을 반환합니다. 처음 요청될 때 한 번만 만듭니다.
+        '''
+        if self._frame is None:
+            index = (pd.Index(self.series) if len(self.keys) == 1
+                     else pd.MultiIndex.from_tuples(self.series, names=self.keys))
+            self._frame = pd.DataFrame(self.values, index=index, columns=self.periods)
+        return self._frame
+
+
+class MarketTrends:
+    '''
+    MarketData의 모든 계열에 대한 추세 지표를 한 번에 계산해 두는 읽기 전용 데이터.
+
+    전년 대비 증감률, 연평균 성장률(CAGR), 기간별 비중과 순위를 계열 x 기간 행렬 연산으로 한꺼번에 계산하므로,
+    여러 계열을 비교할 때는 계산된 행렬에서 선택한 행만 잘라 쓰면 됩니다.
+    값이 0이거나 비어 있어 계산할 수 없는 칸은 NaN입니다.
+
+    속성 :
+        market(MarketData) : 원본 데이터
+        periods_per_year(int) : 1년에 해당하는 기간 수 (연 단위 1, 월 단위 12). 전년 대비 증감률의 비교 간격입니다.
+        growth(numpy.ndarray) : 계열 x 기간 전년 대비 증감률. 앞의 periods_per_year개 기간은 NaN
+        cagr(numpy.ndarray) : 계열별 첫 기간 대비 마지막 기간의 연평균 성장률
+        share(numpy.ndarray) : 계열 x 기간 비중 (기간별 전체 합 대비)
+        rank(numpy.ndarray) : 계열 x 기간 순위 (값이 큰 순서로 1부터)
+        rank_change(numpy.ndarray) : 계열별 첫 기간 대비 마지막 기간의 순위 상승 폭 (양수이면 순위가 오름)
+
+    메서드 :
+        metric(name) : 지표 이름에 해당하는 계열 x 기간 행렬을 반환합니다.
+        compare(keys, name) : 선택한 계열의 기간별 지표를 DataFrame으로 반환합니다.
+        summary(keys) : 선택한 계열의 최근 값과 추세 요약을 DataFrame으로 반환합니다.
+    '''
+    metrics = ['openings', 'growth', 'share', 'rank']
+
+    def __init__(self, market, periods_per_year=1):
+        '''
+        MarketTrends 클래스의 인스턴스를 초기화하고 모든 지표를 계산합니다.
+
+        매개변수 :
+            market(MarketData) : 원본 데이터
+            periods_per_year(int) : 1년에 해당하는 기간 수
+        '''
+        values = market.values.astype('float64')
+        n_series, n_periods = values.shape
+        lag = periods_per_year
+
+        growth = np.full(values.shape, np.nan)
+        if n_periods > lag:
+            previous = values[:, :-lag]
+            np.divide(values[:, lag:] - previous, previous, out=growth[:, lag:], where=previous > 0)
+
+        cagr = np.full(n_series, np.nan)
+        if n_periods > 1:
+            first, last = values[:, 0], values[:, -1]
+            valid = (first > 0) & (last >= 0)
+            cagr[valid] = (last[valid] / first[valid]) ** (periods_per_year / (n_periods - 1)) - 1
+
+        totals = np.nansum(values, axis=0)
+        share = np.full(values.shape, np.nan)
+        np.divide(values, totals, out=share, where=totals > 0)
+
+        # 기간별로 값이 큰 순서의 순위. 비어 있는 칸은 가장 뒤로 보냄
+        order = np.argsort(-np.nan_to_num(values, nan=-np.inf), axis=0, kind='stable')
+        rank = np.empty(values.shape, dtype='int64')
+        np.put_along_axis(rank, order, np.arange(1, n_series + 1)[:, None], axis=0)
+
+        self.market = market
+        self.periods_per_year = periods_per_year
+        self.growth = growth
+        self.cagr = cagr
+        self.share = share
+        self.rank = rank
+        self.rank_change = rank[:, 0] - rank[:, -1]
+
+    def metric(self, name):
+        '''
+        지표 이름(openings, growth, share, rank)에 해당하는 계열 x 기간 행렬을 반환합니다.
+        '''
+        if name not in self.metrics:
+            raise ValueError(f'지원하지 않는 지표입니다: {name}')
+        return self.market.values if name == 'openings' else getattr(self, name)
+
+    def positions(self, keys):
+        '''
+        계열 키 목록의 행렬 행 위치를 반환합니다.
+        '''
+        return [self.market.positions[key] for key in keys]
+
+    def compare(self, keys, name='openings'):
+        '''
+        선택한 계열의 기간별 지표를 반환합니다. 계산된 행렬에서 선택한 행만 잘라 만듭니다.
+
+        매개변수 :
+            keys(list) : 계열 키 목록
+            name(str) : 지표 이름 (openings, growth, share, rank)
+
+        반환값 :
+            df(DataFrame) : 행: 계열, 열: 기간
+        '''
+        return pd.DataFrame(self.metric(name)[self.positions(keys)], index=list(keys), columns=self.market.periods)
+
+    def summary(self, keys):
+        '''
+        선택한 계열의 최근 값, 최근 전년 대비 증감률, CAGR, 최근 비중, 최근 순위, 순위 변화를 반환합니다.
+
+        매개변수 :
+            keys(list) : 계열 키 목록
+
+        반환값 :
+            df(DataFrame) : 행: 계열, 열: 요약 지표
+        '''
+        rows = self.positions(keys)
+        return pd.DataFrame({
+            'latest': self.market.values[rows, -1],
+            'growth': self.growth[rows, -1],
+            'cagr': self.cagr[rows],
+            'share': self.share[rows, -1],
+            'rank': self.rank[rows, -1],
+            'rank_change': self.rank_change[rows],
+        }, index=list(keys))
+
+
+def build_market_data(data):
+    '''
+    참조 데이터의 job_openings_series, job_openings 테이블로 MarketData를 만듭니다. ReferenceData.derived()의 builder로 사용합니다.
+    '''
+    return MarketData(data['job_openings_series'], data['job_openings'])
+
+
+def load_market_data(db_path='./db/data.db', csv_path=MARKET_CSV):
+    '''
+    취업시장 동향 데이터를 반환합니다.
+
+    원본 CSV의 스탬프(mtime, 크기)가 마지막 확인 때와 같으면 SQLite를 열지 않습니다.
+    CSV가 바뀌었으면 job_openings 테이블을 다시 만들고, data.db가 바뀌므로 참조 데이터 캐시도 새로 읽습니다.
+    MarketData는 참조 데이터 캐시에 함께 보관되므로 변환은 data.db가 바뀔 때마다 한 번만 일어납니다.
+
+    매개변수 :
+        db_path(str) : SQLite DB 파일 경로
+        csv_path(str) : 신규 구인인원 CSV 파일 경로
+
+    반환값 :
+        market(MarketData) : 공유 취업시장 동향 데이터
+    '''
+    key = os.path.abspath(db_path)
+    stamp = source_stamp(csv_path)
+    if _checked_sources.get(key) != stamp:
+        with _checked_lock:
+            if _checked_sources.get(key) != stamp:
+                conn = sqlite3.connect(db_path)
+                try:
+                    ensure_job_openings(conn, csv_path)
+                finally:
+                    conn.close()
+                _checked_sources[key] = stamp
+    return load_reference_data(db_path).derived('market_data', build_market_data)
+
+
+def build_market_trends(data):
+    '''
+    참조 데이터의 MarketData로 MarketTrends를 만듭니다. ReferenceData.derived()의 builder로 사용합니다.
+    '''
+    return MarketTrends(data.derived('market_data', build_market_data))
+
+
+def load_market_trends(db_path='./db/data.db', csv_path=MARKET_CSV):
+    '''
+    취업시장 동향 데이터의 추세 지표를 반환합니다. 지표는 데이터 버전(data.db 스탬프)마다 한 번만 계산됩니다.
+
+    매개변수 :
+        db_path(str) : SQLite DB 파일 경로
+        csv_path(str) : 신규 구인인원 CSV 파일 경로
+
+    반환값 :
+        trends(MarketTrends) : 공유 추세 지표
+    '''
+    load_market_data(db_path, csv_path)
+    return load_reference_data(db_path).derived('market_trends', build_market_trends)
@@ -0,0 +1,401 @@
+import logging
+import sqlite3
+import threading
+
+from ncs_hierarchy import NCS_LEVELS, NCS_TABLES, level_column_sql
+from posting_ingest import content_hash, parse_deadline, posting_key
+from precompute import ensure_job_postings_flat, ensure_job_recommendations
+from regions import update_region_codes
+
+logger = logging.getLogger(__name__)
+
+# ncs_code로부터 계산되는 NCS 대/중/소분류 생성 열 (ncs_hierarchy.NCS_LEVELS)
+# 생성 열은 PRAGMA table_info에 나타나지 않으므로 적재나 복사할 때 값을 넣지 않습니다.
+NCS_LEVEL_COLUMNS = ',\n        '.join(level_column_sql(column) for column in NCS_LEVELS)
+
+# data.db 참조 테이블의 목표 스키마 (기본키, 외래키 포함)
+# tosql.load_data()는 CSV를 이 스키마로 적재하고, 마이그레이션은 pandas의 to_sql로 만들어진
+# 키와 인덱스가 없는 기존 테이블을 이 스키마로 다시 만들고 데이터를 옮깁니다.
+TABLE_SCHEMAS = {
+    'jobs': '''(
+        id_jobs INTEGER PRIMARY KEY,
+        name_jobs TEXT
+    )''',
+    'ncs': '''(
+        ncs_code INTEGER PRIMARY KEY,
+        ncs_name TEXT
+    )''',
+    'ncs_to_jobs': f'''(
+        id_jobs INTEGER NOT NULL REFERENCES jobs(id_jobs),
+        ncs_code INTEGER NOT NULL,
+        {NCS_LEVEL_COLUMNS},
+        PRIMARY KEY (id_jobs, ncs_code)
+    ) WITHOUT ROWID''',
+    'question': '''(
+        id_question INTEGER PRIMARY KEY,
+        id_tag_class INTEGER REFERENCES tag_class(id_tag_class),
+        name_question TEXT
+    )''',
+    'tag_class': '''(
+        id_tag_class INTEGER PRIMARY KEY,
+        name_tag_class TEXT
+    )''',
+    'tag': '''(
+        id_tag INTEGER PRIMARY KEY,
+        answer_tag TEXT
+    )''',
+    'tag_to_jobs': '''(
+        id_jobs INTEGER NOT NULL REFERENCES jobs(id_jobs),
+        id_tag INTEGER NOT NULL REFERENCES tag(id_tag),
+        PRIMARY KEY (id_jobs, id_tag)
+    ) WITHOUT ROWID''',
+    # region_code는 CSV에 없고 적재할 때 address에서 추출 (regions.REGIONS의 위치)
+    'edu_company': '''(
+        id_edu_company INTEGER PRIMARY KEY,
+        name_edu_company TEXT,
+        address TEXT,
+        region_code INTEGER
+    )''',
+    # id_edu_program은 과정 id로 회차마다 반복되므로 기본키로 쓰지 않고 rowid를 사용
+    'edu_program': f'''(
+        id_edu_program INTEGER,
+        id_edu_company INTEGER REFERENCES edu_company(id_edu_company),
+        name_edu_program TEXT,
+        date_start INTEGER,
+        date_end INTEGER,
+        cost INTEGER,
+        oopc INTEGER,
+        link TEXT,
+        online_status TEXT,
+        employment_status TEXT,
+        ncs_code INTEGER,
+        {NCS_LEVEL_COLUMNS}
+    )''',
+    'jobs_to_worknet': '''(
+        id_jobs INTEGER NOT NULL REFERENCES jobs(id_jobs),
+        work_code INTEGER NOT NULL,
+        PRIMARY KEY (id_jobs, work_code)
+    ) WITHOUT ROWID''',
+    'worknet_company': '''(
+        id_work_company INTEGER PRIMARY KEY,
+        work_company TEXT
+    )''',
+    'worknet_positions': '''(
+        id_work_positions INTEGER PRIMARY KEY,
+        id_work_company INTEGER REFERENCES worknet_company(id_work_company),
+        work_code INTEGER,
+        recruit TEXT,
+        job_describ_1 TEXT,
+        job_describ_2 TEXT,
+        condition TEXT,
+        date TEXT,
+        link TEXT,
+        posting_key TEXT,
+        content_hash TEXT,
+        expires_on TEXT
+    )''',
+}
+
+# 크롤러가 증분 적재하는 공고 테이블 (posting_ingest.PostingIngestor)
+POSTING_TABLES = ['worknet_company', 'worknet_positions']
+
+# 조회 패턴에 맞춘 인덱스 (edu.py, work.py, survey.py, precompute.py)
+INDEXES = [
+    'CREATE INDEX IF NOT EXISTS idx_jobs_name ON jobs (name_jobs, id_jobs)',
+    'CREATE INDEX IF NOT EXISTS idx_ncs_to_jobs_ncs ON ncs_to_jobs (ncs_code, id_jobs)',
+    'CREATE INDEX IF NOT EXISTS idx_tag_to_jobs_tag ON tag_to_jobs (id_tag, id_jobs)',
+    'CREATE INDEX IF NOT EXISTS idx_jobs_to_worknet_code ON jobs_to_worknet (work_code, id_jobs)',
+    'CREATE INDEX IF NOT EXISTS idx_edu_program_ncs ON edu_program (ncs_code, id_edu_company)',
+    'CREATE INDEX IF NOT EXISTS idx_edu_program_major ON edu_program (ncs_major, ncs_code)',
+    'CREATE INDEX IF NOT EXISTS idx_ncs_to_jobs_major ON ncs_to_jobs (ncs_major, id_jobs)',
+    'CREATE INDEX IF NOT EXISTS idx_worknet_positions_code ON worknet_positions (work_code, id_work_company)',
+]
+
+
+def table_exists(conn, name):
+    '''
+    주어진 이름의 테이블이 존재하는지 확인합니다.
+    '''
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (name,)).fetchone() is not None
+
+
+def rebuild_table(conn, name, schema):
+    '''
+    테이블을 주어진 스키마로 다시 만들고 기존 데이터를 옮깁니다.
+    SQLite는 기존 테이블에 기본키를 추가할 수 없으므로 새 테이블 생성 → 복사 → 교체 순서로 처리합니다.
+    완전히 같은 중복 행은 하나로 합치며, 키가 충돌하는 서로 다른 행이 있으면 IntegrityError가 발생합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : 트랜잭션이 시작된 DB 연결
+        name(str) : 테이블 이름
+        schema(str) : 컬럼 및 제약조건 정의
+    '''
+    if not table_exists(conn, name):
+        return
+    new_name = f'{name}__new'
+    conn.execute(f'DROP TABLE IF EXISTS "{new_name}"')
+    conn.execute(f'CREATE TABLE "{new_name}" {schema}')
+    new_columns = [row[1] for row in conn.execute(f'PRAGMA table_info("{new_name}")')]
+    old_columns = {row[1] for row in conn.execute(f'PRAGMA table_info("{name}")')}
+    columns = ', '.join(f'"{column}"' for column in new_columns if column in old_columns)
+    conn.execute(f'INSERT INTO "{new_name}" ({columns}) SELECT DISTINCT {columns} FROM "{name}"')
+    conn.execute(f'DROP TABLE "{name}"')
+    conn.execute(f'ALTER TABLE "{new_name}" RENAME TO "{name}"')
+
+
+def add_keys(conn):
+    '''
+    참조 테이블에 기본키와 외래키를 선언합니다.
+    '''
+    for name, schema in TABLE_SCHEMAS.items():
+        rebuild_table(conn, name, schema)
+
+
+def table_columns(conn, name):
+    '''
+    테이블의 열 이름 집합을 반환합니다. 생성 열도 포함합니다.
+    '''
+    return {row[1] for row in conn.execute(f'PRAGMA table_xinfo("{name}")')}
+
+
+def add_indexes(conn):
+    '''
+    조회 패턴에 맞춘 인덱스를 생성합니다.
+    테이블이나 열이 아직 없으면 (이후 마이그레이션에서 추가되는 열 등) 해당 인덱스는 건너뜁니다.
+    '''
+    for statement in INDEXES:
+        table, columns = statement.split(' ON ')[1].split(' ', 1)
+        if table_exists(conn, table) and set(columns.strip('()').split(', ')) <= table_columns(conn, table):
+            conn.execute(statement)
+    conn.execute('ANALYZE')
+
+
+def add_posting_keys(conn):
+    '''
+    채용 공고의 증분 적재에 필요한 열과 인덱스를 준비합니다. 스키마만 바꾸며 행을 삭제하지 않습니다.
+
+    worknet_positions에 posting_key, content_hash, expires_on 열이 없으면 추가하고, 값이 비어 있는 공고를 채웁니다.
+    중복 공고와 회사를 합치고 UNIQUE 인덱스를 만드는 것은 적재 경로의 dedupe_postings()가 처리합니다.
+    '''
+    if not (table_exists(conn, 'worknet_positions') and table_exists(conn, 'worknet_company')):
+        return
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(worknet_positions)')}
+    for column in ('posting_key', 'content_hash', 'expires_on'):
+        if column not in columns:
+            conn.execute(f'ALTER TABLE worknet_positions ADD COLUMN {column} TEXT')
+
+    rows = conn.execute('''SELECT p.rowid, p.link, p.recruit, c.work_company,
+               p.job_describ_1, p.job_describ_2, p.condition, p.date
+        FROM worknet_positions p LEFT JOIN worknet_company c ON c.id_work_company = p.id_work_company
+        WHERE p.posting_key IS NULL''').fetchall()
+    conn.executemany('UPDATE worknet_positions SET posting_key = ?, content_hash = ?, expires_on = ? WHERE rowid = ?',
+                     ((posting_key(link, recruit, company), content_hash(jd_1, jd_2, condition, date), parse_deadline(date), id_)
+                      for id_, link, recruit, company, jd_1, jd_2, condition, date in rows))
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_worknet_positions_expires ON worknet_positions (expires_on)')
+
+
+def dedupe_postings(conn):
+    '''
+    중복 공고와 회사를 정리하고 증분 적재용 UNIQUE 인덱스를 만듭니다.
+    행을 삭제하므로 마이그레이션(웹 앱 시작 시 자동 적용)에서는 호출하지 않고, 공고를 적재하는 경로에서만 호출합니다.
+
+    이름이 같은 회사는 id가 가장 작은 회사로 합치고, 같은 직업 코드에 같은 공고가 여러 번 있으면 id가 가장 작은 것만 남깁니다.
+    이후 (posting_key, work_code)와 회사명에 UNIQUE 인덱스를 만들어 공고와 회사 id가 적재할 때마다 유지되게 합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : 트랜잭션이 시작된 DB 연결
+
+    반환값 :
+        deleted(dict) : 테이블별 삭제된 행 수
+    '''
+    deleted = {name: 0 for name in POSTING_TABLES}
+    if not (table_exists(conn, 'worknet_positions') and table_exists(conn, 'worknet_company')):
+        return deleted
+
+    # 같은 이름의 회사를 하나로 합침
+    conn.execute('''UPDATE worknet_positions SET id_work_company = (
+            SELECT MIN(c2.id_work_company) FROM worknet_company c1
+            JOIN worknet_company c2 ON c2.work_company = c1.work_company
+            WHERE c1.id_work_company = worknet_positions.id_work_company)
+        WHERE id_work_company IN (
+            SELECT id_work_company FROM worknet_company
+            WHERE id_work_company NOT IN (SELECT MIN(id_work_company) FROM worknet_company GROUP BY work_company))''')
+    deleted['worknet_company'] = conn.execute('''DELETE FROM worknet_company
+        WHERE id_work_company NOT IN (SELECT MIN(id_work_company) FROM worknet_company GROUP BY work_company)''').rowcount
+    deleted['worknet_positions'] = conn.execute('''DELETE FROM worknet_positions WHERE id_work_positions NOT IN (
+        SELECT MIN(id_work_positions) FROM worknet_positions GROUP BY posting_key, work_code)''').rowcount
+    for name, count in deleted.items():
+        if count:
+            logger.info('%s에서 중복 행 %d개를 삭제했습니다.', name, count)
+
+    conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_worknet_positions_key ON worknet_positions (posting_key, work_code)')
+    conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_worknet_company_name ON worknet_company (work_company)')
+    return deleted
+
+
+def rebuild_edu_program(conn):
+    '''
+    edu_program을 목표 스키마로 다시 만듭니다. pandas가 인덱스를 저장한 "Unnamed: 0" 열은 목표 스키마에 없으므로 제거되고,
+    테이블과 함께 삭제된 인덱스는 다시 생성합니다.
+    '''
+    rebuild_table(conn, 'edu_program', TABLE_SCHEMAS['edu_program'])
+    add_indexes(conn)
+
+
+def add_region_codes(conn):
+    '''
+    edu_company에 region_code 열이 없으면 추가하고, 주소에서 추출한 시/도 코드로 채웁니다.
+    '''
+    if not table_exists(conn, 'edu_company'):
+        return
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(edu_company)')}
+    if 'region_code' not in columns:
+        conn.execute('ALTER TABLE edu_company ADD COLUMN region_code INTEGER')
+    update_region_codes(conn, 'edu_company', 'address')
+
+
+def add_ncs_levels(conn):
+    '''
+    edu_program과 ncs_to_jobs에 NCS 대/중/소분류 생성 열이 없으면 추가하고 분류 인덱스를 만듭니다.
+    '''
+    for name in NCS_TABLES:
+        if not table_exists(conn, name):
+            continue
+        columns = table_columns(conn, name)
+        for column in NCS_LEVELS:
+            if column not in columns:
+                conn.execute(f'ALTER TABLE "{name}" ADD COLUMN {level_column_sql(column)}')
+    add_indexes(conn)
+
+
+def prepare_posting_tables(conn):
+    '''
+    공고를 적재하기 전에 공고 테이블을 준비합니다.
+
+    먼저 적용되지 않은 마이그레이션을 적용하여 to_sql로 만들어진 기존 공고 테이블을 기본키가 있는 목표 스키마로 다시 만듭니다.
+    기본키가 없는 테이블에 적재하면 새 회사와 공고의 id가 NULL로 저장되기 때문입니다.
+    이후 공고 테이블이 없으면 목표 스키마로 만들고, 증분 적재용 열을 채운 뒤 dedupe_postings()로 중복을 정리하고 UNIQUE 인덱스를 만듭니다.
+    마이그레이션 이후 단계는 하나의 트랜잭션으로 처리하며 여러 번 호출해도 결과가 같습니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : DB 연결
+
+    반환값 :
+        deleted(dict) : 테이블별 삭제된 중복 행 수
+    '''
+    migrate(conn)
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for name in POSTING_TABLES:
+                conn.execute(f'CREATE TABLE IF NOT EXISTS "{name}" {TABLE_SCHEMAS[name]}')
+            add_posting_keys(conn)
+            deleted = dedupe_postings(conn)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+    finally:
+        conn.isolation_level = isolation_level
+    return deleted
+
+
+# (버전, 설명, 적용 함수) 목록. 버전은 PRAGMA user_version에 기록됩니다.
+# 각 단계는 여러 번 적용해도 결과가 같도록 작성합니다 (migrate(conn, reapply=True)로 처음부터 다시 적용 가능).
+MIGRATIONS = [
+    (1, '참조 테이블 기본키/외래키 선언', add_keys),
+    (2, '조회용 커버링 인덱스 생성', add_indexes),
+    (3, '채용 공고 증분 적재용 키/해시 열 추가', add_posting_keys),
+    (4, '교육 프로그램 테이블 열 타입/외래키 선언 및 "Unnamed: 0" 열 제거', rebuild_edu_program),
+    (5, '교육기관 주소의 시/도 코드(region_code) 열 추가', add_region_codes),
+    (6, '교육 프로그램/직업-NCS 테이블에 NCS 대/중/소분류 열과 인덱스 추가', add_ncs_levels),
+]
+
+
+def current_version(conn):
+    '''
+    DB에 적용된 스키마 버전을 반환합니다.
+    '''
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def migrate(conn, migrations=MIGRATIONS, reapply=False):
+    '''
+    아직 적용되지 않은 마이그레이션을 순서대로 적용합니다.
+    각 단계는 하나의 트랜잭션으로 처리되며, 스키마 버전도 같은 트랜잭션 안에서 갱신됩니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : DB 연결
+        migrations(list) : (버전, 설명, 적용 함수) 목록
+        reapply(bool) : True이면 이미 적용된 단계도 처음부터 다시 적용합니다.
+
+    반환값 :
+        applied(list) : 이번에 적용된 (버전, 설명) 목록
+    '''
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    applied = []
+    try:
+        version = 0 if reapply else current_version(conn)
+        for target, description, apply in migrations:
+            if target <= version:
+                continue
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                apply(conn)
+                conn.execute(f'PRAGMA user_version = {int(target)}')
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            applied.append((target, description))
+    finally:
+        conn.isolation_level = isolation_level
+    return applied
+
+
+_migrated_dbs = set()
+_migrate_lock = threading.Lock()
+
+
+def ensure_migrated(db_path):
+    '''
+    DB에 최신 마이그레이션이 적용되어 있는지 프로세스당 한 번 확인하고, 필요하면 적용합니다.
+    페이지가 조회만 하도록, 사전 계산 테이블(job_postings_flat, 직업별 추천 테이블)이 없으면 이때 함께 생성합니다.
+
+    매개변수 :
+        db_path(str) : SQLite DB 파일 경로
+    '''
+    if db_path in _migrated_dbs:
+        return
+    with _migrate_lock:
+        if db_path in _migrated_dbs:
+            return
+        conn = sqlite3.connect(db_path)
+        try:
+            migrate(conn)
+            ensure_job_postings_flat(conn)
+            ensure_job_recommendations(conn)
+        finally:
+            conn.close()
+        _migrated_dbs.add(db_path)
+
+
+def main(db_path='./db/data.db'):
+    '''
+    data.db에 마이그레이션을 적용하고 결과를 출력합니다.
+    '''
+    conn = sqlite3.connect(db_path)
+    before = current_version(conn)
+    applied = migrate(conn)
+    for version, description in applied:
+        print(f'v{version}: {description}')
+    print(f'schema version {before} -> {current_version(conn)}')
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import pandas as pd
+
+# NCS 코드는 대분류(2자리) + 중분류(2자리) + 소분류(2자리) + 세분류(2자리)의 8자리 정수입니다.
+# 대분류가 한 자리이면 앞의 0이 빠져 7자리로 저장됩니다 (예: 6010101 = 대분류 6, 중분류 01, 소분류 01, 세분류 01).
+# 각 분류 단계의 코드는 ncs_code를 나눈 몫이며, edu_program과 ncs_to_jobs에 정수 생성 열로 선언되어 있습니다.
+NCS_LEVELS = {
+    'ncs_major': 1000000,  # 대분류
+    'ncs_middle': 10000,   # 대분류 + 중분류
+    'ncs_minor': 100,      # 대분류 + 중분류 + 소분류
+}
+
+# NCS 분류 단계 열이 있는 테이블
+NCS_TABLES = ['edu_program', 'ncs_to_jobs']
+
+# 화면에 보여주는 직업 분야와 해당 NCS 대분류. 목록에 없는 대분류는 OTHER_FIELD로 묶습니다.
+JOB_FIELDS = {
+    '음식+식품': [13, 21],
+    '정보통신': [20],
+    '보건': [6],
+    '건설': [14],
+    '문화': [8],
+}
+OTHER_FIELD = '기타'
+
+# NCS 대분류 → 직업 분야
+FIELD_BY_MAJOR = {major: field for field, majors in JOB_FIELDS.items() for major in majors}
+
+
+def level_column_sql(column):
+    '''
+    NCS 분류 단계 열의 정의(ncs_code로부터 계산되는 생성 열)를 반환합니다.
+    ALTER TABLE ADD COLUMN으로도 추가할 수 있도록 VIRTUAL로 선언하며, 인덱스를 만들면 값이 인덱스에 저장됩니다.
+
+    매개변수 :
+        column(str) : NCS_LEVELS의 열 이름
+
+    반환값 :
+        sql(str) : 열 정의
+    '''
+    return f'{column} INTEGER GENERATED ALWAYS AS (ncs_code / {NCS_LEVELS[column]}) VIRTUAL'
+
+
+def field_names(majors):
+    '''
+    NCS 대분류 코드 열 전체를 직업 분야 이름 열로 변환합니다.
+
+    매개변수 :
+        majors(Series) : ncs_major 열
+
+    반환값 :
+        fields(Series) : 같은 인덱스의 직업 분야 이름 열
+    '''
+    return majors.map(FIELD_BY_MAJOR).fillna(OTHER_FIELD).rename('field_name')
+
+
+def group_jobs_by_field(majors, name_jobs):
+    '''
+    (NCS 대분류, 직업명) 쌍을 직업 분야별 직업명 목록으로 묶습니다. 직업명은 처음 나온 순서대로 한 번씩만 들어갑니다.
+
+    매개변수 :
+        majors(Series) : ncs_major 열
+        name_jobs(Series) : 같은 행의 직업명 열
+
+    반환값 :
+        field_jobs(dict) : 직업 분야 이름 → 직업명 리스트
+    '''
+    pairs = pd.DataFrame({'field_name': field_names(majors), 'name_jobs': name_jobs}).drop_duplicates()
+    return {field: group['name_jobs'].tolist() for field, group in pairs.groupby('field_name', sort=True)}
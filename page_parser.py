@@ -0,0 +1,156 @@
+import re
+from urllib.parse import urljoin
+
+import lxml.html
+
+# Selenium의 .text처럼 앞뒤에 줄바꿈을 넣는 블록 요소
+BLOCK_TAGS = {'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'footer', 'form',
+              'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'nav', 'ol', 'p', 'pre', 'section',
+              'table', 'tbody', 'td', 'th', 'thead', 'tr', 'ul'}
+# 화면에 표시되지 않는 요소
+SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+WHITESPACE = re.compile(r'\s+')
+
+
+def element_text(element):
+    '''
+    요소의 화면 표시 텍스트를 Selenium WebElement.text와 같은 형태로 반환합니다.
+
+    HTML 소스의 줄바꿈을 포함한 연속된 공백은 하나의 공백으로 줄이고, 블록 요소 경계에서만 줄을 바꾸며 빈 줄은 제거합니다.
+    CSS로 숨긴 요소까지는 판단하지 않습니다.
+
+    매개변수 :
+        element(lxml.html.HtmlElement) : 텍스트를 추출할 요소. None이면 None을 반환합니다.
+
+    반환값 :
+        text(str) : 표시 텍스트
+    '''
+    if element is None:
+        return None
+    parts = []
+
+    def walk(node):
+        if not isinstance(node.tag, str) or node.tag in SKIP_TAGS:
+            return
+        block = node.tag in BLOCK_TAGS
+        if block:
+            parts.append('\n')
+        if node.text:
+            parts.append(WHITESPACE.sub(' ', node.text))
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(WHITESPACE.sub(' ', child.tail))
+        if block:
+            parts.append('\n')
+
+    walk(element)
+    lines = (WHITESPACE.sub(' ', line).strip() for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def first(elements):
+    '''
+    xpath 결과의 첫 요소를 반환합니다. 결과가 없으면 None을 반환합니다.
+    '''
+    return elements[0] if elements else None
+
+
+def elements_by_id(document):
+    '''
+    문서를 한 번 순회하여 id 속성값별 요소 딕셔너리를 만듭니다.
+    id가 중복되면 문서에서 먼저 나온 요소를 사용합니다.
+
+    매개변수 :
+        document(lxml.html.HtmlElement) : 파싱한 HTML 문서
+
+    반환값 :
+        elements(dict) : id별 요소
+    '''
+    elements = {}
+    for element in document.iter():
+        element_id = element.get('id') if isinstance(element.tag, str) else None
+        if element_id and element_id not in elements:
+            elements[element_id] = element
+    return elements
+
+
+def parse_worknet_listing(html, base_url=None, how_many=10):
+    '''
+    워크넷 채용 공고 목록 페이지의 HTML에서 공고 정보를 한 번에 추출합니다.
+
+    문서를 한 번만 파싱하고 id로 각 공고 행(#list{i})을 찾은 뒤, 행 안에서 상대 경로로 필드를 읽습니다.
+    crawling_works.crawling()이 Selenium 선택자로 찾던 것과 같은 위치의 요소를 읽으며,
+    필드가 없는 공고는 해당 값을 None으로 채워 열이 어긋나지 않게 합니다.
+    저장해 둔 페이지(FixtureServer 등)에도 그대로 사용할 수 있습니다.
+
+    매개변수 :
+        html(str) : 목록 페이지 HTML
+        base_url(str) : 상대 링크를 절대 URL로 바꿀 기준 URL. None이면 href를 그대로 사용합니다.
+        how_many(int) : 페이지에서 읽을 최대 공고 수
+
+    반환값 :
+        rows(list) : 공고별 work_company, recruit, job_describ_1, job_describ_2, condition, date, link 딕셔너리 리스트
+    '''
+    document = lxml.html.fromstring(html)
+    by_id = elements_by_id(document)
+    rows = []
+    for i in range(1, how_many + 1):
+        row = by_id.get(f'list{i}')
+        if row is None:
+            continue
+        # lxml 요소는 자식이 없으면 거짓으로 평가되므로 None과 직접 비교
+        company = first(row.xpath('td[2]/a'))
+        if company is None:
+            company = first(row.xpath('td[2]'))
+        # CSS의 td:nth-child(n)과 같이 n번째 자식이 해당 태그인 경우만 선택
+        recruit = first(row.xpath('*[3][self::td]/div/div/a'))
+        company_text = element_text(company)
+        link = recruit.get('href') if recruit is not None else None
+        rows.append({
+            'work_company': company_text.split('\n')[0] if company_text is not None else None,
+            'recruit': element_text(recruit),
+            'job_describ_1': element_text(by_id.get(f'jobContLine{i}')),
+            'job_describ_2': element_text(first(row.xpath('*[3][self::td]/div/*[3][self::p]'))),
+            'condition': element_text(first(row.xpath('*[4][self::td]/div'))),
+            'date': element_text(first(row.xpath('*[5][self::td]/div/*[2][self::p]'))),
+            'link': urljoin(base_url, link) if base_url and link is not None else link,
+        })
+    return rows
+
+
+def ncs_code_from_href(href):
+    '''
+    NCS 분류 링크의 href(예: "javascript:goNcs('20010202', ...)")에서 따옴표 안의 8자리 NCS 코드를 추출합니다.
+    '''
+    start = href.find("'") + 1
+    return href[start:start + 8]
+
+
+def parse_ncs_jobs(html, rows=range(0, 11)):
+    '''
+    직업별 NCS 분류 목록 페이지의 HTML에서 (직업명, NCS 분류 코드) 쌍을 한 번에 추출합니다.
+
+    문서를 한 번만 파싱하고 id로 각 행(#list_{i})을 찾은 뒤, 행의 NCS 링크 href를 한 번만 읽어 코드를 만들고
+    그 행의 모든 직업명과 짝지어 반환합니다. crawling_jobs.crawling()이 Selenium 선택자로 찾던 것과 같은 위치의 요소를 읽습니다.
+
+    매개변수 :
+        html(str) : 목록 페이지 HTML
+        rows(iterable) : 읽을 행 번호
+
+    반환값 :
+        jobs(list) : 직업명, NCS분류 딕셔너리 리스트
+    '''
+    by_id = elements_by_id(lxml.html.fromstring(html))
+    jobs = []
+    for i in rows:
+        row = by_id.get(f'list_{i}')
+        if row is None:
+            continue
+        # CSS의 td.pl_50 > button과 td:nth-child(4) > div > div > ul > li > a에 해당
+        job_elements = row.xpath('td[contains(concat(" ", normalize-space(@class), " "), " pl_50 ")]/button')
+        codes = [ncs_code_from_href(href) for href in row.xpath('*[4][self::td]/div/div/ul/li/a/@href')]
+        for job_element in job_elements:
+            job_title = element_text(job_element)
+            jobs.extend({'직업명': job_title, 'NCS분류': code} for code in codes)
+    return jobs
@@ -0,0 +1,219 @@
+import datetime
+import hashlib
+import re
+from collections import Counter
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 링크에서 공고와 무관하게 목록 위치에 따라 바뀌는 쿼리 파라미터
+VOLATILE_LINK_PARAMS = {'rtnTarget'}
+# date 열의 마감일 표기 (예: '24/03/26 등록\n24/04/19 마감')
+DEADLINE_PATTERN = re.compile(r'(\d{2})/(\d{2})/(\d{2})\s*마감')
+
+
+def normalize_link(link):
+    '''
+    공고 링크에서 목록 위치에 따라 바뀌는 쿼리 파라미터(rtnTarget 등)를 제거합니다.
+
+    매개변수 :
+        link(str) : 공고 상세 페이지 링크
+
+    반환값 :
+        link(str) : 정규화된 링크
+    '''
+    if not link:
+        return link
+    parts = urlsplit(link)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if key not in VOLATILE_LINK_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def digest(*values):
+    return hashlib.sha1('\x1f'.join('' if value is None else str(value) for value in values).encode('utf-8')).hexdigest()
+
+
+def posting_key(link, recruit, work_company):
+    '''
+    공고를 식별하는 해시를 반환합니다. 정규화한 링크, 공고 제목, 회사명으로 만듭니다.
+    '''
+    return digest(normalize_link(link), recruit, work_company)
+
+
+def content_hash(job_describ_1, job_describ_2, condition, date):
+    '''
+    공고 내용의 해시를 반환합니다. 같은 공고의 내용이 바뀌었는지 확인하는 데 사용합니다.
+    '''
+    return digest(job_describ_1, job_describ_2, condition, date)
+
+
+def parse_deadline(date):
+    '''
+    date 열에서 마감일을 추출하여 'YYYY-MM-DD' 형식으로 반환합니다. 마감일이 없으면(채용시까지 등) None을 반환합니다.
+
+    매개변수 :
+        date(str) : 공고의 등록일/마감일 문자열 (예: '24/03/26 등록\n24/04/19 마감')
+
+    반환값 :
+        expires_on(str) : 마감일
+    '''
+    match = DEADLINE_PATTERN.search(date or '')
+    if match is None:
+        return None
+    year, month, day = (int(part) for part in match.groups())
+    try:
+        return datetime.date(2000 + year, month, day).isoformat()
+    except ValueError:
+        return None
+
+
+class PostingIngestor:
+    '''
+    크롤링한 채용 공고를 data.db에 증분 적재하는 클래스.
+
+    공고는 (work_code, posting_key)로 식별하며, 새 공고는 추가하고 내용 해시가 바뀐 공고만 갱신합니다.
+    내용이 같은 공고는 쓰지 않으므로 id_work_positions가 유지됩니다. 회사는 이름으로 찾아 기존 id_work_company를 재사용하고,
+    처음 보는 회사만 새 id를 받습니다. 공고는 batch_size개씩 모아 하나의 트랜잭션으로 저장하므로 전체 결과를 메모리에 모으지 않습니다.
+    적재 전에 migrations.prepare_posting_tables()로 테이블과 인덱스를 준비해야 합니다.
+
+    속성 :
+        conn(sqlite3.Connection) : data.db 연결
+        batch_size(int) : 한 트랜잭션에 저장할 최대 공고 수
+        stats(Counter) : inserted, updated, unchanged, expired 건수
+
+    메서드 :
+        add(work_code, row) : 공고 하나를 적재 대기열에 넣습니다.
+        flush() : 대기 중인 공고를 저장합니다.
+        expire(today) : 마감일이 지난 공고를 삭제합니다.
+        close() : 남은 공고를 저장하고 통계를 반환합니다.
+    '''
+    columns = ['id_work_company', 'work_code', 'recruit', 'job_describ_1', 'job_describ_2', 'condition', 'date', 'link',
+               'posting_key', 'content_hash', 'expires_on']
+
+    def __init__(self, conn, batch_size=500):
+        '''
+        PostingIngestor 클래스의 인스턴스를 초기화합니다.
+
+        매개변수 :
+            conn(sqlite3.Connection) : data.db 연결
+            batch_size(int) : 한 트랜잭션에 저장할 최대 공고 수
+        '''
+        self.conn = conn
+        self.batch_size = batch_size
+        self.batch = {}
+        self.company_ids = {}
+        self.stats = Counter(inserted=0, updated=0, unchanged=0, expired=0)
+
+    def add(self, work_code, row):
+        '''
+        공고 하나를 적재 대기열에 넣고, batch_size개가 모이면 저장합니다.
+
+        매개변수 :
+            work_code(int) : 워크넷 직업 코드 번호
+            row(dict) : work_company, recruit, job_describ_1, job_describ_2, condition, date, link를 담은 공고
+        '''
+        key = posting_key(row.get('link'), row.get('recruit'), row.get('work_company'))
+        # 같은 배치 안의 중복 공고는 마지막 것만 저장
+        self.batch[(work_code, key)] = row
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def transaction(self, func, *args):
+        '''
+        func(*args)를 BEGIN IMMEDIATE 트랜잭션 안에서 실행합니다.
+        '''
+        isolation_level = self.conn.isolation_level
+        self.conn.isolation_level = None
+        try:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = func(*args)
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+        finally:
+            self.conn.isolation_level = isolation_level
+        return result
+
+    def flush(self):
+        '''
+        대기 중인 공고를 하나의 트랜잭션으로 저장합니다.
+        '''
+        if not self.batch:
+            return
+        batch, self.batch = self.batch, {}
+        try:
+            self.transaction(self.write_batch, batch)
+        except Exception:
+            # 롤백된 트랜잭션에서 추가한 회사 id가 캐시에 남지 않도록 비움
+            self.company_ids.clear()
+            raise
+
+    def company_id_map(self, names):
+        '''
+        회사명별 id_work_company를 반환합니다. 처음 보는 회사는 새 id로 추가합니다.
+        '''
+        missing = [name for name in set(names) if name is not None and name not in self.company_ids]
+        if missing:
+            self.conn.executemany('INSERT OR IGNORE INTO worknet_company (work_company) VALUES (?)',
+                                  ((name,) for name in missing))
+            placeholders = ', '.join('?' * len(missing))
+            self.company_ids.update(self.conn.execute(
+                f'SELECT work_company, id_work_company FROM worknet_company WHERE work_company IN ({placeholders})',
+                missing))
+        return self.company_ids
+
+    def write_batch(self, batch):
+        '''
+        공고 배치를 저장합니다. 이미 있는 공고의 내용 해시를 한 번에 조회하여 새 공고와 바뀐 공고만 씁니다.
+        '''
+        company_ids = self.company_id_map(row.get('work_company') for row in batch.values())
+        keys = [key for _, key in batch]
+        placeholders = ', '.join('?' * len(keys))
+        existing = {(work_code, key): stored_hash for work_code, key, stored_hash in self.conn.execute(
+            f'SELECT work_code, posting_key, content_hash FROM worknet_positions WHERE posting_key IN ({placeholders})',
+            keys)}
+
+        inserts, updates = [], []
+        for (work_code, key), row in batch.items():
+            new_hash = content_hash(row.get('job_describ_1'), row.get('job_describ_2'), row.get('condition'), row.get('date'))
+            if existing.get((work_code, key)) == new_hash:
+                self.stats['unchanged'] += 1
+                continue
+            values = {column: row.get(column) for column in self.columns}
+            values.update(id_work_company=company_ids.get(row.get('work_company')), work_code=work_code,
+                          posting_key=key, content_hash=new_hash, expires_on=parse_deadline(row.get('date')))
+            (updates if (work_code, key) in existing else inserts).append(values)
+
+        self.conn.executemany(f'''INSERT INTO worknet_positions ({', '.join(self.columns)})
+            VALUES ({', '.join(':' + column for column in self.columns)})''', inserts)
+        self.conn.executemany('''UPDATE worknet_positions
+            SET id_work_company = :id_work_company, recruit = :recruit, job_describ_1 = :job_describ_1,
+                job_describ_2 = :job_describ_2, condition = :condition, date = :date, link = :link,
+                content_hash = :content_hash, expires_on = :expires_on
+            WHERE work_code = :work_code AND posting_key = :posting_key''', updates)
+        self.stats['inserted'] += len(inserts)
+        self.stats['updated'] += len(updates)
+
+    def expire(self, today=None):
+        '''
+        마감일이 지난 공고를 삭제합니다. 마감일이 없는 공고는 남겨 둡니다.
+
+        매개변수 :
+            today(datetime.date) : 기준일. None이면 오늘
+
+        반환값 :
+            expired(int) : 삭제된 공고 수
+        '''
+        today = (today or datetime.date.today()).isoformat()
+        expired = self.transaction(lambda: self.conn.execute(
+            'DELETE FROM worknet_positions WHERE expires_on < ?', (today,)).rowcount)
+        self.stats['expired'] += expired
+        return expired
+
+    def close(self):
+        '''
+        남은 공고를 저장하고 적재 통계를 반환합니다.
+        '''
+        self.flush()
+        return self.stats
@@ -0,0 +1,297 @@
+import os
+import sqlite3
+import time
+
+import pandas as pd
+
+from ranking import RECOMMENDATION_TOP_K, job_ncs_scores, posting_scores, program_base_scores, program_pairs, top_k
+from regions import update_region_codes
+
+# 취업시장 동향 페이지의 원본 데이터 (행: 직종, 열: 연도, 값: 천 단위 구분 기호가 있는 신규 구인인원)
+MARKET_CSV = '연도별 직종별 신규구인인원.csv'
+
+# build_job_recommendations()가 만드는 테이블
+RECOMMENDATION_TABLES = ['job_program_ranks', 'job_posting_ranks', 'edu_program_scores', 'job_ncs_scores',
+                         'worknet_position_scores']
+
+def build_job_postings_flat(conn):
+    '''
+    jobs → jobs_to_worknet → worknet_positions → worknet_company를 미리 조인하고 지역을 추출하여
+    job_postings_flat 테이블로 저장합니다. 조회는 (name_jobs, region_code) 인덱스 한 번으로 끝납니다.
+
+    조인은 SQLite 안에서 한 번에 처리하고, 지역은 regions.update_region_codes()로 job_describ_2 열 전체를 한 번에
+    정규화하여 정수 region_code(regions.REGIONS의 위치)로 저장합니다.
+    기존 테이블의 삭제와 새 테이블 생성은 하나의 트랜잭션으로 처리하여, 읽는 쪽에서는 빌드 도중의 상태를 볼 수 없습니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : data.db 연결
+
+    반환값 :
+        row_count(int) : 생성된 공고 행의 수
+    '''
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        conn.execute('DROP TABLE IF EXISTS job_postings_flat')
+        conn.execute('''CREATE TABLE job_postings_flat (
+            id_work_positions INTEGER,
+            id_jobs INTEGER,
+            name_jobs TEXT,
+            work_code INTEGER,
+            id_work_company INTEGER,
+            work_company TEXT,
+            recruit TEXT,
+            job_describ_1 TEXT,
+            job_describ_2 TEXT,
+            condition TEXT,
+            date TEXT,
+            link TEXT,
+            region_code INTEGER
+        )''')
+        conn.execute('''INSERT INTO job_postings_flat
+            SELECT p.id_work_positions, j.id_jobs, j.name_jobs, p.work_code, p.id_work_company, c.work_company,
+                   p.recruit, p.job_describ_1, p.job_describ_2, p.condition, p.date, p.link, NULL
+            FROM jobs j
+            JOIN jobs_to_worknet jw ON jw.id_jobs = j.id_jobs
+            JOIN worknet_positions p ON p.work_code = jw.work_code
+            JOIN worknet_company c ON c.id_work_company = p.id_work_company''')
+        update_region_codes(conn, 'job_postings_flat', 'job_describ_2')
+        conn.execute('CREATE INDEX idx_job_postings_flat_job_region ON job_postings_flat (name_jobs, region_code)')
+        conn.execute('CREATE INDEX idx_job_postings_flat_region ON job_postings_flat (region_code)')
+        conn.execute('CREATE INDEX idx_job_postings_flat_position ON job_postings_flat (id_work_positions, id_jobs)')
+        row_count = conn.execute('SELECT COUNT(*) FROM job_postings_flat').fetchone()[0]
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.isolation_level = isolation_level
+    return row_count
+
+
+def ensure_job_postings_flat(conn):
+    '''
+    job_postings_flat 테이블이 없거나 region_code 열이 없는 이전 형식이면 생성합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : data.db 연결
+    '''
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(job_postings_flat)')}
+    if 'region_code' not in columns:
+        build_job_postings_flat(conn)
+
+
+def build_job_recommendations(conn, k=RECOMMENDATION_TOP_K):
+    '''
+    직업별로 점수가 높은 교육 프로그램과 채용 공고 k개를 미리 골라 job_program_ranks, job_posting_ranks 테이블로 저장합니다.
+    추천 조회는 (id_jobs, rank) 기본키 범위를 한 번 읽고, 대상 행은 기본키(공고는 id_work_positions 인덱스)로 조인합니다.
+
+    지역이나 온라인 여부로 거른 추천순 조회는 직업별 상위 k개 밖의 후보도 필요하므로, 점수 항목도 함께 저장합니다.
+    - edu_program_scores : 교육 프로그램(회차)별 직업과 무관한 점수 (program_rowid 기본키)
+    - job_ncs_scores : (직업, NCS 코드)별 NCS 겹침 점수. 교육 프로그램의 점수는 두 값의 합입니다.
+    - worknet_position_scores : 공고별 점수. 공고 점수는 직업과 무관합니다.
+
+    후보는 직업의 NCS 코드와 같은 코드의 교육 프로그램(jobs → ncs_to_jobs → edu_program), job_postings_flat의 공고이며,
+    점수는 ranking.py의 함수로 열 단위로 계산합니다.
+    id_edu_program은 과정 id라 회차마다 같은 값이 반복되므로, 교육 프로그램은 회차(행)를 가리키는 edu_program의 rowid로 저장합니다.
+    원본 테이블(edu_program, ncs_to_jobs, worknet_positions 등)을 바꾼 뒤에는 build_job_postings_flat() 다음에 다시 실행해야 합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : data.db 연결
+        k(int) : 직업별 최대 추천 수
+
+    반환값 :
+        row_counts(tuple) : 저장된 (교육 프로그램, 채용 공고) 추천 행의 수
+    '''
+    ensure_job_postings_flat(conn)
+    job_codes = pd.read_sql_query('SELECT DISTINCT id_jobs, ncs_code FROM ncs_to_jobs', conn)
+    programs = pd.read_sql_query(
+        'SELECT rowid AS program_rowid, ncs_code, date_start, oopc, online_status FROM edu_program', conn)
+    programs['base'] = program_base_scores(programs)
+    ncs_scores = job_ncs_scores(job_codes)
+    program_ranks = top_k(program_pairs(ncs_scores, programs, k), 'program_rowid', k)
+
+    # 마이그레이션 전의 중복 매핑으로 같은 (직업, 공고) 행이 여러 번 있을 수 있음
+    posting_pairs = pd.read_sql_query('SELECT DISTINCT id_jobs, id_work_positions, work_code, date FROM job_postings_flat', conn)
+    job_work_codes = pd.read_sql_query('SELECT id_jobs, work_code FROM jobs_to_worknet', conn)
+    posting_pairs['score'] = posting_scores(posting_pairs, job_work_codes)
+    posting_ranks = top_k(posting_pairs, 'id_work_positions', k)
+    position_scores = posting_pairs.drop_duplicates('id_work_positions')
+
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        for table, item, ranks in (('job_program_ranks', 'program_rowid', program_ranks),
+                                   ('job_posting_ranks', 'id_work_positions', posting_ranks)):
+            conn.execute(f'DROP TABLE IF EXISTS {table}')
+            conn.execute(f'''CREATE TABLE {table} (
+                id_jobs INTEGER NOT NULL,
+                rank INTEGER NOT NULL,
+                {item} INTEGER NOT NULL,
+                score REAL NOT NULL,
+                PRIMARY KEY (id_jobs, rank)
+            ) WITHOUT ROWID''')
+            # 기본키 순서로 정렬되어 있으므로 B-tree 끝에 이어 붙이는 삽입
+            conn.executemany(f'INSERT INTO {table} VALUES (?, ?, ?, ?)',
+                             zip(*(ranks[column].tolist() for column in ['id_jobs', 'rank', item, 'score'])))
+
+        for table, key, scores in (('edu_program_scores', 'program_rowid', programs.rename(columns={'base': 'score'})),
+                                   ('worknet_position_scores', 'id_work_positions', position_scores)):
+            conn.execute(f'DROP TABLE IF EXISTS {table}')
+            conn.execute(f'CREATE TABLE {table} ({key} INTEGER PRIMARY KEY, score REAL NOT NULL)')
+            conn.executemany(f'INSERT INTO {table} VALUES (?, ?)', zip(scores[key].tolist(), scores['score'].tolist()))
+        conn.execute('DROP TABLE IF EXISTS job_ncs_scores')
+        conn.execute('''CREATE TABLE job_ncs_scores (
+            id_jobs INTEGER NOT NULL,
+            ncs_code INTEGER NOT NULL,
+            score REAL NOT NULL,
+            PRIMARY KEY (id_jobs, ncs_code)
+        ) WITHOUT ROWID''')
+        conn.executemany('INSERT INTO job_ncs_scores VALUES (?, ?, ?)',
+                         zip(*(ncs_scores[column].tolist() for column in ['id_jobs', 'ncs_code', 'score'])))
+        # 추천 공고를 job_postings_flat에서 찾기 위한 인덱스 (이 인덱스가 생기기 전에 만든 job_postings_flat용)
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_job_postings_flat_position ON job_postings_flat (id_work_positions, id_jobs)')
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.isolation_level = isolation_level
+    return len(program_ranks), len(posting_ranks)
+
+
+def ensure_job_recommendations(conn):
+    '''
+    직업별 추천 테이블이나 점수 항목 테이블 중 없는 것이 있으면 모두 다시 생성합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : data.db 연결
+    '''
+    placeholders = ', '.join('?' * len(RECOMMENDATION_TABLES))
+    tables = {name for (name,) in conn.execute(
+        f"SELECT name FROM sqlite_master WHERE type='table' AND name IN ({placeholders})", RECOMMENDATION_TABLES)}
+    if len(tables) < len(RECOMMENDATION_TABLES):
+        build_job_recommendations(conn)
+
+
+def source_stamp(path):
+    '''
+    원본 파일의 변경 여부를 판단하기 위한 (mtime, 크기) 스탬프를 반환합니다.
+    '''
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_market_csv(csv_path=MARKET_CSV, encoding='CP949'):
+    '''
+    직종 x 기간 형태의 신규 구인인원 CSV를 직종 목록과 (series_id, period, openings) 형태의 긴 DataFrame으로 읽습니다.
+    천 단위 구분 기호는 읽을 때 제거하여 openings를 정수로 만들고, 기간(열 이름)도 정수로 변환합니다.
+
+    매개변수 :
+        csv_path(str) : CSV 파일 경로
+        encoding(str) : CSV 파일 인코딩
+
+    반환값 :
+        series(DataFrame) : CSV 순서의 series_id, occupation 열
+        openings(DataFrame) : series_id, period, openings 열. 값이 비어 있는 칸은 제외됩니다.
+    '''
+    wide = pd.read_csv(csv_path, index_col=0, encoding=encoding, thousands=',')
+    series = pd.DataFrame({'series_id': range(1, len(wide) + 1), 'occupation': wide.index.astype(str)})
+    wide.index = series['series_id']
+    wide.columns = wide.columns.astype('int64')
+    openings = wide.stack().astype('int64')
+    openings.index.names = ['series_id', 'period']
+    return series, openings.reset_index(name='openings')
+
+
+def build_job_openings(conn, csv_path=MARKET_CSV):
+    '''
+    신규 구인인원 CSV를 정수 타입의 job_openings 테이블로 변환하여 저장합니다.
+
+    직종명은 job_openings_series에 한 번만 저장하고, 값은 (series_id, period)가 기본키인 긴 형태의 정수 테이블로 저장합니다.
+    지역별, 월 단위처럼 계열과 기간이 늘어나도 같은 구조를 사용할 수 있으며, 값 테이블에는 문자열이 반복되지 않습니다.
+    원본 파일의 스탬프를 precompute_sources에 함께 기록하며, 테이블 교체와 스탬프 기록은 하나의 트랜잭션으로 처리합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : data.db 연결
+        csv_path(str) : CSV 파일 경로
+
+    반환값 :
+        row_count(int) : 저장된 (직종, 기간) 행의 수
+    '''
+    stamp = source_stamp(csv_path)
+    series, openings = read_market_csv(csv_path)
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        conn.execute('DROP TABLE IF EXISTS job_openings')
+        conn.execute('DROP TABLE IF EXISTS job_openings_series')
+        conn.execute('''CREATE TABLE job_openings_series (
+            series_id INTEGER PRIMARY KEY,
+            occupation TEXT NOT NULL UNIQUE
+        )''')
+        conn.execute('''CREATE TABLE job_openings (
+            series_id INTEGER NOT NULL REFERENCES job_openings_series(series_id),
+            period INTEGER NOT NULL,
+            openings INTEGER NOT NULL,
+            PRIMARY KEY (series_id, period)
+        ) WITHOUT ROWID''')
+        conn.executemany('INSERT INTO job_openings_series VALUES (?, ?)',
+                         zip(series['series_id'].tolist(), series['occupation'].tolist()))
+        # 기본키 순서로 정렬되어 있으므로 B-tree 끝에 이어 붙이는 삽입
+        conn.executemany('INSERT INTO job_openings VALUES (?, ?, ?)',
+                         zip(*(openings[column].tolist() for column in ['series_id', 'period', 'openings'])))
+        conn.execute('''CREATE TABLE IF NOT EXISTS precompute_sources (
+            name TEXT PRIMARY KEY,
+            mtime_ns INTEGER,
+            size INTEGER
+        )''')
+        conn.execute('INSERT OR REPLACE INTO precompute_sources VALUES (?, ?, ?)', ('job_openings',) + stamp)
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.isolation_level = isolation_level
+    return len(openings)
+
+
+def ensure_job_openings(conn, csv_path=MARKET_CSV):
+    '''
+    job_openings 테이블이 없거나 원본 CSV가 바뀌었으면 다시 생성합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : data.db 연결
+        csv_path(str) : CSV 파일 경로
+    '''
+    try:
+        stored = conn.execute(
+            "SELECT mtime_ns, size FROM precompute_sources WHERE name = 'job_openings'").fetchone()
+    except sqlite3.OperationalError:
+        stored = None
+    if stored is None or tuple(stored) != source_stamp(csv_path):
+        build_job_openings(conn, csv_path)
+
+
+def main(db_path='./db/data.db'):
+    '''
+    data.db의 사전 계산 테이블을 모두 다시 생성합니다.
+    '''
+    conn = sqlite3.connect(db_path)
+    start = time.perf_counter()
+    row_count = build_job_postings_flat(conn)
+    print(f'job_postings_flat: {row_count} rows ({time.perf_counter() - start:.2f}s)')
+    start = time.perf_counter()
+    program_rows, posting_rows = build_job_recommendations(conn)
+    print(f'job_program_ranks: {program_rows} rows, job_posting_ranks: {posting_rows} rows ({time.perf_counter() - start:.2f}s)')
+    start = time.perf_counter()
+    row_count = build_job_openings(conn)
+    print(f'job_openings: {row_count} rows ({time.perf_counter() - start:.2f}s)')
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
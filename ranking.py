@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+
+from ncs_hierarchy import NCS_LEVELS
+
+# 직업별 추천 목록에 저장하는 교육 프로그램/채용 공고 수 (ResultPager.max_page_size의 두 배)
+RECOMMENDATION_TOP_K = 100
+
+# 교육 프로그램 점수의 가중치 (각 항목은 0~1, 가중치의 합은 1)
+PROGRAM_WEIGHTS = {
+    'ncs_overlap': 0.4,  # 직업의 NCS 코드 중 프로그램과 같은 중분류인 코드의 비율
+    'freshness': 0.25,   # 시작일이 최근일수록 높음
+    'cost': 0.2,         # 자가부담금이 적을수록 높음
+    'online': 0.15,      # 온라인 수강 가능 여부
+}
+
+# 채용 공고 점수의 가중치
+POSTING_WEIGHTS = {
+    'freshness': 0.8,    # 등록일이 최근일수록 높음
+    'specificity': 0.2,  # 공고의 워크넷 직종에 연결된 직업이 적을수록 높음
+}
+
+# 시작일(등록일)이 목록에서 가장 최근 날짜보다 이만큼 이르면 최신성 점수가 절반이 됩니다.
+FRESHNESS_HALF_LIFE_DAYS = 30
+
+# 자가부담금이 이 금액이면 비용 점수가 절반이 됩니다.
+COST_HALF_SCORE = 200000
+
+# online_status별 온라인 수강 점수. 목록에 없는 값(오프라인 등)은 0입니다.
+ONLINE_SCORES = {'온라인': 1.0, '스마트': 1.0, '스마트혼합': 0.5}
+
+
+def freshness_scores(dates):
+    '''
+    날짜 열을 최신성 점수 열로 변환합니다. 기준일은 실행 시각이 아니라 열에서 가장 최근 날짜이므로,
+    같은 데이터로 다시 계산하면 항상 같은 점수가 나옵니다. 날짜가 없으면 0입니다.
+
+    매개변수 :
+        dates(Series) : datetime 열
+
+    반환값 :
+        scores(Series) : 0~1의 점수 열 (같은 인덱스)
+    '''
+    days = (dates.max() - dates).dt.days
+    return (0.5 ** (days / FRESHNESS_HALF_LIFE_DAYS)).fillna(0.0)
+
+
+def weighted_score(components, weights):
+    '''
+    항목별 점수 열을 가중치로 합칩니다.
+
+    매개변수 :
+        components(DataFrame) : weights의 키를 열로 가진 0~1의 점수
+        weights(dict) : 항목 이름 → 가중치
+
+    반환값 :
+        score(Series) : 가중합 점수 열
+    '''
+    return sum(components[name] * weight for name, weight in weights.items())
+
+
+def program_base_scores(programs):
+    '''
+    교육 프로그램(회차)마다 직업과 무관한 점수 항목(최신성, 비용, 온라인)의 가중합을 계산합니다.
+
+    매개변수 :
+        programs(DataFrame) : date_start(YYYYMMDD 정수), oopc, online_status 열
+
+    반환값 :
+        base(Series) : programs와 같은 인덱스의 점수 열
+    '''
+    start_dates = pd.to_datetime(programs['date_start'].astype('Int64').astype(str), format='%Y%m%d', errors='coerce')
+    program_components = pd.DataFrame({
+        'freshness': freshness_scores(start_dates),
+        'cost': 1 / (1 + programs['oopc'].clip(lower=0) / COST_HALF_SCORE),
+        'online': programs['online_status'].map(ONLINE_SCORES),
+    }, index=programs.index).fillna(0.0)
+    program_weights = {name: PROGRAM_WEIGHTS[name] for name in program_components}
+    return weighted_score(program_components, program_weights)
+
+
+def job_ncs_scores(job_codes):
+    '''
+    (직업, NCS 코드)마다 NCS 겹침 항목의 가중 점수를 계산합니다.
+    NCS 겹침은 직업의 NCS 코드 중 같은 중분류인 코드의 비율입니다.
+
+    매개변수 :
+        job_codes(DataFrame) : 중복 없는 id_jobs, ncs_code 열 (직업의 NCS 코드 전체)
+
+    반환값 :
+        scores(DataFrame) : id_jobs, ncs_code, score 열
+    '''
+    middle = job_codes['ncs_code'] // NCS_LEVELS['ncs_middle']
+    overlap = job_codes.groupby(['id_jobs', middle])['ncs_code'].transform('size') \
+        / job_codes.groupby('id_jobs')['ncs_code'].transform('size')
+    return job_codes[['id_jobs', 'ncs_code']].assign(score=PROGRAM_WEIGHTS['ncs_overlap'] * overlap)
+
+
+def program_pairs(ncs_scores, programs, k=RECOMMENDATION_TOP_K):
+    '''
+    직업의 NCS 코드와 같은 코드의 교육 프로그램(회차)을 후보 쌍으로 묶고 점수를 계산합니다.
+    점수는 회차 점수(program_base_scores())와 (직업, NCS 코드) 점수(job_ncs_scores())의 합입니다.
+    같은 (직업, NCS 코드)의 후보는 NCS 겹침이 같아 회차 점수 순서대로 순위가 정해지므로, NCS 코드마다 회차 점수 상위 k개만 조인합니다.
+
+    매개변수 :
+        ncs_scores(DataFrame) : job_ncs_scores()의 id_jobs, ncs_code, score 열
+        programs(DataFrame) : program_rowid, ncs_code, base(program_base_scores()) 열
+        k(int) : 직업별 최대 추천 수 (top_k()에 넘길 값)
+
+    반환값 :
+        pairs(DataFrame) : 직업별 상위 k개의 후보가 모두 들어 있는 id_jobs, program_rowid, score 열
+    '''
+    program_base = programs[['ncs_code', 'program_rowid', 'base']] \
+        .sort_values(['ncs_code', 'base', 'program_rowid'], ascending=[True, False, True])
+    program_base = program_base[program_base.groupby('ncs_code').cumcount() < k]
+
+    pairs = ncs_scores.merge(program_base, on='ncs_code')
+    pairs['score'] = pairs['base'] + pairs['score']
+    return pairs[['id_jobs', 'program_rowid', 'score']]
+
+
+def posting_scores(postings, jobs_to_worknet):
+    '''
+    (직업, 채용 공고) 후보 쌍의 점수를 계산합니다.
+
+    매개변수 :
+        postings(DataFrame) : id_jobs, id_work_positions, work_code, date('YY/MM/DD 등록'으로 시작) 열
+        jobs_to_worknet(DataFrame) : id_jobs, work_code 열
+
+    반환값 :
+        score(Series) : postings와 같은 인덱스의 점수 열
+    '''
+    jobs_per_code = jobs_to_worknet.groupby('work_code')['id_jobs'].nunique()
+    registered = pd.to_datetime(postings['date'].str.extract(r'^(\d{2}/\d{2}/\d{2})', expand=False),
+                                format='%y/%m/%d', errors='coerce')
+    components = pd.DataFrame({
+        'freshness': freshness_scores(registered),
+        'specificity': 1 / postings['work_code'].map(jobs_per_code),
+    }, index=postings.index)
+    return weighted_score(components.fillna(0.0), POSTING_WEIGHTS)
+
+
+def top_k(pairs, item, k=RECOMMENDATION_TOP_K):
+    '''
+    직업마다 점수가 높은 k개를 골라 순위를 매깁니다. 점수가 같으면 item id가 작은 것이 앞입니다.
+    후보 쌍이 수백만 개여도 빠르도록 여러 열의 sort_values 대신 np.lexsort로 한 번에 정렬합니다.
+
+    매개변수 :
+        pairs(DataFrame) : 중복 없는 (id_jobs, item) 쌍과 score 열
+        item(str) : 추천 대상 id 열 이름 (program_rowid, id_work_positions)
+        k(int) : 직업별 최대 추천 수
+
+    반환값 :
+        ranks(DataFrame) : 기본키 순서(id_jobs, rank)로 정렬된 id_jobs, rank(1부터), item, score 열
+    '''
+    order = np.lexsort((pairs[item].to_numpy(), -pairs['score'].to_numpy(), pairs['id_jobs'].to_numpy()))
+    ranked = pairs[['id_jobs', item, 'score']].take(order)
+    ranked.insert(1, 'rank', ranked.groupby('id_jobs', sort=False).cumcount() + 1)
+    return ranked[ranked['rank'] <= k].reset_index(drop=True)
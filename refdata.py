@@ -0,0 +1,138 @@
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+from migrations import ensure_migrated
+
+# 캐시된 데이터의 형식이 바뀌면 이 값을 올려서 기존 캐시를 무효화합니다.
+REFDATA_VERSION = 1
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def db_stamp(db_path):
+    '''
+    DB 파일의 변경 여부를 판단하기 위한 스탬프를 계산합니다.
+    SQLite를 열지 않고 파일 시스템 정보(mtime, 크기)만 사용하므로 매 rerun마다 호출해도 비용이 거의 없습니다.
+    WAL 모드에서는 변경 내용이 -wal 파일에 먼저 기록되므로 해당 파일의 정보도 함께 포함합니다.
+
+    매개변수 :
+        db_path(str) : SQLite DB 파일 경로
+
+    반환값 :
+        stamp(tuple) : (캐시 버전, DB 파일 mtime, 크기, WAL 파일 mtime, 크기)
+    '''
+    stat = os.stat(db_path)
+    try:
+        wal_stat = os.stat(db_path + '-wal')
+        wal = (wal_stat.st_mtime_ns, wal_stat.st_size)
+    except FileNotFoundError:
+        wal = (0, 0)
+    return (REFDATA_VERSION, stat.st_mtime_ns, stat.st_size) + wal
+
+
+class ReferenceData:
+    '''
+    하나의 DB 스탬프에 대응하는 읽기 전용 참조 데이터 묶음.
+
+    테이블은 처음 요청될 때 한 번만 SQLite에서 읽어 DataFrame으로 보관하며, 이후에는 같은 객체를 공유합니다.
+    여러 세션이 동시에 같은 DataFrame을 사용하므로, 호출하는 쪽에서는 반환된 DataFrame을 수정하면 안 됩니다.
+    가공이 필요한 데이터는 derived()를 통해 한 번만 계산하여 함께 캐시합니다.
+
+    속성 :
+        db_path(str) : SQLite DB 파일 경로
+        stamp(tuple) : 데이터를 읽을 당시의 DB 스탬프
+        user_version(int) : 데이터를 읽을 당시의 PRAGMA user_version (스키마 버전)
+
+    메서드 :
+        table(name) : 테이블 전체를 DataFrame으로 반환합니다.
+        derived(key, builder) : 참조 데이터로부터 가공한 결과를 한 번만 계산하여 반환합니다.
+    '''
+    def __init__(self, db_path, stamp):
+        self.db_path = db_path
+        self.stamp = stamp
+        self._tables = {}
+        self._derived = {}
+        self._lock = threading.RLock()
+        conn = sqlite3.connect(self.db_path)
+        self.user_version = conn.execute('PRAGMA user_version').fetchone()[0]
+        conn.close()
+
+    def table(self, name):
+        '''
+        테이블 전체를 DataFrame으로 반환합니다. 처음 요청된 테이블만 DB에서 읽습니다.
+
+        매개변수 :
+            name(str) : 테이블 이름
+
+        반환값 :
+            df(DataFrame) : 테이블 데이터 (수정 금지)
+        '''
+        df = self._tables.get(name)
+        if df is not None:
+            return df
+        with self._lock:
+            if name not in self._tables:
+                conn = sqlite3.connect(self.db_path)
+                self._tables[name] = pd.read_sql_query(f'SELECT * FROM "{name}"', conn)
+                conn.close()
+            return self._tables[name]
+
+    def __getitem__(self, name):
+        return self.table(name)
+
+    def derived(self, key, builder):
+        '''
+        참조 데이터로부터 가공한 결과를 한 번만 계산하여 반환합니다.
+        DB가 바뀌어 새 ReferenceData가 만들어지면 가공 결과도 다시 계산됩니다.
+
+        매개변수 :
+            key(str) : 가공 결과의 이름
+            builder(callable) : ReferenceData를 받아 가공 결과를 반환하는 함수
+
+        반환값 :
+            builder가 반환한 가공 결과 (수정 금지)
+        '''
+        if key in self._derived:
+            return self._derived[key]
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = builder(self)
+            return self._derived[key]
+
+
+def load_reference_data(db_path='./db/data.db'):
+    '''
+    프로세스 전체에서 공유하는 참조 데이터를 반환합니다.
+    DB 파일의 스탬프가 바뀌지 않았다면 SQLite를 열지 않고 캐시된 객체를 그대로 반환합니다.
+    프로세스에서 처음 호출될 때는 스키마 마이그레이션과 사전 계산 테이블이 준비되어 있는지 확인합니다.
+
+    매개변수 :
+        db_path(str) : SQLite DB 파일 경로
+
+    반환값 :
+        data(ReferenceData) : 공유 참조 데이터
+    '''
+    ensure_migrated(db_path)
+    key = os.path.abspath(db_path)
+    stamp = db_stamp(db_path)
+    data = _cache.get(key)
+    if data is not None and data.stamp == stamp:
+        return data
+    with _cache_lock:
+        data = _cache.get(key)
+        if data is None or data.stamp != stamp:
+            data = ReferenceData(db_path, stamp)
+            _cache[key] = data
+        return data
+
+
+def clear_reference_data():
+    '''
+    캐시된 참조 데이터를 모두 비웁니다. 다음 요청 시 DB에서 다시 읽습니다.
+    '''
+    with _cache_lock:
+        _cache.clear()
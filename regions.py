@@ -0,0 +1,120 @@
+import re
+
+import pandas as pd
+
+# 시/도 정식 명칭. 목록의 위치(0부터)가 DB에 저장하는 region_code입니다.
+# 순서를 바꾸면 저장된 코드의 의미가 바뀌므로 새 지역은 뒤에만 추가합니다.
+REGIONS = [
+    '서울특별시', '부산광역시', '대구광역시', '인천광역시', '광주광역시', '대전광역시', '울산광역시', '세종특별자치시',
+    '경기도', '강원특별자치도', '충청북도', '충청남도', '전북특별자치도', '전라남도', '경상북도', '경상남도', '제주특별자치도',
+]
+
+# 주소와 공고에 쓰이는 약칭, 옛 명칭 → 정식 명칭
+# '광주시'는 경기도 광주시와 겹치므로 광주광역시의 별칭에 넣지 않습니다.
+REGION_ALIASES = {
+    '서울특별시': ['서울', '서울시'],
+    '부산광역시': ['부산', '부산시'],
+    '대구광역시': ['대구', '대구시'],
+    '인천광역시': ['인천', '인천시'],
+    '광주광역시': ['광주'],
+    '대전광역시': ['대전', '대전시'],
+    '울산광역시': ['울산', '울산시'],
+    '세종특별자치시': ['세종', '세종시'],
+    '경기도': ['경기'],
+    '강원특별자치도': ['강원', '강원도'],
+    '충청북도': ['충북'],
+    '충청남도': ['충남'],
+    '전북특별자치도': ['전북', '전라북도'],
+    '전라남도': ['전남'],
+    '경상북도': ['경북'],
+    '경상남도': ['경남'],
+    '제주특별자치도': ['제주', '제주도'],
+}
+
+# 별칭(정식 명칭 포함) → region_code
+REGION_CODES = {alias: code for code, name in enumerate(REGIONS) for alias in [name] + REGION_ALIASES[name]}
+
+
+
+def alias_pattern(aliases):
+    '''
+    별칭 목록을 공통 접두사끼리 묶은 트라이 형태의 정규식 문자열로 만듭니다.
+    '서울|서울시|서울특별시'처럼 나열하면 위치마다 모든 별칭을 차례로 시도하지만,
+    트라이 형태('서울(?:시|특별시)?')는 첫 글자가 맞는 가지만 따라가므로 별칭이 늘어나도 빠릅니다.
+
+    매개변수 :
+        aliases(iterable) : 별칭 문자열 목록
+
+    반환값 :
+        pattern(str) : 별칭 중 가장 긴 것과 일치하는 정규식 (그룹 없음)
+    '''
+    trie = {}
+    for alias in aliases:
+        node = trie
+        for char in alias:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def branch(node):
+        children = [re.escape(char) + branch(child) for char, child in sorted(node.items()) if char]
+        if not children:
+            return ''
+        pattern = children[0] if len(children) == 1 else '(?:' + '|'.join(children) + ')'
+        # 여기서 끝나는 별칭이 있으면 나머지는 선택 사항 (탐욕적 일치로 긴 별칭이 우선)
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return branch(trie)
+
+
+# 공백으로 구분된 단어 중 처음 나오는 시/도 별칭을 찾는 정규식
+REGION_PATTERN = re.compile(r'(?:^|\s)(' + alias_pattern(REGION_CODES) + r')(?!\S)')
+
+
+def normalize_regions(texts):
+    '''
+    주소나 공고 문자열 열 전체에서 시/도를 찾아 정식 명칭의 범주형 데이터로 변환합니다.
+    행마다 split하지 않고 미리 컴파일한 트라이 정규식(REGION_PATTERN)으로 str.extract를 한 번 실행합니다.
+
+    매개변수 :
+        texts(Series) : 주소 또는 '경력 학력 주소' 형태의 문자열 열. 결측값이 있어도 됩니다.
+
+    반환값 :
+        regions(Series) : REGIONS를 범주로 하는 범주형 열 (같은 인덱스). 알 수 없는 지역은 NaN이며,
+            .cat.codes가 region_code(알 수 없으면 -1)입니다.
+    '''
+    aliases = texts.astype(object).str.extract(REGION_PATTERN, expand=False)
+    codes = aliases.map(REGION_CODES).fillna(-1).to_numpy(dtype='int64')
+    return pd.Series(pd.Categorical.from_codes(codes, REGIONS), index=texts.index, name=texts.name)
+
+
+def regions_from_codes(codes):
+    '''
+    DB에서 읽은 region_code 열(알 수 없으면 NULL)을 정식 명칭의 범주형 열로 변환합니다.
+    '''
+    values = pd.to_numeric(codes).fillna(-1).to_numpy(dtype='int64')
+    return pd.Series(pd.Categorical.from_codes(values, REGIONS), index=codes.index, name='region')
+
+
+def region_name(code):
+    '''
+    region_code의 정식 명칭을 반환합니다. Streamlit 선택 위젯의 format_func로 사용합니다.
+    '''
+    return REGIONS[code]
+
+
+def update_region_codes(conn, table, column):
+    '''
+    테이블의 문자열 열에서 시/도를 추출하여 region_code 열을 채웁니다. 적재 시점에 한 번만 실행합니다.
+    지역을 찾지 못한 행은 NULL이 됩니다. 호출하는 쪽의 트랜잭션 안에서 실행되며, 테이블에는 region_code 열과 rowid가 있어야 합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : DB 연결
+        table(str) : 테이블 이름
+        column(str) : 지역을 추출할 문자열 열 이름
+    '''
+    rows = pd.read_sql_query(f'SELECT rowid AS row_id, "{column}" FROM "{table}"', conn)
+    codes = normalize_regions(rows[column]).cat.codes.to_numpy()
+    known = codes >= 0
+    conn.execute(f'UPDATE "{table}" SET region_code = NULL')
+    conn.executemany(f'UPDATE "{table}" SET region_code = ? WHERE rowid = ?',
+                     zip(codes[known].tolist(), rows['row_id'].to_numpy()[known].tolist()))
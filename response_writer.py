@@ -0,0 +1,167 @@
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseWriter:
+    '''
+    설문 응답을 백그라운드 스레드에서 모아서 저장하는 write-behind 큐.
+
+    요청 스레드는 submit()으로 응답을 큐에 넣기만 하고 바로 돌아갑니다.
+    백그라운드 스레드가 여러 사용자의 응답을 묶어 하나의 트랜잭션에서 executemany로 저장하므로,
+    동시 제출이 많아도 SQLite의 쓰기 잠금을 한 번만 잡습니다. DB는 WAL 모드로 열어 읽기와 쓰기가 서로 막지 않게 합니다.
+
+    속성 :
+        db_path(str) : 응답을 저장하는 SQLite DB 파일 경로
+        batch_size(int) : 한 트랜잭션에 저장할 최대 응답 수
+        flush_interval(float) : 큐가 비어 있을 때 백그라운드 스레드가 대기하는 최대 시간(초)
+
+    메서드 :
+        submit(tag_ids, block, timeout) : 응답을 큐에 넣습니다.
+        flush() : 큐에 들어온 응답이 모두 저장될 때까지 기다립니다.
+        close() : 남은 응답을 모두 저장하고 백그라운드 스레드를 종료합니다.
+    '''
+    def __init__(self, db_path, max_queue_size=10000, batch_size=500, flush_interval=0.2):
+        '''
+        ResponseWriter 클래스의 인스턴스를 초기화하고 백그라운드 스레드를 시작합니다.
+
+        매개변수 :
+            db_path(str) : 응답을 저장하는 SQLite DB 파일 경로
+            max_queue_size(int) : 큐에 보관할 수 있는 최대 응답 수
+            batch_size(int) : 한 트랜잭션에 저장할 최대 응답 수
+            flush_interval(float) : 큐가 비어 있을 때 백그라운드 스레드가 대기하는 최대 시간(초)
+        '''
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.closed = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f'ResponseWriter({db_path})', daemon=True)
+        self.thread.start()
+
+    def submit(self, tag_ids, block=True, timeout=None):
+        '''
+        응답을 큐에 넣습니다. 큐가 가득 차 있으면 block, timeout에 따라 기다리거나 queue.Full을 발생시킵니다.
+
+        매개변수 :
+            tag_ids(list) : 사용자가 선택한 태그id 목록
+            block(bool) : 큐가 가득 찼을 때 자리가 날 때까지 기다릴지 여부
+            timeout(float) : 기다릴 최대 시간(초)
+        '''
+        if self.closed.is_set():
+            raise RuntimeError('ResponseWriter가 이미 종료되었습니다.')
+        self.queue.put(list(tag_ids), block=block, timeout=timeout)
+
+    def flush(self):
+        '''
+        지금까지 큐에 들어온 응답이 모두 저장될 때까지 기다립니다.
+        '''
+        self.queue.join()
+
+    def close(self):
+        '''
+        남은 응답을 모두 저장하고 백그라운드 스레드를 종료합니다.
+        '''
+        if self.closed.is_set():
+            return
+        self.closed.set()
+        self.thread.join()
+
+    def connect(self):
+        '''
+        백그라운드 스레드에서 사용할 DB 연결을 만들고 응답 테이블을 준비합니다.
+        '''
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('''CREATE TABLE IF NOT EXISTS responses (response_id INTEGER PRIMARY KEY AUTOINCREMENT)''')
+        conn.execute('''CREATE TABLE IF NOT EXISTS user_responses (response_id INTEGER, tag_id INTEGER, FOREIGN KEY(response_id) REFERENCES responses(response_id))''')
+        return conn
+
+    def run(self):
+        '''
+        백그라운드 스레드의 메인 루프. 큐에서 응답을 batch_size개까지 꺼내 한 번에 저장합니다.
+        close()가 호출되면 큐에 남은 응답을 모두 저장한 뒤 종료합니다.
+        '''
+        conn = self.connect()
+        try:
+            while not (self.closed.is_set() and self.queue.empty()):
+                try:
+                    batch = [self.queue.get(timeout=self.flush_interval)]
+                except queue.Empty:
+                    continue
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    self.write_batch(conn, batch)
+                except sqlite3.Error:
+                    logger.exception('설문 응답 %d건을 저장하지 못했습니다.', len(batch))
+                finally:
+                    for _ in batch:
+                        self.queue.task_done()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def write_batch(conn, batch):
+        '''
+        여러 응답을 하나의 트랜잭션으로 저장합니다.
+        쓰기 잠금을 잡은 상태에서 response_id를 미리 할당하므로 응답 수와 관계없이 executemany 두 번으로 끝납니다.
+
+        매개변수 :
+            conn(sqlite3.Connection) : autocommit 모드의 DB 연결
+            batch(list) : 응답별 태그id 목록의 리스트
+        '''
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'responses'").fetchone()
+            last_id = max(row[0] if row else 0,
+                          conn.execute('SELECT COALESCE(MAX(response_id), 0) FROM responses').fetchone()[0])
+            response_ids = range(last_id + 1, last_id + 1 + len(batch))
+            conn.executemany('INSERT INTO responses (response_id) VALUES (?)', ((i,) for i in response_ids))
+            conn.executemany('INSERT INTO user_responses (response_id, tag_id) VALUES (?, ?)',
+                             ((response_id, tag_id) for response_id, tag_ids in zip(response_ids, batch)
+                              for tag_id in tag_ids))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_response_writer(db_path):
+    '''
+    DB 경로별로 프로세스 전체에서 공유하는 ResponseWriter를 반환합니다.
+
+    매개변수 :
+        db_path(str) : 응답을 저장하는 SQLite DB 파일 경로
+    '''
+    writer = _writers.get(db_path)
+    if writer is not None:
+        return writer
+    with _writers_lock:
+        if db_path not in _writers:
+            _writers[db_path] = ResponseWriter(db_path)
+        return _writers[db_path]
+
+
+@atexit.register
+def close_response_writers():
+    '''
+    프로세스 종료 시 모든 ResponseWriter의 남은 응답을 저장합니다.
+    '''
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
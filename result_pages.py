@@ -0,0 +1,123 @@
+import string
+
+import streamlit as st
+
+
+def format_cards(frame, template):
+    '''
+    결과 DataFrame의 각 행을 HTML 카드 문자열로 만듭니다.
+    행마다 Series를 꺼내 f-string을 채우지 않고, 템플릿의 고정 문자열과 열 전체를 문자열 열로 이어 붙입니다.
+
+    템플릿의 줄 앞 들여쓰기와 줄바꿈은 제거하므로, 여러 카드를 이어 붙여도 마크다운의 코드 블록으로 해석되지 않습니다.
+
+    매개변수 :
+        frame(DataFrame) : 표시할 결과
+        template(str) : '{열 이름}' 자리표시자가 있는 카드 HTML (str.format 형식, 서식 지정자는 사용하지 않음)
+
+    반환값 :
+        cards(list) : 행 순서의 카드 HTML 문자열 목록
+    '''
+    template = ''.join(line.strip() for line in template.splitlines())
+    cards = ''
+    for literal, field, _, _ in string.Formatter().parse(template):
+        cards = cards + (literal if field is None else literal + frame[field].astype(str))
+    return [cards] * len(frame) if isinstance(cards, str) else cards.tolist()
+
+
+class ResultPager:
+    '''
+    조회 결과를 서버 측에서 한 페이지씩 나누어 카드로 표시하는 컴포넌트.
+
+    조회하는 쪽은 offset()과 page_size로 한 페이지만 DB에서 읽고, render()는 그 페이지의 카드를 열마다 하나의
+    st.markdown으로 보내므로, 결과가 아무리 많아도 한 번의 실행에 보내는 HTML 블록 수와 크기가 page_size로 제한됩니다.
+    현재 페이지와 정렬은 세션 상태에 key별로 저장하며, 조회 조건이 바뀌면 첫 페이지로 돌아갑니다.
+
+    속성 :
+        key(str) : 세션 상태와 위젯 key의 접두사
+        page_size(int) : 한 페이지에 표시할 결과 수. max_page_size를 넘지 않습니다.
+        sort_options(list) : 정렬 선택지 (첫 번째가 기본값)
+
+    메서드 :
+        sort() : 정렬 선택 위젯을 표시하고 선택된 정렬을 반환합니다.
+        offset(query) : 조회 조건에 해당하는 현재 페이지의 시작 위치를 반환합니다.
+        move(page) : 페이지를 이동합니다.
+        render(frame, template, columns) : 한 페이지의 결과를 카드로 표시합니다.
+        controls(total) : 페이지 위치와 이전/다음 페이지 버튼을 표시합니다.
+    '''
+    # 한 번의 실행에 보내는 카드 수의 상한
+    max_page_size = 50
+
+    def __init__(self, key, page_size=20, sort_options=None):
+        '''
+        ResultPager 클래스의 인스턴스를 초기화합니다.
+
+        매개변수 :
+            key(str) : 세션 상태와 위젯 key의 접두사
+            page_size(int) : 한 페이지에 표시할 결과 수
+            sort_options(list) : 정렬 선택지. 없으면 정렬 위젯을 표시하지 않습니다.
+        '''
+        self.key = key
+        self.page_size = max(1, min(page_size, self.max_page_size))
+        self.sort_options = list(sort_options or [])
+
+    def sort(self):
+        '''
+        정렬 선택 위젯을 표시하고 선택된 정렬을 반환합니다. 정렬 선택지가 없으면 None을 반환합니다.
+        '''
+        if not self.sort_options:
+            return None
+        return st.selectbox('정렬', self.sort_options, key=f'{self.key}_sort')
+
+    def offset(self, query):
+        '''
+        현재 페이지의 시작 위치를 반환합니다. 조회 조건(query)이 이전 실행과 다르면 첫 페이지로 돌아갑니다.
+
+        매개변수 :
+            query(tuple) : 조회 조건 (직업, 지역, 정렬 등). 비교할 수 있는 값이어야 합니다.
+
+        반환값 :
+            offset(int) : 현재 페이지의 첫 결과 위치
+        '''
+        if st.session_state.get(f'{self.key}_query') != query:
+            st.session_state[f'{self.key}_query'] = query
+            st.session_state[f'{self.key}_page'] = 0
+        return st.session_state.setdefault(f'{self.key}_page', 0) * self.page_size
+
+    def move(self, page):
+        '''
+        페이지를 이동합니다. 버튼 콜백으로 사용합니다.
+        '''
+        st.session_state[f'{self.key}_page'] = page
+
+    def render(self, frame, template, columns=1):
+        '''
+        한 페이지의 결과를 카드로 표시합니다. 카드는 열마다 이어 붙여 하나의 st.markdown으로 보냅니다.
+
+        매개변수 :
+            frame(DataFrame) : 한 페이지의 결과 (page_size행 이하)
+            template(str) : 카드 HTML 템플릿 (format_cards() 참고)
+            columns(int) : 카드를 나누어 놓을 화면 열 수. 카드는 왼쪽부터 차례로 번갈아 놓입니다.
+        '''
+        cards = format_cards(frame.iloc[:self.page_size], template)
+        if columns == 1:
+            st.markdown(''.join(cards), unsafe_allow_html=True)
+            return
+        for index, column in enumerate(st.columns(columns)):
+            with column:
+                st.markdown(''.join(cards[index::columns]), unsafe_allow_html=True)
+
+    def controls(self, total):
+        '''
+        페이지 위치와 이전/다음 페이지 버튼을 표시합니다. 버튼 콜백은 다음 실행 전에 호출되므로 클릭 즉시 이동한 페이지가 표시됩니다.
+
+        매개변수 :
+            total(int) : 조회 조건에 해당하는 전체 결과 수
+        '''
+        page = st.session_state.get(f'{self.key}_page', 0)
+        pages = max(1, -(-total // self.page_size))
+        col1, col2, col3 = st.columns([1, 2, 1])
+        if page > 0:
+            col1.button('이전', key=f'{self.key}_prev', on_click=self.move, args=(page - 1,))
+        col2.caption(f'{page + 1} / {pages} 페이지 (전체 {total:,}건)')
+        if page + 1 < pages:
+            col3.button('다음', key=f'{self.key}_next', on_click=self.move, args=(page + 1,))
@@ -1,6 +1,9 @@
 import streamlit as st
-import pandas as pd
-import sqlite3
+import numpy as np
+from job_similarity import JobSimilarityIndex
+from refdata import load_reference_data
+from response_writer import get_response_writer
+from tag_scoring import TagScorer
 
 class SurveyMatcher:
     '''
@@ -9,88 +12,149 @@ class SurveyMatcher:
     이 클래스는 Streamlit을 이용하여 웹 기반 인터페이스를 제공하고, 설문 데이터를 처리하며,
     사용자의 응답을 SQLite DB에 저장합니다. 사용자는 여러 설문 질문에 응답하고, 
     이 응답을 바탕으로 선호와 능력에 맞는 직업을 추천받을 수 있습니다.
+    응답은 참조 데이터와 별도의 DB에 write-behind 큐(response_writer.py)를 통해 모아서 저장합니다.
+
+    추천 방식은 두 가지를 지원합니다.
+    - 'count' (기본값) : 일치하는 태그 수가 같은 직업끼리 묶어 1~3순위로 보여줍니다.
+    - 'similarity' : 직업과 응답을 TF-IDF 가중 태그 벡터로 표현하여(job_similarity.py) 코사인 유사도 상위 직업을 보여줍니다.
+    사용자는 설문 화면에서 추천 방식을 고를 수 있으며, 생성할 때 정한 방식이 기본 선택값입니다.
     
     속성 :
-        data_path(str) : 데이터 파일이 위치한 디렉토리의 경로
-        db_path(str) : 사용자의 응답을 저장하는 SQLite DB의 파일 경로
+        db_path(str) : 설문, 태그, 직업 데이터가 있는 SQLite DB의 파일 경로
+        responses_db_path(str) : 사용자의 응답을 저장하는 SQLite DB의 파일 경로
+        mode(str) : 추천 방식 ('count' 또는 'similarity')
         
     메서드 :
         load_data : 해당 애플리케이션에 필요한 데이터 파일들을 로드하고, 데이터 프레임화 합니다.
+        set_mode : 추천 방식을 바꿉니다.
         prepare_questions_tags_map : 질문과 태그를 매핑합니다.
-        initialize_db : SQLite DB를 초기화하고, 필요한 데이터 테이블을 생성합니다.
-        save_responses : 사용자 응답을 DB에 저장합니다.
+        initialize_db : 응답을 저장할 write-behind 큐를 준비합니다.
+        save_responses : 사용자 응답을 저장 큐에 넣습니다.
         run_survey : Streamlit을 통해 사용자에게 설문 조사 인터페이스를 제공합니다.
         process_responses : 사용자의 응답을 처리하고, 누락된 응답이 있는지 확인합니다.
         dispaly_matched_jobs : 사용자 응답을 바탕으로 매칭된 직업을 추천하여 출력합니다.
         display_job_rank : 사용자에게 매칭된 직업의 순위를 출력합니다.
+        display_similar_jobs : 유사도 상위 직업을 순서대로 출력합니다.
         '''
-    def __init__(self, db_path='./db/data.db'):
+    # 추천 방식과 설문 화면에 표시할 이름
+    mode_labels = {'count': '일치하는 태그 수로 묶어서', 'similarity': '유사도 순으로'}
+
+    # 'similarity' 방식에서 보여줄 직업 수
+    similar_jobs_k = 10
+
+    def __init__(self, db_path='./db/data.db', responses_db_path='./db/responses.db', mode='count'):
         '''
         SurveyMatcher 클래스의 인스턴스를 초기화합니다.
         
         매개변수 :
-            db_path(str) : 사용자의 응답을 저장하는 SQLite DB의 파일 경로
+            db_path(str) : 설문, 태그, 직업 데이터가 있는 SQLite DB의 파일 경로
+            responses_db_path(str) : 사용자의 응답을 저장하는 SQLite DB의 파일 경로
+            mode(str) : 추천 방식 ('count' 또는 'similarity')
         '''
         self.db_path = db_path
+        self.responses_db_path = responses_db_path
         self.initialize_db()
         self.load_data()
+        self.set_mode(mode)
 
     def load_data(self):
         '''
-        SQLite 데이터베이스에서 필요한 데이터를 로드합니다.
+        프로세스 전체에서 공유하는 참조 데이터에서 필요한 데이터를 가져옵니다.
+        DB가 바뀌지 않았다면 SQLite를 다시 읽지 않습니다.
         '''
-        conn = sqlite3.connect(self.db_path)
+        self.data = load_reference_data(self.db_path)
 
-        self.question_df = pd.read_sql_query('SELECT * FROM question', conn)
-        self.tag_df = pd.read_sql_query('SELECT * FROM tag', conn)
-        self.tag_class_df = pd.read_sql_query('SELECT * FROM tag_class', conn)
-        self.tag_to_jobs_df = pd.read_sql_query('SELECT * FROM tag_to_jobs', conn)
-        self.jobs_df = pd.read_sql_query('SELECT * FROM jobs', conn)
+        self.question_df = self.data['question']
+        self.tag_df = self.data['tag']
+        self.tag_class_df = self.data['tag_class']
+        self.jobs_df = self.data['jobs']
 
-        conn.close()
+        # 직업×태그 희소 행렬과 직업명 매핑은 참조 데이터와 함께 한 번만 생성
+        self.tag_scorer = self.data.derived('tag_scorer', lambda data: TagScorer.from_frame(data['tag_to_jobs']))
+        self.job_names = self.data.derived(
+            'job_names', lambda data: dict(zip(data['jobs']['id_jobs'], data['jobs']['name_jobs'])))
         self.prepare_questions_tags_map()
 
+    def set_mode(self, mode):
+        '''
+        추천 방식을 바꿉니다. 'similarity' 방식의 유사도 인덱스는 처음 필요할 때 참조 데이터와 함께 한 번만 생성합니다.
+
+        매개변수 :
+            mode(str) : 추천 방식 ('count' 또는 'similarity')
+        '''
+        if mode not in self.mode_labels:
+            raise ValueError(f"mode는 'count' 또는 'similarity'여야 합니다: {mode}")
+        self.mode = mode
+        if mode == 'similarity':
+            self.similarity_index = self.data.derived(
+                'job_similarity_index', lambda data: JobSimilarityIndex.from_frame(data['tag_to_jobs']))
+
     def prepare_questions_tags_map(self):
         '''
         질문과 태그를 매핑합니다.
         질문 id와 태그 id의 앞 2글자를 통해 매핑을 하여 사용자에게 적절한 설문의 태그를 뽑는데 사용합니다.
+        매핑은 참조 데이터와 함께 캐시되어 DB가 바뀌기 전까지 다시 계산하지 않습니다.
+        '''
+        self.questions_tags_map, self.tags_code_map = self.data.derived(
+            'questions_tags_map', lambda data: self.build_questions_tags_map(data['question'], data['tag']))
+
+    @staticmethod
+    def build_questions_tags_map(question_df, tag_df):
         '''
-        self.questions_tags_map = {}
-        self.tags_code_map = {}
-        for _, row in self.question_df.iterrows():
-            question_tags = self.tag_df[self.tag_df['id_tag'].astype(str).str.startswith(str(row['id_tag_class']))]
-            self.questions_tags_map[row['id_question']] = {
-                'question': f"Q{row['id_question']} {row['name_question']}",
-                'tags': [f"#{tag}" for tag in question_tags['answer_tag'].tolist()]
+        질문별 태그 목록과 태그 라벨 → 태그 id 매핑을 한 번에 만듭니다.
+        태그 id를 태그 분류 id 길이만큼 잘라 접두사별로 한 번만 묶고, 각 질문은 자신의 태그 분류 id로 묶음을 찾습니다.
+        (질문 수 × 태그 수) 만큼 비교하던 기존 방식과 달리 (질문 수 + 태그 수)에 비례하는 시간이 걸립니다.
+
+        매개변수 :
+            question_df(DataFrame) : id_question, id_tag_class, name_question 컬럼을 가진 질문 데이터
+            tag_df(DataFrame) : id_tag, answer_tag 컬럼을 가진 태그 데이터
+
+        반환값 :
+            questions_tags_map(dict) : 질문 id → {'question': 질문 문구, 'tags': 태그 라벨 목록}
+            tags_code_map(dict) : 태그 라벨 → 태그 id(str)
+        '''
+        tag_codes = tag_df['id_tag'].astype(str)
+        tag_labels = ('#' + tag_df['answer_tag'].astype(str)).to_numpy()
+        class_codes = question_df['id_tag_class'].astype(str)
+
+        # 태그 분류 id의 길이별로, 태그 id 접두사 → 태그 위치(원래 순서) 묶음을 만듭니다.
+        positions_by_prefix = {
+            length: tag_codes.str[:length].groupby(tag_codes.str[:length].to_numpy(), sort=False).indices
+            for length in class_codes.str.len().unique()
+        }
+
+        empty = np.empty(0, dtype=np.int64)
+        questions_tags_map = {}
+        question_positions = []
+        for q_id, name, class_code in zip(question_df['id_question'].tolist(),
+                                          question_df['name_question'].tolist(), class_codes.tolist()):
+            positions = positions_by_prefix[len(class_code)].get(class_code, empty)
+            questions_tags_map[q_id] = {
+                'question': f"Q{q_id} {name}",
+                'tags': tag_labels[positions].tolist()
             }
-            for _, tag_row in question_tags.iterrows():
-                self.tags_code_map[f"#{tag_row['answer_tag']}"] = str(tag_row['id_tag'])
+            question_positions.append(positions)
+
+        # 같은 라벨이 여러 번 나오면 기존과 같이 마지막 태그 id가 남습니다.
+        all_positions = np.concatenate([empty] + question_positions)
+        tags_code_map = dict(zip(tag_labels[all_positions].tolist(), tag_codes.to_numpy()[all_positions].tolist()))
+        return questions_tags_map, tags_code_map
 
     def initialize_db(self):
         '''
-        SQLite DB를 초기화하고, 필요한 데이터 테이블을 생성합니다.
+        응답을 저장할 write-behind 큐를 준비합니다.
+        큐는 DB별로 프로세스 전체에서 공유되며, 응답 테이블은 큐의 백그라운드 스레드가 생성합니다.
         '''
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''CREATE TABLE IF NOT EXISTS responses (response_id INTEGER PRIMARY KEY AUTOINCREMENT)''')
-        c.execute('''CREATE TABLE IF NOT EXISTS user_responses (response_id INTEGER, tag_id INTEGER, FOREIGN KEY(response_id) REFERENCES responses(response_id))''')
-        conn.commit()
-        conn.close()
+        self.response_writer = get_response_writer(self.responses_db_path)
 
     def save_responses(self, tag_ids):
         '''
-        사용자가 선택한 태그 ID들을 데이터베이스에 저장합니다.
+        사용자가 선택한 태그 ID들을 저장 큐에 넣습니다.
+        실제 저장은 백그라운드 스레드가 다른 사용자의 응답과 함께 하나의 트랜잭션으로 처리합니다.
         매개변수 :
             tag_ids(list) : 사용자가 선택한 태그id 목록
         '''
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('INSERT INTO responses DEFAULT VALUES')
-        response_id = c.lastrowid
-        for tag_id in tag_ids:
-            c.execute('INSERT INTO user_responses (response_id, tag_id) VALUES (?, ?)', (response_id, tag_id))
-        conn.commit()
-        conn.close()
+        self.response_writer.submit(tag_ids)
 
     def run_survey(self):
         '''
@@ -111,6 +175,11 @@ class SurveyMatcher:
                 if response:
                     responses.setdefault(q_id, []).append(self.tags_code_map[tag])
 
+        # 생성할 때 정한 방식이 기본 선택값
+        modes = {label: mode for mode, label in self.mode_labels.items()}
+        label = st.radio("추천 결과를 어떻게 볼래?", list(modes), index=list(modes.values()).index(self.mode), horizontal=True)
+        self.set_mode(modes[label])
+
         if st.button("제출"):
             self.process_responses(responses)
 
@@ -128,12 +197,25 @@ class SurveyMatcher:
             self.display_matched_jobs(responses)
 
     def display_matched_jobs(self, responses):
+        '''
+        사용자 응답을 바탕으로 매칭된 직업을 추천하여 출력합니다.
+        직업×태그 희소 행렬과 응답 벡터의 곱으로 모든 직업의 일치 태그 수를 한 번에 계산합니다.
+        'similarity' 방식에서는 TF-IDF 태그 벡터의 유사도 상위 similar_jobs_k개 직업을 출력합니다.
+
+        매개변수 :
+            responses(dict) : 사용자의 응답을 담은 딕셔너리
+        '''
         selected_tags = [int(tag) for tags in responses.values() for tag in tags]
         self.save_responses(selected_tags)
-        job_match_counts = self.tag_to_jobs_df[self.tag_to_jobs_df['id_tag'].isin(selected_tags)].groupby('id_jobs')['id_tag'].count().reset_index(name='match_count').sort_values(by='match_count', ascending=False)
-        top_counts = job_match_counts['match_count'].unique()[:3]
+        if self.mode == 'similarity':
+            self.display_similar_jobs(*self.similarity_index.top_k(selected_tags, self.similar_jobs_k))
+            return
 
-        if job_match_counts.empty:
+        scores = self.tag_scorer.score(selected_tags)
+        # 일치 태그 수가 같은 직업끼리 묶은 상위 3개 순위
+        rank_groups = self.tag_scorer.rank_groups(scores, n_groups=3)
+
+        if not rank_groups:
             st.write("선택한 태그에 해당하는 추천 직업이 없습니다.")
             return
 
@@ -141,36 +223,31 @@ class SurveyMatcher:
 
         # 순위별로 직업 수를 계산하고 저장합니다.
         jobs_per_rank = {rank: 0 for rank in range(1, 4)}
-        for i, count in enumerate(top_counts, start=1):
-            current_rank_jobs_count = len(job_match_counts[job_match_counts['match_count'] == count])
-            jobs_per_rank[i] = current_rank_jobs_count
+        for i, (_, job_ids) in enumerate(rank_groups, start=1):
+            jobs_per_rank[i] = len(job_ids)
 
         # 1순위 조건 검사 및 출력
         if jobs_per_rank[1] >= 3:
-            self.display_job_rank(1, top_counts[0], job_match_counts)
+            self.display_job_rank(1, rank_groups[0][1])
         else:
-            self.display_job_rank(1, top_counts[0], job_match_counts)
+            self.display_job_rank(1, rank_groups[0][1])
             # 2순위 조건 검사 및 출력
             if jobs_per_rank[2] >= 3:
                 # 2순위가 3개 이상인 경우, 3순위는 출력하지 않음
-                self.display_job_rank(2, top_counts[1], job_match_counts)
+                self.display_job_rank(2, rank_groups[1][1])
             elif jobs_per_rank[2] > 0:
                 # 2순위가 3개 미만이고 존재하는 경우, 2순위를 출력
-                self.display_job_rank(2, top_counts[1], job_match_counts)
+                self.display_job_rank(2, rank_groups[1][1])
                 # 3순위 조건 검사 및 출력
                 if jobs_per_rank[3] > 0:
-                    self.display_job_rank(3, top_counts[2], job_match_counts)
-
-
-
+                    self.display_job_rank(3, rank_groups[2][1])
 
-    def display_job_rank(self, rank, count, job_match_counts):
+    def display_job_rank(self, rank, job_ids):
         '''
         사용자에게 매칭된 직업의 순위를 출력합니다.
         매개변수 :
             rank(int) : 직업의 우선 순위
-            count(int) : 매칭 카운트
-            job_match_counts(DataFrame) : 직업과 매치된 카운트를 포함하는 데이터 프레임
+            job_ids(array-like) : 해당 순위에 속하는 직업 id 목록
         '''
         # 순위별 배경색 설정
         background_colors = {1: '#FFD700', 2: '#C0C0C0', 3: '#CD7F32'}
@@ -179,9 +256,7 @@ class SurveyMatcher:
         # 배경색이 밝은 경우 글자색을 검정색으로 설정
         text_color = '#000000' if background_color in ['#FFD700', '#C0C0C0', '#CD7F32'] else '#FFFFFF'
 
-        current_rank_jobs = job_match_counts[job_match_counts['match_count'] == count]
-        current_rank_job_ids = current_rank_jobs['id_jobs'].unique()
-        matched_jobs_names = self.jobs_df[self.jobs_df['id_jobs'].isin(current_rank_job_ids)]['name_jobs'].tolist()
+        matched_jobs_names = [self.job_names[job_id] for job_id in job_ids if job_id in self.job_names]
 
         # 순위별 배경색과 글자색을 적용하여 직업 이름 출력
         st.markdown(f'<div style="background-color: {background_color}; color: {text_color}; margin: 10px 0px; padding: 10px; border-radius: 10px;"><h3>{rank}순위 직군</h3>', unsafe_allow_html=True)
@@ -189,6 +264,26 @@ class SurveyMatcher:
             st.markdown(f'<p style="margin-left: 20px; font-size : 20px; ">- {job_name}</p>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
+    def display_similar_jobs(self, job_ids, similarities):
+        '''
+        유사도 상위 직업을 유사도 내림차순으로 출력합니다. 같은 순위로 묶지 않고 한 목록에 순서대로 보여줍니다.
+
+        매개변수 :
+            job_ids(ndarray) : 유사도 내림차순의 직업 id
+            similarities(ndarray) : 직업별 0~1 유사도
+        '''
+        if not len(job_ids):
+            st.write("선택한 태그에 해당하는 추천 직업이 없습니다.")
+            return
+
+        st.write("이런 직업들이 어울리겠는데??:")
+        items = ''.join(
+            f'<p style="margin-left: 20px; font-size : 20px; ">{rank}. {self.job_names[job_id]} ({similarity:.0%})</p>'
+            for rank, (job_id, similarity) in enumerate(zip(job_ids.tolist(), similarities.tolist()), start=1)
+            if job_id in self.job_names)
+        st.markdown(f'<div style="background-color: #cbf3f0; color: #000000; margin: 10px 0px; padding: 10px; border-radius: 10px;">'
+                    f'<h3>유사도 순 추천 직업</h3>{items}</div>', unsafe_allow_html=True)
+
 
 if __name__ == '__main__':
     survey_app = SurveyMatcher()
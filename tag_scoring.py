@@ -0,0 +1,181 @@
+import numpy as np
+from scipy import sparse
+
+
+class TagScorer:
+    '''
+    직업×태그 희소 행렬을 이용하여 설문 응답에 대한 직업 점수를 계산하는 클래스.
+
+    tag_to_jobs 데이터로부터 직업×태그 incidence 행렬(CSR)을 한 번 만들어 두고,
+    응답(선택한 태그 목록)을 태그 벡터로 바꾼 뒤 희소 행렬-벡터 곱 한 번으로 모든 직업의 점수를 계산합니다.
+    가중치가 없으면 점수는 기존과 같이 '일치하는 태그 수'입니다.
+
+    속성 :
+        job_ids(ndarray) : 행렬의 행 순서에 대응하는 직업 id (오름차순)
+        tag_ids(ndarray) : 행렬의 열 순서에 대응하는 태그 id (오름차순)
+        matrix(csr_matrix) : 직업×태그 가중치 행렬
+        matrix_by_tag(csc_matrix) : 같은 행렬의 열 기준 사본
+
+    메서드 :
+        from_frame(tag_to_jobs_df, weight_column) : tag_to_jobs DataFrame으로부터 생성합니다.
+        response_vector(selected_tags, tag_weights) : 응답을 태그 벡터로 변환합니다.
+        score(selected_tags, tag_weights) : 하나의 응답에 대한 직업별 점수를 계산합니다.
+        score_batch(responses, tag_weights) : 여러 응답의 직업별 점수를 한 번에 계산합니다.
+        top_k(scores, k) : 점수가 높은 상위 k개 직업을 반환합니다.
+        rank_groups(scores, n_groups) : 같은 점수의 직업을 묶어 상위 n_groups개 순위를 반환합니다.
+    '''
+    def __init__(self, job_ids, tag_ids, weights=None):
+        '''
+        TagScorer 클래스의 인스턴스를 초기화합니다.
+
+        매개변수 :
+            job_ids(array-like) : (직업, 태그) 쌍의 직업 id
+            tag_ids(array-like) : (직업, 태그) 쌍의 태그 id
+            weights(array-like) : (직업, 태그) 쌍의 가중치. None이면 모두 1
+        '''
+        job_ids = np.asarray(job_ids, dtype=np.int64)
+        tag_ids = np.asarray(tag_ids, dtype=np.int64)
+        if weights is None:
+            weights = np.ones(len(job_ids), dtype=np.float64)
+        self.job_ids = np.unique(job_ids)
+        self.tag_ids = np.unique(tag_ids)
+        rows = np.searchsorted(self.job_ids, job_ids)
+        cols = np.searchsorted(self.tag_ids, tag_ids)
+        # 중복된 (직업, 태그) 쌍은 더해져 기존 groupby().count()와 같은 점수가 됩니다.
+        self.matrix = sparse.csr_matrix(
+            (np.asarray(weights, dtype=np.float64), (rows, cols)),
+            shape=(len(self.job_ids), len(self.tag_ids)))
+        self.matrix.sum_duplicates()
+        # 응답에서 선택된 태그의 열만 읽을 수 있도록 열 기준(CSC) 사본도 보관
+        self.matrix_by_tag = self.matrix.tocsc()
+
+    @classmethod
+    def from_frame(cls, tag_to_jobs_df, weight_column=None):
+        '''
+        tag_to_jobs DataFrame으로부터 TagScorer를 생성합니다.
+
+        매개변수 :
+            tag_to_jobs_df(DataFrame) : id_jobs, id_tag 컬럼을 가진 데이터
+            weight_column(str) : (직업, 태그) 쌍의 가중치 컬럼. None이면 모두 1
+        '''
+        weights = tag_to_jobs_df[weight_column].to_numpy() if weight_column else None
+        return cls(tag_to_jobs_df['id_jobs'].to_numpy(), tag_to_jobs_df['id_tag'].to_numpy(), weights)
+
+    def tag_positions(self, selected_tags):
+        '''
+        태그 id를 행렬의 열 위치로 변환합니다. 행렬에 없는 태그는 제외합니다.
+
+        반환값 :
+            positions(ndarray) : 열 위치
+            found(ndarray) : 입력 태그 중 행렬에 존재하는 태그의 위치
+        '''
+        tags = np.asarray(selected_tags, dtype=np.int64)
+        if not len(self.tag_ids):
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        positions = np.searchsorted(self.tag_ids, tags)
+        positions[positions == len(self.tag_ids)] = 0
+        found = np.flatnonzero(self.tag_ids[positions] == tags)
+        return positions[found], found
+
+    def response_vector(self, selected_tags, tag_weights=None):
+        '''
+        응답(선택한 태그 목록)을 태그 벡터로 변환합니다.
+
+        매개변수 :
+            selected_tags(list) : 사용자가 선택한 태그 id 목록
+            tag_weights(dict) : 태그 id별 가중치. 없는 태그는 1
+
+        반환값 :
+            vector(ndarray) : 태그 수 길이의 벡터
+        '''
+        vector = np.zeros(len(self.tag_ids), dtype=np.float64)
+        positions, found = self.tag_positions(selected_tags)
+        weights = self.query_weights(selected_tags, tag_weights)[found]
+        np.add.at(vector, positions, weights)
+        return vector
+
+    @staticmethod
+    def query_weights(selected_tags, tag_weights):
+        '''
+        선택한 태그별 가중치 배열을 반환합니다.
+        '''
+        if not tag_weights:
+            return np.ones(len(selected_tags), dtype=np.float64)
+        return np.array([tag_weights.get(tag, 1.0) for tag in selected_tags], dtype=np.float64)
+
+    def score(self, selected_tags, tag_weights=None):
+        '''
+        하나의 응답에 대한 직업별 점수를 계산합니다.
+        선택된 태그의 열만 잘라 곱하므로 계산량은 선택된 태그에 연결된 (직업, 태그) 쌍의 수에 비례합니다.
+
+        매개변수 :
+            selected_tags(list) : 사용자가 선택한 태그 id 목록
+            tag_weights(dict) : 태그 id별 가중치
+
+        반환값 :
+            scores(ndarray) : job_ids 순서의 직업별 점수
+        '''
+        positions, found = self.tag_positions(selected_tags)
+        weights = self.query_weights(selected_tags, tag_weights)[found]
+        return np.asarray(self.matrix_by_tag[:, positions] @ weights).ravel()
+
+    def score_batch(self, responses, tag_weights=None):
+        '''
+        여러 응답의 직업별 점수를 희소 행렬 곱 한 번으로 계산합니다.
+
+        매개변수 :
+            responses(list) : 응답별 선택한 태그 id 목록의 리스트
+            tag_weights(dict) : 태그 id별 가중치
+
+        반환값 :
+            scores(ndarray) : (응답 수 × 직업 수) 점수 행렬
+        '''
+        empty = np.empty(0, dtype=np.int64)
+        rows, cols, data = [empty], [empty], [empty.astype(np.float64)]
+        for i, selected_tags in enumerate(responses):
+            positions, found = self.tag_positions(selected_tags)
+            rows.append(np.full(len(positions), i, dtype=np.int64))
+            cols.append(positions)
+            data.append(self.query_weights(selected_tags, tag_weights)[found])
+        queries = sparse.csr_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(len(responses), len(self.tag_ids)))
+        return (queries @ self.matrix.T).toarray()
+
+    def top_k(self, scores, k):
+        '''
+        점수가 높은 상위 k개 직업을 반환합니다. 점수가 0인 직업은 제외합니다.
+        argpartition으로 후보 k개만 고른 뒤 정렬하므로 전체 정렬이 필요 없습니다.
+
+        매개변수 :
+            scores(ndarray) : score()가 반환한 직업별 점수
+            k(int) : 반환할 직업 수
+
+        반환값 :
+            job_ids(ndarray) : 점수 내림차순의 직업 id
+            top_scores(ndarray) : 직업별 점수
+        '''
+        k = min(k, len(scores))
+        if k <= 0:
+            return self.job_ids[:0], scores[:0]
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        candidates = candidates[scores[candidates] > 0]
+        return self.job_ids[candidates], scores[candidates]
+
+    def rank_groups(self, scores, n_groups=3):
+        '''
+        같은 점수의 직업을 하나의 순위로 묶어, 점수가 높은 순서로 n_groups개 순위를 반환합니다.
+        점수가 0인 직업은 제외합니다.
+
+        매개변수 :
+            scores(ndarray) : score()가 반환한 직업별 점수
+            n_groups(int) : 반환할 순위의 수
+
+        반환값 :
+            groups(list) : (점수, 직업 id 배열)의 리스트
+        '''
+        matched = np.flatnonzero(scores > 0)
+        top_scores = np.unique(scores[matched])[::-1][:n_groups]
+        return [(score, self.job_ids[matched[scores[matched] == score]]) for score in top_scores]
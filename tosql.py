@@ -1,35 +1,235 @@
-import pandas as pd
+import argparse
+import csv
+import itertools
+import operator
+import os
 import sqlite3
+import tempfile
+import time
 
-conn = sqlite3.connect('./db/data.db')
-
-def load_data():
-    path='./db_data/'
-    edu_company=pd.read_csv(path+'edu_company.csv')
-    edu_program=pd.read_csv(path+'edu_program.csv')
-    jobs_to_worknet=pd.read_csv(path+'jobs_to_worknet.csv')
-    #jobs=pd.read_csv(path+'jobs.csv')
-    #ncs_to_jobs=pd.read_csv(path+'ncs_to_jobs.csv')
-    #ncs=pd.read_csv(path+'ncs.csv')
-    #question=pd.read_csv(path+'question.csv')
-    #tag_class=pd.read_csv(path+'tag_class.csv')
-    #tag_to_jobs=pd.read_csv(path+'tag_to_jobs.csv')
-    #tag=pd.read_csv(path+'tag.csv')
-    worknet_company=pd.read_csv(path+'worknet_company.csv')
-    worknet_positions=pd.read_csv(path+'worknet_positions.csv')
-    
-    # 각 데이터 프레임을 고유한 이름의 테이블로 저장
-    edu_company.to_sql('edu_company', conn, if_exists='replace', index=False)
-    edu_program.to_sql('edu_program', conn, if_exists='replace', index=False)
-    jobs_to_worknet.to_sql('jobs_to_worknet', conn, if_exists='replace', index=False)
-    #jobs.to_sql('jobs', conn, if_exists='replace', index=False)
-    #ncs_to_jobs.to_sql('ncs_to_jobs', conn, if_exists='replace', index=False)
-    #ncs.to_sql('ncs', conn, if_exists='replace', index=False)
-    #question.to_sql('question', conn, if_exists='replace', index=False)
-    #tag_class.to_sql('tag_class', conn, if_exists='replace', index=False)
-    #tag_to_jobs.to_sql('tag_to_jobs', conn, if_exists='replace', index=False)
-    #tag.to_sql('tag', conn, if_exists='replace', index=False)
-    worknet_company.to_sql('worknet_company', conn, if_exists='replace', index=False)
-    worknet_positions.to_sql('worknet_positions', conn, if_exists='replace', index=False)
-    
-load_data()
+from migrations import POSTING_TABLES, TABLE_SCHEMAS, add_indexes, add_posting_keys, dedupe_postings, migrate
+from precompute import build_job_postings_flat, build_job_recommendations
+from regions import update_region_codes
+
+# CSV에서 적재하는 기본 테이블
+# worknet_company, worknet_positions는 crawling_works.main()이 data.db에 직접 증분 적재
+DEFAULT_TABLES = ['edu_company', 'edu_program', 'jobs_to_worknet']
+
+
+def schema_info(conn, schema):
+    '''
+    스키마 정의의 PRAGMA table_info 행 목록을 반환합니다. 임시 테이블을 만들어 SQLite가 해석한 결과를 읽습니다.
+    '''
+    conn.execute('DROP TABLE IF EXISTS temp.schema_probe')
+    conn.execute(f'CREATE TEMP TABLE schema_probe {schema}')
+    rows = conn.execute('PRAGMA temp.table_info(schema_probe)').fetchall()
+    conn.execute('DROP TABLE temp.schema_probe')
+    return rows
+
+
+def column_types(conn, schema):
+    '''
+    스키마 정의의 (열 이름, 타입) 목록을 반환합니다.
+    '''
+    return [(row[1], row[2]) for row in schema_info(conn, schema)]
+
+
+def check_csv_header(conn, name, csv_path):
+    '''
+    CSV 머리글이 테이블 스키마와 맞는지 확인합니다.
+
+    스키마의 열이 하나도 없거나 NOT NULL 열, 기본키 열 중 하나라도 없으면 ValueError를 발생시킵니다.
+    잘못된 파일이나 인코딩이 다른 파일로 기존 테이블과 사전 계산 테이블이 비워지지 않도록, 적재를 시작하기 전에 호출합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : 스키마를 해석할 DB 연결
+        name(str) : 테이블 이름
+        csv_path(str) : CSV 파일 경로
+
+    반환값 :
+        header(list) : CSV 머리글의 열 이름 목록
+    '''
+    try:
+        with open(csv_path, newline='', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f), [])
+    except UnicodeDecodeError as e:
+        raise ValueError(f'{csv_path}: UTF-8로 읽을 수 없는 파일입니다 ({e})') from e
+    info = schema_info(conn, TABLE_SCHEMAS[name])
+    if not any(row[1] in header for row in info):
+        raise ValueError(f'{csv_path}: 머리글에 {name} 테이블의 열이 하나도 없습니다 '
+                         f'(머리글: {", ".join(header)}, 필요한 열: {", ".join(row[1] for row in info)})')
+    # row[3]은 NOT NULL 여부, row[5]는 기본키에서의 위치(기본키가 아니면 0)
+    missing = [row[1] for row in info if (row[3] or row[5]) and row[1] not in header]
+    if missing:
+        raise ValueError(f'{csv_path}: 머리글에 {name} 테이블의 NOT NULL/기본키 열이 없습니다: {", ".join(missing)}')
+    return header
+
+
+def stage_csv(conn, name, csv_path, chunksize):
+    '''
+    CSV 하나를 적재용 DB의 같은 이름 테이블로 읽어 들입니다.
+
+    CSV는 chunksize행씩 읽어 executemany로 넣으며, 행에서 필요한 열을 고르는 것(itemgetter)과
+    빈 값을 NULL로 바꾸는 것(NULLIF)은 C 코드에서 처리하여 행마다 파이썬 코드를 실행하지 않습니다.
+    CSV에만 있는 열(pandas가 저장한 인덱스 "Unnamed: 0" 등)은 버리고, CSV에 없는 열은 NULL로 채웁니다.
+    머리글이 스키마와 맞지 않으면 check_csv_header()가 ValueError를 발생시키며, 이때는 테이블을 만들지 않습니다.
+    열 타입은 목표 스키마와 같게 선언하므로 숫자 문자열은 SQLite의 타입 친화성에 따라 정수로 저장됩니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : 트랜잭션이 시작된 적재용 DB 연결
+        name(str) : 테이블 이름
+        csv_path(str) : CSV 파일 경로
+        chunksize(int) : executemany 한 번에 넣을 행 수
+
+    반환값 :
+        row_count(int) : 적재한 행 수
+    '''
+    check_csv_header(conn, name, csv_path)
+    columns = column_types(conn, TABLE_SCHEMAS[name])
+    conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+    conn.execute(f'''CREATE TABLE "{name}" ({', '.join(f'"{column}" {type_}' for column, type_ in columns)})''')
+    row_count = 0
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        positions = {column: index for index, column in enumerate(next(reader, []))}
+        present = [column for column, _ in columns if column in positions]
+        indexes = [positions[column] for column in present]
+        # itemgetter는 인덱스가 하나이면 튜플이 아닌 값을 반환
+        select = operator.itemgetter(*indexes) if len(indexes) > 1 else lambda record: (record[indexes[0]],)
+        values = ', '.join("NULLIF(?, '')" if column in positions else 'NULL' for column, _ in columns)
+        insert = f'INSERT INTO "{name}" VALUES ({values})'
+        while True:
+            chunk = list(itertools.islice(reader, chunksize))
+            if not chunk:
+                return row_count
+            conn.executemany(insert, map(select, chunk))
+            row_count += len(chunk)
+
+
+def swap_tables(conn, staging_path, names):
+    '''
+    적재용 DB의 테이블로 data.db의 테이블을 한 번에 교체합니다.
+
+    목표 스키마의 새 테이블에 데이터를 복사한 뒤 기존 테이블과 바꾸고 인덱스까지 만드는 과정을 하나의 트랜잭션으로 처리하므로,
+    읽는 쪽에서는 교체 전이나 교체 후의 테이블만 볼 수 있습니다. 교육기관의 시/도 코드(region_code)도 이때 주소에서 추출합니다. 완전히 같은 중복 행은 하나로 합치며,
+    키가 충돌하는 서로 다른 행이 있으면 IntegrityError가 발생하고 기존 테이블이 그대로 남습니다.
+    공고 테이블을 교체하면 migrations.dedupe_postings()로 중복 공고와 회사도 정리합니다.
+
+    매개변수 :
+        conn(sqlite3.Connection) : data.db 연결
+        staging_path(str) : 적재용 DB 파일 경로
+        names(list) : 교체할 테이블 이름 목록
+    '''
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    conn.execute('ATTACH DATABASE ? AS staging', (staging_path,))
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for name in names:
+                new_name = f'{name}__new'
+                conn.execute(f'DROP TABLE IF EXISTS main."{new_name}"')
+                conn.execute(f'CREATE TABLE main."{new_name}" {TABLE_SCHEMAS[name]}')
+                columns = ', '.join(f'"{column}"' for column, _ in column_types(conn, TABLE_SCHEMAS[name]))
+                conn.execute(f'INSERT INTO main."{new_name}" ({columns}) SELECT DISTINCT {columns} FROM staging."{name}"')
+                conn.execute(f'DROP TABLE IF EXISTS main."{name}"')
+                conn.execute(f'ALTER TABLE main."{new_name}" RENAME TO "{name}"')
+            if 'edu_company' in names:
+                update_region_codes(conn, 'edu_company', 'address')
+            add_indexes(conn)
+            if set(names) & set(POSTING_TABLES):
+                add_posting_keys(conn)
+                dedupe_postings(conn)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+    finally:
+        conn.execute('DETACH DATABASE staging')
+        conn.isolation_level = isolation_level
+
+
+def load_data(db_path='./db/data.db', tables=DEFAULT_TABLES, path='./db_data/', chunksize=50000):
+    '''
+    db_data의 CSV를 data.db의 테이블로 적재합니다.
+
+    CSV는 chunksize행씩 스트리밍하여 executemany로 data.db 옆의 임시 적재용 DB에 넣습니다.
+    적재용 DB는 중단되면 버리는 파일이므로 PRAGMA synchronous=OFF, journal_mode=MEMORY로 하나의 트랜잭션 안에서 빠르게 씁니다.
+    적재 전에 모든 CSV의 머리글을 확인하며, 하나라도 스키마와 맞지 않으면 ValueError를 발생시키고 data.db를 바꾸지 않습니다.
+    이후 swap_tables()로 목표 스키마(키, 인덱스 포함)의 테이블을 data.db에 한 번에 교체하고,
+    적용되지 않은 마이그레이션과 사전 계산 테이블을 갱신합니다.
+
+    매개변수 :
+        db_path(str) : data.db 경로
+        tables(list) : 적재할 테이블 이름 목록. 각 테이블은 path 아래의 '{테이블 이름}.csv'에서 읽습니다.
+        path(str) : CSV 파일이 있는 디렉터리
+        chunksize(int) : executemany 한 번에 넣을 행 수
+
+    반환값 :
+        stats(list) : 테이블별 (이름, 행 수, 적재 시간(초)) 목록과 교체 시간(초)의 튜플
+    '''
+    unknown = [name for name in tables if name not in TABLE_SCHEMAS]
+    if unknown:
+        raise ValueError(f'스키마가 정의되지 않은 테이블입니다: {", ".join(unknown)}')
+
+    fd, staging_path = tempfile.mkstemp(prefix='load_', suffix='.db', dir=os.path.dirname(os.path.abspath(db_path)))
+    os.close(fd)
+    stats = []
+    try:
+        staging = sqlite3.connect(staging_path, isolation_level=None)
+        try:
+            staging.execute('PRAGMA synchronous = OFF')
+            staging.execute('PRAGMA journal_mode = MEMORY')
+            # 잘못된 파일이 뒤에 있어도 앞의 테이블을 적재하기 전에 중단
+            for name in tables:
+                check_csv_header(staging, name, os.path.join(path, f'{name}.csv'))
+            staging.execute('BEGIN')
+            for name in tables:
+                start = time.perf_counter()
+                row_count = stage_csv(staging, name, os.path.join(path, f'{name}.csv'), chunksize)
+                stats.append((name, row_count, time.perf_counter() - start))
+            staging.execute('COMMIT')
+        finally:
+            staging.close()
+
+        conn = sqlite3.connect(db_path)
+        try:
+            start = time.perf_counter()
+            swap_tables(conn, staging_path, tables)
+            swap_seconds = time.perf_counter() - start
+            # 적재하지 않은 테이블에 남은 마이그레이션 적용
+            migrate(conn)
+            # 원본 테이블이 바뀌었으므로 사전 계산 테이블도 다시 생성
+            build_job_postings_flat(conn)
+            build_job_recommendations(conn)
+        finally:
+            conn.close()
+    finally:
+        os.remove(staging_path)
+    return stats, swap_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='db_data의 CSV를 data.db에 적재합니다.')
+    parser.add_argument('tables', nargs='*', metavar='table',
+                        help=f'적재할 테이블. {", ".join(sorted(TABLE_SCHEMAS))} 중에서 선택 (기본값: {" ".join(DEFAULT_TABLES)})')
+    parser.add_argument('--db', default='./db/data.db', help='data.db 경로')
+    parser.add_argument('--path', default='./db_data/', help='CSV 파일이 있는 디렉터리')
+    parser.add_argument('--chunksize', type=int, default=50000, help='executemany 한 번에 넣을 행 수')
+    args = parser.parse_args()
+    unknown = [name for name in args.tables if name not in TABLE_SCHEMAS]
+    if unknown:
+        parser.error(f'스키마가 정의되지 않은 테이블입니다: {", ".join(unknown)}')
+
+    start = time.perf_counter()
+    stats, swap_seconds = load_data(args.db, args.tables or DEFAULT_TABLES, args.path, args.chunksize)
+    total = time.perf_counter() - start
+    print(f'{"table":<20}{"rows":>12}{"seconds":>10}{"rows/s":>12}')
+    for name, row_count, seconds in stats:
+        print(f'{name:<20}{row_count:>12,}{seconds:>10.2f}{row_count / max(seconds, 1e-9):>12,.0f}')
+    row_count = sum(row_count for _, row_count, _ in stats)
+    print(f'swap {swap_seconds:.2f}s, total {row_count:,} rows in {total:.2f}s ({row_count / max(total, 1e-9):,.0f} rows/s)')
+
+
+if __name__ == '__main__':
+    main()
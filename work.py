@@ -1,22 +1,57 @@
 import streamlit as st
 import pandas as pd
 import sqlite3
+from contextlib import closing
+from ncs_hierarchy import group_jobs_by_field
+from refdata import load_reference_data
+from regions import region_name
+from result_pages import ResultPager
 
 class JobMatcher:
     '''
     사용자의 직업 선택에 기반하여 적합한 채용 공고를 매칭하고 표시하는 애플리케이션.
 
     이 클래스는 사용자에게 직업 선택을 위한 인터페이스를 제공하고, 선택된 직업에 대한 채용 공고를 데이터베이스에서 조회하여 표시합니다.
-    데이터는 pandas DataFrame을 통해 처리되며, Streamlit을 사용하여 웹 기반 인터페이스를 구현합니다.
+    채용 공고는 precompute.py에서 미리 조인해 둔 job_postings_flat 테이블에서 (직업명, 지역 코드) 인덱스로 조회하며,
+    ResultPager(result_pages.py)로 page_size개씩 한 페이지만 조회하여 표시합니다.
+    기본 정렬인 추천순은 precompute.py가 직업별로 미리 점수를 매겨 둔 상위 공고(job_posting_ranks)를 (id_jobs, rank) 기본키로 읽습니다.
+    지역을 고르면 추천순도 조건에 맞는 공고 전체를 미리 저장한 공고 점수로 정렬합니다.
+    Streamlit을 사용하여 웹 기반 인터페이스를 구현합니다.
     
     속성:
-        path (str): 데이터 파일이 위치한 디렉토리의 경로.
+        db_path (str): SQLite DB 파일 경로.
         
     메서드:
-        read_data(): 채용 관련 데이터 파일들을 로드합니다.
-        match_data(): 로드된 데이터를 기반으로 직업과 채용 공고를 매칭합니다.
+        load_data(): 직업 선택에 필요한 데이터를 로드합니다.
+        find_postings(job_title, region_codes, limit, offset, sort): 선택된 직업과 지역에 해당하는 채용 공고를 조회합니다.
+        count_postings(job_title, region_codes, sort): 선택된 직업과 지역에 해당하는 채용 공고 수를 반환합니다.
         app_interface(): 사용자에게 직업 선택 인터페이스를 제공하고 매칭된 채용 공고를 표시합니다.
     '''
+    # 미리 계산한 직업별 추천 순위로 정렬하는 선택값 (기본값)
+    recommended_sort = '추천순'
+
+    # 나머지 정렬 선택값과 ORDER BY 절. date는 'YY/MM/DD 등록'으로 시작하므로 문자열 순서가 등록일 순서입니다.
+    sort_orders = {
+        '기본순': 'f.rowid',
+        '최신 등록순': 'f.date DESC, f.rowid',
+    }
+
+    # 한 페이지에 표시할 채용 공고 수
+    page_size = 20
+
+    # 채용 공고 카드 HTML (result_pages.format_cards()의 템플릿)
+    posting_card_template = '''
+        <div style="background-color:#cbf3f0;padding:20px;border-radius:10px;margin-bottom:10px;">
+            <h4 style="color:#333;">{recruit}</h4>
+            <p>회사명: <strong>{work_company}</strong></p>
+            <p>{job_describ_1}</p>
+            <p>{job_describ_2}</p>
+            <p>{condition}</p>
+            <p>{date}</p>
+            <a href="{link}" target="_blank">More Info</a>
+        </div>
+    '''
+
     def __init__(self, db_path='./db/data.db'):
         '''
         JobMatcher 클래스의 인스턴스를 초기화합니다.
@@ -25,31 +60,118 @@ class JobMatcher:
             db_path(str) : SQLite DB 파일 경로
         '''
         self.db_path = db_path
-        self.jobs, self.jobs_to_worknet, self.worknet_positions, self.worknet_company, self.ncs_to_jobs = self.load_data()
-        self.final_matched_data = self.match_data()
-
+        self.jobs, self.field_jobs, self.regions = self.load_data()
 
     def load_data(self):
         '''
-        SQLite 데이터베이스에서 채용 관련 데이터를 로드합니다.
+        프로세스 전체에서 공유하는 참조 데이터에서 직업 선택에 필요한 데이터를 가져옵니다.
+        DB가 바뀌지 않았다면 SQLite를 다시 읽지 않습니다.
+        '''
+        self.data = load_reference_data(self.db_path)
+        jobs = self.data['jobs']
+        field_jobs = self.data.derived('work_field_jobs', self.build_field_jobs)
+        regions = self.data.derived('work_regions', self.build_regions)
+        return jobs, field_jobs, regions
+
+    @staticmethod
+    def build_field_jobs(data):
+        '''
+        직업 분야별 직업명 목록을 만듭니다. 분야는 ncs_to_jobs에 저장된 NCS 대분류(ncs_major)로 정합니다.
+
+        매개변수 :
+            data(ReferenceData) : 공유 참조 데이터
+
+        반환값 :
+            field_jobs(dict) : 직업 분야 이름 → 직업명 리스트 (jobs 데이터 순서)
+        '''
+        pairs = data['jobs'][['id_jobs', 'name_jobs']].merge(data['ncs_to_jobs'][['id_jobs', 'ncs_major']], on='id_jobs')
+        return group_jobs_by_field(pairs['ncs_major'], pairs['name_jobs'])
+
+    @staticmethod
+    def build_regions(data):
+        '''
+        채용 공고가 존재하는 지역 코드(regions.REGIONS의 위치) 목록을 만듭니다. 알 수 없는 지역(NULL)은 제외합니다.
+        job_postings_flat은 load_reference_data()가 처음 호출될 때 준비되어 있으므로 조회만 합니다.
+
+        매개변수 :
+            data(ReferenceData) : 공유 참조 데이터
+        '''
+        with closing(sqlite3.connect(data.db_path)) as conn:
+            return [code for (code,) in conn.execute(
+                'SELECT DISTINCT region_code FROM job_postings_flat WHERE region_code IS NOT NULL ORDER BY region_code')]
+
+    def find_postings(self, job_title, region_codes=None, limit=None, offset=0, sort=None):
+        '''
+        선택된 직업과 지역에 해당하는 채용 공고를 job_postings_flat에서 조회합니다.
+        limit을 주면 정렬된 결과 중 offset부터 limit개만 읽습니다.
+
+        매개변수 :
+            job_title(str) : 사용자가 선택한 직업
+            region_codes(list) : 사용자가 선택한 지역 코드 리스트. 비어 있으면 모든 지역
+            limit(int) : 조회할 최대 공고 수. None이면 전체
+            offset(int) : 건너뛸 공고 수
+            sort(str) : recommended_sort 또는 sort_orders의 정렬 선택값. None이면 기본순
+
+        반환값 :
+            postings(DataFrame) : 조회된 채용 공고 목록
         '''
+        query, params = self.build_postings_query(job_title, region_codes, sort)
+        if limit is not None:
+            query += ' LIMIT ? OFFSET ?'
+            params += [limit, offset]
+        # 테이블의 존재는 load_reference_data()에서 확인됨
         conn = sqlite3.connect(self.db_path)
-        jobs = pd.read_sql_query('SELECT * FROM jobs', conn)
-        jobs_to_worknet = pd.read_sql_query('SELECT * FROM jobs_to_worknet', conn)
-        worknet_positions = pd.read_sql_query('SELECT * FROM worknet_positions', conn)
-        worknet_company = pd.read_sql_query('SELECT * FROM worknet_company', conn)
-        ncs_to_jobs = pd.read_sql_query('SELECT * FROM ncs_to_jobs', conn)  # ncs_to_jobs 데이터 로드 추가
+        postings = pd.read_sql_query(query, conn, params=params)
         conn.close()
-        return jobs, jobs_to_worknet, worknet_positions, worknet_company, ncs_to_jobs
+        return postings
 
-    def match_data(self):
+    def count_postings(self, job_title, region_codes=None, sort=None):
         '''
-        로드된 데이터를 기반으로 직업과 채용 공고를 매칭합니다.
+        선택된 직업과 지역에 해당하는 채용 공고 수를 셉니다. 지역을 고르지 않은 추천순은 추천 목록 안에서만 셉니다.
+
+        매개변수 :
+            job_title(str) : 사용자가 선택한 직업
+            region_codes(list) : 사용자가 선택한 지역 코드 리스트. 비어 있으면 모든 지역
+            sort(str) : 정렬 선택값
+
+        반환값 :
+            count(int) : 채용 공고 수
         '''
-        matched_jobs = pd.merge(self.jobs, self.jobs_to_worknet, on='id_jobs')
-        matched_positions = pd.merge(matched_jobs, self.worknet_positions, on='work_code')
-        final_matched_data = pd.merge(matched_positions, self.worknet_company, on='id_work_company')
-        return final_matched_data
+        query, params = self.build_postings_query(job_title, region_codes, sort)
+        conn = sqlite3.connect(self.db_path)
+        count = conn.execute(f'SELECT COUNT(*) FROM ({query})', params).fetchone()[0]
+        conn.close()
+        return count
+
+    def build_postings_query(self, job_title, region_codes, sort=None):
+        '''
+        채용 공고 조회용 SQL과 파라미터를 만듭니다.
+        추천순은 job_posting_ranks의 (id_jobs, rank) 기본키 범위를 읽고, 나머지는 (직업명, 지역 코드) 인덱스로 읽습니다.
+        지역을 고른 추천순은 상위 k개 밖의 공고도 보여야 하므로, 조건에 맞는 공고 전체를 worknet_position_scores의 점수로 정렬합니다.
+
+        반환값 :
+            query(str) : 파라미터화된 SQL
+            params(list) : SQL 파라미터
+        '''
+        if sort == self.recommended_sort and not region_codes:
+            query = '''SELECT f.* FROM job_posting_ranks r
+                JOIN job_postings_flat f ON f.id_work_positions = r.id_work_positions AND f.id_jobs = r.id_jobs
+                WHERE r.id_jobs = (SELECT id_jobs FROM jobs WHERE name_jobs = ? LIMIT 1)'''
+            order = 'r.rank'
+        elif sort == self.recommended_sort:
+            # 상위 k개 밖의 공고도 지역 조건에 맞을 수 있으므로, 조건에 맞는 전체를 저장된 공고 점수로 정렬
+            query = '''SELECT f.* FROM job_postings_flat f
+                JOIN worknet_position_scores s ON s.id_work_positions = f.id_work_positions
+                WHERE f.name_jobs = ?'''
+            order = 's.score DESC, f.id_work_positions'
+        else:
+            query = 'SELECT f.* FROM job_postings_flat f WHERE f.name_jobs = ?'
+            order = self.sort_orders.get(sort, 'f.rowid')
+        params = [job_title]
+        if region_codes:
+            query += f" AND f.region_code IN ({', '.join('?' * len(region_codes))})"
+            params += list(region_codes)
+        return f'{query} ORDER BY {order}', params
 
     def app_interface(self):
         '''
@@ -57,83 +179,33 @@ class JobMatcher:
         '''
         st.markdown('<h1 style = "color : #2ec4b6; font-size : 50px; text-align : left;">공고매칭</h1>', unsafe_allow_html=True)
 
-        # 분야 코드와 분야명을 매핑
-        field_name_mapping = {
-            '13': '음식+식품',
-            '21': '음식+식품',
-            '20': '정보통신',
-            '6': '보건',
-            '14': '건설',
-            '8': '문화',
-            # 추가적으로 매핑할 분야 코드가 있으면 여기에 추가
-        }
-
-        # ncs_code의 뒷 6자리를 제외한 나머지를 사용하여 분야명으로 변환
-        self.ncs_to_jobs['field_name'] = self.ncs_to_jobs['ncs_code'].apply(
-            lambda x: field_name_mapping.get(str(x)[:-6], '기타'))
-
         # 분야명 기반으로 selectbox 생성
-        field_names = [''] + sorted(self.ncs_to_jobs['field_name'].unique())
+        field_names = [''] + list(self.field_jobs)
         selected_field_name = st.selectbox("직업 분야를 선택해!", field_names)
 
-        # 선택된 분야명에 해당하는 직업을 필터링
+        # 선택된 분야명에 해당하는 직업 (미리 분야별로 묶어 둔 목록)
         if selected_field_name:
-            # 분야명으로부터 해당하는 분야 코드를 찾음
-            selected_field_codes = [code for code, name in field_name_mapping.items() if name == selected_field_name]
-            
-            # 필터링 로직을 분야 코드를 사용하여 진행
-            filtered_jobs_ids = self.ncs_to_jobs[self.ncs_to_jobs['field_name'] == selected_field_name]['id_jobs']
-            job_titles = self.jobs[self.jobs['id_jobs'].isin(filtered_jobs_ids)]['name_jobs'].unique()
+            job_titles = self.field_jobs[selected_field_name]
         else:
             job_titles = self.jobs['name_jobs'].unique()
 
         job_titles = [''] + list(job_titles)
         selected_job_title = st.selectbox("찾을 직업을 선택해!", job_titles)
 
-        # 지역 정보 변환을 위한 내부 함수
-        def convert_region(region):
-            region_mapping = {
-                '경기': '경기도', '경남': '경상남도', '경북': '경상북도',
-                '광주': '광주광역시', '대구': '대구광역시', '대전': '대전광역시',
-                '부산': '부산광역시', '서울': '서울특별시', '인천': '인천광역시',
-                '전북': '전라북도', '충남': '충청남도', '전북특별자치도':'전라북도',
-                '강원특별자치도':'강원도', '세종특별자치시':'서울특별시', '제주':'제주특별자치도', '서울특별시':'서울특별시',
-                '경기도' : '경기도', '전라남도' : '전라남도', '경상북도' : '경상북도' , '광주광역시' : '광주광역시', '울산광역시' : '울산광역시',
-                '대구광역시':'대구광역시','대전광역시':'대전광역시','인천광역시':'인천광역시','부산광역시':'부산광역시','강원도':'강원도',
-                '전라북도':'전라북도','경상남도':'경상남도'
-                
-            }
-            return region_mapping.get(region, None)
-        
-    # 지역 정보 추출 및 변환, 'Unknown' 제외
-        self.final_matched_data['region'] = self.final_matched_data['job_describ_2'].apply(
-            lambda x: convert_region(x.split(' ')[4]) if len(x.split(' ')) > 4 and x.split(' ')[2] == '~' 
-            else convert_region(x.split(' ')[2]) if len(x.split(' ')) > 2 else None
-        )
-
-        # 'None' 값(이전의 'Unknown') 제외하고 지역 목록 생성
-        regions = self.final_matched_data['region'].dropna().unique()
-        regions = list(sorted(regions))
-        selected_regions = st.multiselect("지역을 선택해!", options=regions)
-
-        # 멀티셀렉트를 통해 선택된 지역들에 대한 필터링 적용
-        filtered_data = self.final_matched_data[self.final_matched_data['name_jobs'] == selected_job_title]
-        if selected_regions:
-            filtered_data = filtered_data[filtered_data['region'].isin(selected_regions)]
+        selected_regions = st.multiselect("지역을 선택해!", options=self.regions, format_func=region_name)
+
+        # 선택된 직업과 지역에 해당하는 공고 중 현재 페이지만 인덱스로 조회
+        if selected_job_title:
+            pager = ResultPager('work_postings', self.page_size, [self.recommended_sort] + list(self.sort_orders))
+            sort = pager.sort()
+            offset = pager.offset((selected_job_title, tuple(selected_regions), sort))
+            filtered_data = self.find_postings(selected_job_title, selected_regions, pager.page_size, offset, sort)
+        else:
+            filtered_data = pd.DataFrame()
 
         if selected_job_title and not filtered_data.empty:
-            for _, row in filtered_data.iterrows():
-                st.markdown(f"""
-                <div style="background-color:#cbf3f0;padding:20px;border-radius:10px;margin-bottom:10px;">
-                    <h4 style="color:#333;">{row['recruit']}</h4>
-                    <p>회사명: <strong>{row['work_company']}</strong></p>
-                    <p>{row['job_describ_1']}</p>
-                    <p>{row['job_describ_2']}</p>
-                    <p>{row['condition']}</p>
-                    <p>{row['date']}</p>
-                    <a href="{row['link']}" target="_blank">More Info</a>
-                </div>
-                """, unsafe_allow_html=True)
+            pager.render(filtered_data, self.posting_card_template)
+            pager.controls(self.count_postings(selected_job_title, selected_regions, sort))
         else:
             st.write("아쉽지만 알맞은 공고가 없어..")
 